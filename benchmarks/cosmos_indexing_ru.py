@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""
+Cosmos DB 인덱싱 정책 RU 벤치마크
+
+기본 정책(모든 경로 인덱싱)과 관리형 정책(INDEXING_POLICY)을 적용한 임시 컨테이너에
+같은 스냅샷 문서를 쓰고 조회하여 쓰기/쿼리당 RU를 비교합니다.
+
+사용법:
+    python benchmarks/cosmos_indexing_ru.py [문서 수]
+"""
+import statistics
+import sys
+import uuid
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from azure.cosmos import CosmosClient, PartitionKey
+from azure.cosmos.container import ContainerProxy
+from azure.identity import DefaultAzureCredential
+
+from src.config import get_settings
+from src.services.cosmos_service import INDEXING_POLICY, CosmosDBService
+
+SYMBOLS = ["SPY", "QQQ", "DIA", "IWM", "VTI", "VOO", "ARKK", "SCHD"]
+
+PAGE_SIZE = 50
+
+
+def latest_data_parameters(symbol: str) -> List[Dict[str, Any]]:
+    """get_latest_data(symbol, "etf") 쿼리 파라미터"""
+    return [{"name": "@symbol", "value": symbol}, {"name": "@type", "value": "etf"}]
+
+
+def make_snapshot(symbol: str) -> Dict[str, Any]:
+    """holdings/description을 포함한 실제 크기의 ETF 스냅샷"""
+    now = datetime.now(timezone.utc)
+    return {
+        "id": f"etf_{symbol}_{uuid.uuid4()}",
+        "symbol": symbol,
+        "type": "etf",
+        "data": {
+            "profile": {"name": f"{symbol} ETF", "description": "lorem ipsum " * 200},
+            "quote": {"c": 100.0, "h": 101.0, "l": 99.0, "o": 100.0, "pc": 99.5},
+            "holdings": {
+                "symbol": symbol,
+                "holdings": [
+                    {"Holder": f"Holder {i}", "Shares": i * 1000, "pctHeld": i / 100}
+                    for i in range(50)
+                ],
+            },
+        },
+        "timestamp": now.isoformat(),
+        "_ts": int(now.timestamp()),
+    }
+
+
+def request_charge(container: ContainerProxy) -> float:
+    """직전 요청의 RU"""
+    headers = container.client_connection.last_response_headers
+    return float(headers.get("x-ms-request-charge", 0))
+
+
+def run(container: ContainerProxy, documents: List[Dict[str, Any]]) -> Dict[str, float]:
+    """쓰기 및 쿼리 RU 측정"""
+    write_charges = []
+    for document in documents:
+        container.create_item(body=document)
+        write_charges.append(request_charge(container))
+    
+    results = {"write (avg RU)": statistics.mean(write_charges)}
+    results["get_latest_data (RU)"] = query_charge(
+        container, CosmosDBService.LATEST_DATA_QUERY, latest_data_parameters("SPY")
+    )
+    
+    # get_all_etfs 첫 페이지: 심볼 DISTINCT 쿼리 + 심볼별 최신 문서 TOP 1 쿼리 (cosmos_service와 같은 쿼리)
+    symbols: List[str] = []
+    total = query_charge(
+        container, CosmosDBService.ETF_SYMBOLS_QUERY, [{"name": "@after", "value": ""}],
+        max_item_count=PAGE_SIZE + 1, limit=PAGE_SIZE + 1, collect=symbols
+    )
+    for symbol in symbols[:PAGE_SIZE]:
+        total += query_charge(container, CosmosDBService.LATEST_DATA_QUERY, latest_data_parameters(symbol))
+    results["get_all_etfs (RU)"] = total
+    return results
+
+
+def query_charge(
+    container: ContainerProxy,
+    query: str,
+    parameters: List[Dict[str, Any]],
+    max_item_count: Optional[int] = None,
+    limit: Optional[int] = None,
+    collect: Optional[List[Any]] = None,
+) -> float:
+    """쿼리 RU 합계 (limit개를 읽으면 다음 페이지를 요청하지 않음, collect에 결과 누적)"""
+    pages = container.query_items(
+        query=query,
+        parameters=parameters,
+        enable_cross_partition_query=True,
+        max_item_count=max_item_count
+    ).by_page()
+    items: List[Any] = []
+    total = 0.0
+    for page in pages:
+        items.extend(page)
+        total += request_charge(container)
+        if limit is not None and len(items) >= limit:
+            break
+    if collect is not None:
+        collect.extend(items)
+    return total
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 40
+    settings = get_settings()
+    if not settings.cosmos_endpoint:
+        print("COSMOS_ENDPOINT가 설정되지 않았습니다.")
+        sys.exit(1)
+    
+    client = CosmosClient(settings.cosmos_endpoint, DefaultAzureCredential())
+    database = client.create_database_if_not_exists(id=settings.cosmos_database_name)
+    documents = [make_snapshot(SYMBOLS[i % len(SYMBOLS)]) for i in range(count)]
+    
+    results = {}
+    for label, policy in (("default", None), ("managed", INDEXING_POLICY)):
+        container_id = f"ru-bench-{label}-{uuid.uuid4().hex[:8]}"
+        options: Dict[str, Any] = {"indexing_policy": policy} if policy else {}
+        container = database.create_container(
+            id=container_id,
+            partition_key=PartitionKey(path="/symbol"),
+            **options
+        )
+        try:
+            results[label] = run(container, [dict(doc) for doc in documents])
+        finally:
+            database.delete_container(container_id)
+    
+    print("=" * 60)
+    print(f"Cosmos DB 인덱싱 정책 RU 비교 (문서 {count}개)")
+    print("=" * 60)
+    print(f"{'metric':<28}{'default':>10}{'managed':>10}{'diff':>10}")
+    for metric in results["default"]:
+        before = results["default"][metric]
+        after = results["managed"][metric]
+        diff = (after - before) / before * 100 if before else 0
+        print(f"{metric:<28}{before:>10.2f}{after:>10.2f}{diff:>9.1f}%")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Container App 로그 녹화
+
+az containerapp logs show --follow 출력을 지정한 시간 동안 받아 tests/fixtures/container_logs.jsonl.gz 로 저장합니다.
+녹화 파일은 커밋하지 않으며(.gitignore), 있으면 로그 파서 벤치마크(tests/benchmarks/test_log_parser_benchmarks.py)가
+합성 로그 대신 사용합니다.
+--synthetic N 이면 az 없이 같은 형식(az 봉투 + uvicorn 접근 로그 + 미들웨어 ⚡ 로그 + 일반 앱 로그)의 N줄을 생성합니다
+(벤치마크 기본 입력과 같은 synthesize).
+
+사용법:
+    python benchmarks/record_container_logs.py [--seconds 600]
+    python benchmarks/record_container_logs.py --synthetic 50000
+"""
+import argparse
+import gzip
+import json
+import os
+import random
+import subprocess
+import time
+from pathlib import Path
+
+OUTPUT = Path(__file__).parent.parent / "tests" / "fixtures" / "container_logs.jsonl.gz"
+
+ROUTES = [
+    ("GET", "/api/v1/stocks/{}", ["AAPL", "MSFT", "NVDA", "TSLA", "005930.KS", "SPY", "QQQ"]),
+    ("GET", "/api/v1/etf/list", None),
+    ("GET", "/api/v1/news/market", None),
+    ("GET", "/api/v1/news/search?q={}", ["fed", "nvidia", "oil", "earnings"]),
+    ("POST", "/api/v1/chat/", None),
+    ("GET", "/health", None),
+]
+APP_MESSAGES = [
+    "src.services.yfinance_service - INFO - 📈 Fetched quote for {}",
+    "src.services.rss_news_service - INFO - 📰 Parsed 20 items from reuters_business",
+    "src.observability.middleware - INFO - 📊 Query params: q={}",
+    "httpx - INFO - HTTP Request: GET https://query1.finance.yahoo.com/v8/finance/chart/{} \"HTTP/1.1 200 OK\"",
+    "azure.core.pipeline.policies.http_logging_policy - INFO - Response status: 200",
+]
+
+
+def _envelope(at: float, log: str) -> str:
+    stamp = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(at)) + f".{int(at % 1 * 10_000_000):07d}+00:00"
+    return json.dumps({"TimeStamp": stamp, "Log": f"F {log}"}, ensure_ascii=False)
+
+
+def synthesize(lines: int, seed: int = 42) -> list:
+    """요청마다 ⚡ 로그와 uvicorn 접근 로그, 사이사이 일반 앱 로그가 섞인 az 출력"""
+    rng = random.Random(seed)
+    at = 1_735_689_600.0  # 2025-01-01T00:00:00Z
+    output = []
+    while len(output) < lines:
+        at += rng.expovariate(200)
+        if rng.random() < 0.3:
+            asctime = time.strftime("%Y-%m-%d %H:%M:%S", time.gmtime(at)) + f",{int(at % 1 * 1000):03d}"
+            message = rng.choice(APP_MESSAGES).format(rng.choice(["AAPL", "fed", "NVDA"]))
+            output.append(_envelope(at, f"{asctime} - {message}"))
+            continue
+
+        method, template, values = rng.choice(ROUTES)
+        path = template.format(rng.choice(values)) if values else template
+        status = rng.choices([200, 201, 304, 404, 422, 500], weights=[88, 3, 3, 3, 2, 1])[0]
+        duration = round(rng.lognormvariate(3.5, 0.9), 2)
+        done = at + duration / 1000
+        asctime = time.strftime("%Y-%m-%d %H:%M:%S", time.gmtime(done)) + f",{int(done % 1 * 1000):03d}"
+        output.append(_envelope(done, (
+            f"{asctime} - src.observability.middleware - INFO - "
+            f"⚡ {method} {path.split('?')[0]} | Status: {status} | Duration: {duration}ms"
+        )))
+        client = f"100.100.{rng.randint(0, 255)}.{rng.randint(1, 254)}:{rng.randint(30000, 65000)}"
+        output.append(_envelope(done, f'INFO:     {client} - "{method} {path} HTTP/1.1" {status} OK'))
+    return output[:lines]
+
+
+def record(seconds: int) -> list:
+    cmd = [
+        "az", "containerapp", "logs", "show",
+        "--name", os.getenv("CONTAINER_APP_NAME", "ca-sk-appinsights"),
+        "--resource-group", os.getenv("RESOURCE_GROUP", "rg-sk-appinsights"),
+        "--follow", "--format", "json",
+    ]
+    output = []
+    process = subprocess.Popen(cmd, stdout=subprocess.PIPE, text=True, encoding="utf-8")
+    deadline = time.monotonic() + seconds
+    try:
+        for line in process.stdout:
+            output.append(line.rstrip("\n"))
+            if time.monotonic() >= deadline:
+                break
+    finally:
+        process.terminate()
+    return output
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--seconds", type=int, default=600, help="녹화 시간 (초)")
+    parser.add_argument("--synthetic", type=int, default=0, help="az 없이 생성할 줄 수")
+    args = parser.parse_args()
+
+    lines = synthesize(args.synthetic) if args.synthetic else record(args.seconds)
+    if not lines:
+        print("✗ 저장할 로그가 없습니다")
+        return
+    OUTPUT.parent.mkdir(parents=True, exist_ok=True)
+    with gzip.open(OUTPUT, "wt", encoding="utf-8") as f:
+        f.write("\n".join(lines) + "\n")
+    print(f"✓ {len(lines):,}줄 → {OUTPUT} ({OUTPUT.stat().st_size:,} bytes)")
+
+
+if __name__ == "__main__":
+    main()
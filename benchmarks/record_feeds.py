@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+"""
+RSS 피드 녹화
+
+RSSNewsService.RSS_FEEDS의 실제 피드를 받아 tests/fixtures/feeds/<소스>.xml 로 저장합니다.
+저장소의 피드는 합성 데이터이며, 이 스크립트로 교체하면 로컬 피드 서버(tests/feed_server.py)와
+뉴스 벤치마크(tests/benchmarks)가 녹화한 피드를 사용합니다 (tests/fixtures/README.md 갱신).
+
+사용법:
+    python benchmarks/record_feeds.py [소스 ...]
+"""
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import feedparser
+import httpx
+
+from src.services.rss_news_service import RSSNewsService
+
+FEEDS_DIR = Path(__file__).parent.parent / "tests" / "fixtures" / "feeds"
+
+
+def main():
+    sources = sys.argv[1:] or list(RSSNewsService.RSS_FEEDS)
+    FEEDS_DIR.mkdir(parents=True, exist_ok=True)
+
+    with httpx.Client(headers=RSSNewsService.HEADERS, follow_redirects=True, timeout=15) as client:
+        for source in sources:
+            url = RSSNewsService.RSS_FEEDS[source]
+            try:
+                response = client.get(url)
+                response.raise_for_status()
+            except httpx.HTTPError as e:
+                print(f"✗ {source}: {type(e).__name__} {e}")
+                continue
+
+            entries = len(feedparser.parse(response.content).entries)
+            if not entries:
+                print(f"✗ {source}: 항목이 없어 저장하지 않음")
+                continue
+            (FEEDS_DIR / f"{source}.xml").write_bytes(response.content)
+            print(f"✓ {source}: {entries}개 항목, {len(response.content):,} bytes")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+RSS 항목 정규화 마이크로 벤치마크
+
+HTML 요약이 포함된 대용량 합성 피드를 feedparser로 한 번 파싱한 뒤,
+기존 인라인 방식(hasattr/str + 루프 내 re.sub + 매번 md5)과 EntryNormalizer의
+첫 수집(cold) / 재수집(warm, 캐시 적중) 처리 시간을 비교합니다.
+
+사용법:
+    python benchmarks/rss_normalize.py [항목 수] [반복 수]
+"""
+import hashlib
+import statistics
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+from time import mktime
+from typing import Any, Callable, Dict, List
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import feedparser
+
+from src.services.rss_entry_normalizer import EntryNormalizer
+
+SOURCE = "bench"
+
+
+def make_feed(count: int) -> bytes:
+    """HTML/엔티티가 섞인 요약을 가진 RSS 2.0 피드"""
+    items = []
+    for i in range(count):
+        summary = (
+            f"&lt;p&gt;Shares of &lt;b&gt;ACME {i}&lt;/b&gt; rose 3% &amp;amp; analysts "
+            f"&lt;a href=&quot;https://example.com/{i}&quot;&gt;upgraded&lt;/a&gt; the stock."
+            f"&lt;/p&gt;&lt;img src=&quot;https://example.com/{i}.png&quot; /&gt;" * 3
+        )
+        items.append(
+            f"<item><title>ACME &amp; Co. posts record quarter #{i}</title>"
+            f"<link>https://example.com/news/{i}</link>"
+            f"<pubDate>Mon, 19 Oct 2026 10:{i % 60:02d}:00 GMT</pubDate>"
+            f"<description>{summary}</description></item>"
+        )
+    return (
+        '<?xml version="1.0"?><rss version="2.0"><channel><title>bench</title>'
+        + "".join(items)
+        + "</channel></rss>"
+    ).encode("utf-8")
+
+
+def legacy_normalize(entry: Any, source: str) -> Dict[str, Any]:
+    """정규화 단계 도입 전 _parse_feed 루프 본문"""
+    published_time = None
+    if hasattr(entry, 'published_parsed') and entry.published_parsed:
+        published_time = int(mktime(entry.published_parsed))
+    else:
+        published_time = int(datetime.now().timestamp())
+
+    image_url = ""
+    if hasattr(entry, 'media_content') and entry.media_content:
+        image_url = str(entry.media_content[0].get('url', ''))
+
+    summary = ""
+    if hasattr(entry, 'summary'):
+        summary = str(entry.summary)
+    elif hasattr(entry, 'description'):
+        summary = str(entry.description)
+    if summary:
+        import re
+        summary = re.sub('<[^<]+?>', '', summary)
+        summary = summary.strip()[:500]
+
+    link_str = str(entry.link) if hasattr(entry, 'link') else ""
+    return {
+        "category": "market",
+        "datetime": published_time,
+        "headline": str(entry.title) if hasattr(entry, 'title') else "",
+        "id": hashlib.md5(link_str.encode('utf-8')).hexdigest(),
+        "image": image_url,
+        "related": source,
+        "source": source,
+        "summary": summary,
+        "url": link_str,
+    }
+
+
+def measure(fn: Callable[[], None], repeat: int) -> List[float]:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    repeat = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+    entries = feedparser.parse(make_feed(count)).entries
+
+    def run_legacy():
+        for entry in entries:
+            legacy_normalize(entry, SOURCE)
+
+    def run_cold():
+        normalizer = EntryNormalizer(capacity=count)
+        for entry in entries:
+            normalizer.normalize(entry, SOURCE)
+
+    warm = EntryNormalizer(capacity=count)
+    for entry in entries:
+        warm.normalize(entry, SOURCE)
+
+    def run_warm():
+        for entry in entries:
+            warm.normalize(entry, SOURCE)
+
+    results = {
+        "legacy": measure(run_legacy, repeat),
+        "normalizer (cold)": measure(run_cold, repeat),
+        "normalizer (warm)": measure(run_warm, repeat),
+    }
+
+    print("=" * 60)
+    print(f"RSS 항목 정규화 ({count}개 x {repeat}회, 중앙값)")
+    print("=" * 60)
+    baseline = statistics.median(results["legacy"])
+    print(f"{'mode':<22}{'ms':>10}{'items/s':>14}{'speedup':>10}")
+    for label, timings in results.items():
+        median = statistics.median(timings)
+        print(f"{label:<22}{median * 1000:>10.2f}{count / median:>14,.0f}{baseline / median:>9.1f}x")
+
+    sample = entries[0]
+    print()
+    print("legacy summary:    ", legacy_normalize(sample, SOURCE)["summary"][:100])
+    print("normalized summary:", warm.normalize(sample, SOURCE)["summary"][:100])
+
+
+if __name__ == "__main__":
+    main()
@@ -72,7 +72,7 @@ const Dashboard: React.FC = () => {
 
       // 시장 뉴스 조회 - timeout 5초
       const newsResponse = await Promise.race([
-        newsApi.getMarket("general", 5),
+        newsApi.getMarket(5),
         new Promise((_, reject) =>
           setTimeout(() => reject(new Error("Timeout")), 5000)
         ),
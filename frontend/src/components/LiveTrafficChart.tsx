@@ -106,6 +106,33 @@ const LiveTrafficChart: React.FC = () => {
       ws.onopen = () => {
         console.log("✅ WebSocket 연결 성공!");
         setIsConnected(true);
+        // 개별 요청 이벤트를 1초당 1개 배치 메시지로 수신 (서버 샘플링 기본값 사용)
+        ws.send(JSON.stringify({ type: "subscribe", batch: true }));
+      };
+
+      const toScatterPoint = (reqData: RequestEvent): ScatterDataPoint => {
+        const timestamp = parseServerTimestamp(reqData.timestamp);
+        return {
+          time: timestamp.getTime(),
+          timeStr: timestamp.toLocaleTimeString("ko-KR", {
+            hour: "2-digit",
+            minute: "2-digit",
+            second: "2-digit",
+          }),
+          duration: reqData.duration,
+          url: reqData.path,
+          statusCode: reqData.status_code,
+        };
+      };
+
+      const appendScatterPoints = (points: ScatterDataPoint[]) => {
+        setScatterData((prevData) => {
+          // 최근 2분(120초) 데이터만 유지
+          const twoMinutesAgo = Date.now() - 120000;
+          return [...prevData, ...points].filter(
+            (item) => item.time >= twoMinutesAgo
+          );
+        });
       };
 
       ws.onmessage = (event) => {
@@ -117,37 +144,16 @@ const LiveTrafficChart: React.FC = () => {
           // 개별 요청 이벤트
           if (message.type === "new_request") {
             const reqData: RequestEvent = message.data;
-            //console.log("🆕 새로운 요청 데이터:", reqData);
             setLatestRequest(reqData);
-
-            // 분산형 차트 데이터 추가
-            const timestamp = parseServerTimestamp(reqData.timestamp);
-            const timeStr = timestamp.toLocaleTimeString("ko-KR", {
-              hour: "2-digit",
-              minute: "2-digit",
-              second: "2-digit",
-            });
-
-            const newPoint = {
-              time: timestamp.getTime(),
-              timeStr: timeStr,
-              duration: reqData.duration,
-              url: reqData.path,
-              statusCode: reqData.status_code,
-            };
-            console.log("📊 차트에 추가할 포인트:", newPoint);
-
-            setScatterData((prevData) => {
-              const newData = [...prevData, newPoint];
-
-              // 최근 2분(120초) 데이터만 유지
-              const twoMinutesAgo = Date.now() - 120000;
-              const filtered = newData.filter(
-                (item) => item.time >= twoMinutesAgo
-              );
-              //console.log("✅ 필터링 후 데이터 개수:", filtered.length);
-              return filtered;
-            });
+            appendScatterPoints([toScatterPoint(reqData)]);
+          }
+          // 샘플링된 개별 요청 배치 (subscribe batch: true)
+          else if (message.type === "new_request_batch") {
+            const requests: RequestEvent[] = message.data.requests;
+            if (requests.length > 0) {
+              setLatestRequest(requests[requests.length - 1]);
+              appendScatterPoints(requests.map(toScatterPoint));
+            }
           }
           // 집계 메트릭
           else if (message.type === "traffic_update") {
@@ -38,7 +38,6 @@ const NewsFeed: React.FC = () => {
   const [news, setNews] = useState<NewsItem[]>([]);
   const [loading, setLoading] = useState(true);
   const [newsType, setNewsType] = useState<"market" | "global">("global");
-  const [category, setCategory] = useState("general");
   const [sources, setSources] = useState("all");
   const theme = useTheme();
   const isMobile = useMediaQuery(theme.breakpoints.down("sm"));
@@ -49,7 +48,7 @@ const NewsFeed: React.FC = () => {
       try {
         let response;
         if (newsType === "market") {
-          response = await newsApi.getMarket(category, 50);
+          response = await newsApi.getMarket(50);
         } else {
           response = await newsApi.getGlobal(sources, 50);
         }
@@ -61,7 +60,7 @@ const NewsFeed: React.FC = () => {
       }
     };
     fetchNews();
-  }, [newsType, category, sources]);
+  }, [newsType, sources]);
 
   const handleNewsTypeChange = (
     _event: React.MouseEvent<HTMLElement>,
@@ -72,10 +71,6 @@ const NewsFeed: React.FC = () => {
     }
   };
 
-  const handleCategoryChange = (event: SelectChangeEvent) => {
-    setCategory(event.target.value);
-  };
-
   const handleSourceChange = (event: SelectChangeEvent) => {
     setSources(event.target.value);
   };
@@ -128,21 +123,7 @@ const NewsFeed: React.FC = () => {
             </ToggleButton>
           </ToggleButtonGroup>
 
-          {newsType === "market" ? (
-            <FormControl sx={{ minWidth: { xs: "100%", sm: 150 } }} size={isMobile ? "small" : "medium"}>
-              <InputLabel>카테고리</InputLabel>
-              <Select
-                value={category}
-                onChange={handleCategoryChange}
-                label="카테고리"
-              >
-                <MenuItem value="general">일반</MenuItem>
-                <MenuItem value="forex">외환</MenuItem>
-                <MenuItem value="crypto">암호화폐</MenuItem>
-                <MenuItem value="merger">인수합병</MenuItem>
-              </Select>
-            </FormControl>
-          ) : (
+          {newsType === "global" && (
             <FormControl sx={{ minWidth: { xs: "100%", sm: 200 } }} size={isMobile ? "small" : "medium"}>
               <InputLabel>소스</InputLabel>
               <Select
@@ -111,8 +111,8 @@ export const stocksApi = {
 
 // News API
 export const newsApi = {
-  getMarket: (category: string = "general", limit: number = 20) =>
-    api.get(withPrefix(`/news/market?category=${category}&limit=${limit}`)),
+  getMarket: (limit: number = 20) =>
+    api.get(withPrefix(`/news/market?limit=${limit}`)),
   getGlobal: (sources: string = "all", limit: number = 30) =>
     api.get(withPrefix(`/news/global?sources=${sources}&limit=${limit}`)),
   search: (query: string, sources: string = "all", limit: number = 20) =>
@@ -5,7 +5,7 @@ from typing import Annotated
 
 from semantic_kernel.functions import kernel_function
 
-from ..services import get_cosmos_service, get_yfinance_client
+from ..services import get_storage_service, get_yfinance_client
 
 
 class StockAnalysisPlugin:
@@ -131,8 +131,8 @@ class StockAnalysisPlugin:
     )
     def get_saved_etfs(self) -> str:
         """저장된 ETF 목록 조회"""
-        cosmos = get_cosmos_service()
-        etfs = cosmos.get_all_etfs(limit=10)
+        storage = get_storage_service()
+        etfs = storage.get_all_etfs(limit=10)
         
         if not etfs:
             return "저장된 ETF가 없습니다."
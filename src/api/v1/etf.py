@@ -1,13 +1,13 @@
 """
 API 라우터 - ETF 관련 엔드포인트 (v1)
 """
-from datetime import datetime, timezone
-from typing import Any, Dict, List
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional
 
-from fastapi import APIRouter, HTTPException, Query
+from fastapi import APIRouter, HTTPException, Query, Response
 
 from src.observability.utils import trace_span
-from src.services import get_cosmos_service, get_yfinance_client
+from src.services import get_storage_service, get_yfinance_client
 
 router = APIRouter(prefix="/api/v1/etf", tags=["ETF"])
 
@@ -15,11 +15,24 @@ router = APIRouter(prefix="/api/v1/etf", tags=["ETF"])
 @router.get("/list")
 @trace_span(name="api.v1.etf.list_etfs", attributes={"endpoint": "/api/v1/etf/list"})
 async def list_etfs(
-    limit: int = Query(default=20, ge=1, le=100)
+    response: Response,
+    limit: int = Query(default=20, ge=1, le=100),
+    cursor: Optional[str] = Query(default=None, description="이전 응답의 X-Next-Cursor 헤더 값")
 ) -> List[Dict[str, Any]]:
-    """저장된 ETF 목록 조회"""
-    cosmos = get_cosmos_service()
-    return cosmos.get_all_etfs(limit=limit)
+    """
+    저장된 ETF 목록 조회 (심볼순 페이지 단위, 심볼별 최신 데이터)
+    
+    다음 페이지가 있으면 X-Next-Cursor 응답 헤더로 cursor를 반환합니다.
+    """
+    storage = get_storage_service()
+    try:
+        etfs, next_cursor = storage.get_etfs_page(limit=limit, cursor=cursor)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    
+    if next_cursor:
+        response.headers["X-Next-Cursor"] = next_cursor
+    return etfs
 
 
 @router.get("/{symbol}")
@@ -36,15 +49,15 @@ async def get_etf_detail(symbol: str) -> Dict[str, Any]:
     if not profile and not quote:
         raise HTTPException(status_code=404, detail=f"ETF {symbol} not found")
     
-    # Cosmos DB에 저장
-    cosmos = get_cosmos_service()
+    # 저장소에 저장
+    storage = get_storage_service()
     etf_data = {
         "profile": profile,
         "quote": quote,
         "holdings": holdings,
         "updated_at": datetime.now(timezone.utc).isoformat()
     }
-    cosmos.save_etf_data(symbol.upper(), etf_data)
+    storage.save_etf_data(symbol.upper(), etf_data)
     
     return {
         "symbol": symbol.upper(),
@@ -69,11 +82,34 @@ async def get_etf_holdings(symbol: str) -> Dict[str, Any]:
     return holdings
 
 
+@router.get("/{symbol}/history")
+async def get_etf_history(
+    symbol: str,
+    granularity: str = Query(default="hour", regex="^(hour|day)$"),
+    days: int = Query(default=7, ge=1, le=365)
+) -> Dict[str, Any]:
+    """ETF 시세 이력 조회 (시간/일 단위 요약)"""
+    storage = get_storage_service()
+    end = datetime.now(timezone.utc)
+    start = end - timedelta(days=days)
+    
+    summaries = storage.get_summaries(
+        symbol.upper(), "etf", granularity,
+        int(start.timestamp()), int(end.timestamp())
+    )
+    
+    return {
+        "symbol": symbol.upper(),
+        "granularity": granularity,
+        "history": summaries
+    }
+
+
 @router.post("/{symbol}/refresh")
 async def refresh_etf_data(symbol: str) -> Dict[str, Any]:
     """ETF 데이터 새로고침 및 저장"""
     yfinance = get_yfinance_client()
-    cosmos = get_cosmos_service()
+    storage = get_storage_service()
     
     profile = yfinance.get_etf_profile(symbol.upper())
     quote = yfinance.get_quote(symbol.upper())
@@ -86,7 +122,7 @@ async def refresh_etf_data(symbol: str) -> Dict[str, Any]:
         "updated_at": datetime.now(timezone.utc).isoformat()
     }
     
-    success = cosmos.save_etf_data(symbol.upper(), etf_data)
+    success = storage.save_etf_data(symbol.upper(), etf_data)
     
     if not success:
         raise HTTPException(status_code=500, detail="Failed to save ETF data")
@@ -100,9 +136,9 @@ async def refresh_etf_data(symbol: str) -> Dict[str, Any]:
 @router.delete("/{symbol}")
 async def delete_etf(symbol: str) -> Dict[str, Any]:
     """ETF 데이터 삭제"""
-    cosmos = get_cosmos_service()
+    storage = get_storage_service()
     
-    success = cosmos.delete_etf_data(symbol.upper())
+    success = storage.delete_etf_data(symbol.upper())
     
     if not success:
         raise HTTPException(
@@ -5,15 +5,22 @@ Live Metrics API Router (v1)
 import asyncio
 import json
 import logging
-import re
+import os
+import socket
+import time
 from collections import deque
-from datetime import datetime, timedelta
-from typing import Any, Dict, List
+from datetime import datetime
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
 
-from fastapi import APIRouter, WebSocket, WebSocketDisconnect
+from fastapi import APIRouter, HTTPException, WebSocket, WebSocketDisconnect
 from pydantic import BaseModel
 
 from src.config import get_settings
+from src.observability.backplane import MetricsBackplane, create_backplane
+from src.observability.container_log_parser import SOURCE_ACCESS, SOURCE_APP, parse_log_line
+from src.observability.metrics_history import RESOLUTIONS, MetricsHistory
+from src.observability.request_sampler import RequestSampler, SamplingPolicy
+from src.observability.traffic_window import TrafficBucket, TrafficWindow
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/api/v1/live-metrics", tags=["live-metrics"])
@@ -21,23 +28,205 @@ router = APIRouter(prefix="/api/v1/live-metrics", tags=["live-metrics"])
 settings = get_settings()
 
 
+class WindowMetrics(BaseModel):
+    """슬라이딩 윈도우 통계"""
+    request_count: int
+    avg_duration: float
+    max_duration: float
+    error_count: int
+    success_rate: float
+    rps: float
+    status_classes: Dict[str, int] = {}
+    p50: Optional[float] = None
+    p95: Optional[float] = None
+    p99: Optional[float] = None
+
+
+class RouteMetrics(BaseModel):
+    """라우트별 요청 수/오류/상태 코드 클래스/지연 분위수"""
+    request_count: int
+    error_count: int = 0
+    avg_duration: float = 0
+    status_classes: Dict[str, int] = {}
+    p50: Optional[float] = None
+    p95: Optional[float] = None
+    p99: Optional[float] = None
+
+
 class MetricData(BaseModel):
-    """메트릭 데이터"""
+    """메트릭 데이터 (최상위 값은 최근 1분 슬라이딩 윈도우)"""
     timestamp: str
     request_count: int
     avg_duration: float
     error_count: int
     success_rate: float
+    status_classes: Dict[str, int] = {}
+    p50: Optional[float] = None
+    p95: Optional[float] = None
+    p99: Optional[float] = None
+    windows: Dict[str, WindowMetrics] = {}
+    routes: Dict[str, RouteMetrics] = {}
+
+
+# 느린 클라이언트 처리 정책 (송신 큐가 가득 찼을 때)
+DROP_OLDEST = "drop_oldest"  # 가장 오래된 메시지 버림
+COALESCE = "coalesce"        # traffic_update는 최신 1개만 유지 (대체 시 전체 라우트 스냅샷), 가득 차면 오래된 new_request 버림
+DISCONNECT = "disconnect"    # 연결 종료 (클라이언트 재연결)
+DROP_POLICIES = (DROP_OLDEST, COALESCE, DISCONNECT)
+
+# 연결 직후 보내는 전체 라우트 스냅샷 (정책과 무관하게 버리지 않고 더 최신 스냅샷으로만 대체)
+KEYFRAME_TYPE = "route_snapshot"
+
+# 집계 대기 요청 로그 상한 (이벤트 루프가 멈춰 drain되지 않을 때의 안전장치, 초과 시 오래된 것부터 버림)
+PENDING_LOG_LIMIT = 100_000
+
+# traffic_update.routes 압축 행의 필드 순서
+ROUTE_FIELDS = ("request_count", "error_count", "avg_duration", "p50", "p95", "p99",
+                "2xx", "3xx", "4xx", "5xx")
+
+
+def _route_row(stats: Dict[str, Any]) -> List[Any]:
+    """라우트 통계 -> ROUTE_FIELDS 순서의 배열 (소수점 1자리)"""
+    row: List[Any] = [stats["request_count"], stats["error_count"], round(stats["avg_duration"], 1)]
+    row.extend(None if stats[key] is None else round(stats[key], 1) for key in ("p50", "p95", "p99"))
+    row.extend(stats["status_classes"].get(status, 0) for status in ROUTE_FIELDS[6:])
+    return row
+
+
+class ClientConnection:
+    """
+    WebSocket 연결별 송신 큐 + writer 태스크
+    
+    브로드캐스트는 큐에 넣기만 하고 실제 전송은 연결별 writer가 수행하므로
+    느린 클라이언트가 다른 클라이언트나 집계 루프를 지연시키지 않습니다.
+    """
+    
+    def __init__(self, websocket: WebSocket, max_queue: int, policy: str, send_timeout: float,
+                 sampling: SamplingPolicy = SamplingPolicy(),
+                 on_close: Optional[Callable[[], None]] = None):
+        self.websocket = websocket
+        self.max_queue = max_queue
+        self.policy = policy if policy in DROP_POLICIES else COALESCE
+        self.send_timeout = send_timeout
+        self.sampling = sampling  # new_request 샘플링/배치 정책 (subscribe 메시지로 변경)
+        self.on_close = on_close  # 전송 실패로 스스로 종료될 때 호출 (관리자에서 연결 제거)
+        self.queue: Deque[Tuple[str, str]] = deque()  # (메시지 타입, 직렬화된 JSON)
+        self.dropped = 0
+        self.closed = False
+        self._wakeup = asyncio.Event()
+        self._writer = asyncio.create_task(self._write_loop())
+    
+    def offer(self, message_type: str, text: str, keyframe: Optional[Callable[[], str]] = None) -> bool:
+        """
+        메시지 적재 (블로킹 없음)
+        
+        Args:
+            keyframe: coalesce로 대기 중인 traffic_update를 대체할 때 text 대신 보낼 메시지
+                (라우트 델타는 앞선 델타가 전송됐다는 가정이므로 전체 라우트 스냅샷 버전)
+        
+        Returns:
+            False면 느린 소비자로 판단되어 연결을 끊어야 함 (DISCONNECT 정책)
+        """
+        if self.closed:
+            return False
+        
+        if self.policy == COALESCE and message_type == "traffic_update":
+            # 대기 중인 이전 traffic_update는 최신 값으로 대체
+            for index, (queued_type, _) in enumerate(self.queue):
+                if queued_type == "traffic_update":
+                    del self.queue[index]
+                    self.dropped += 1
+                    if keyframe is not None:
+                        text = keyframe()
+                    break
+        elif message_type == KEYFRAME_TYPE:
+            # 대기 중인 이전 라우트 스냅샷은 더 최신 스냅샷으로 대체
+            for index, (queued_type, _) in enumerate(self.queue):
+                if queued_type == KEYFRAME_TYPE:
+                    del self.queue[index]
+                    self.dropped += 1
+                    break
+        
+        if len(self.queue) >= self.max_queue:
+            if self.policy == DISCONNECT:
+                return False
+            if not self._drop_one():
+                # 대기 중인 메시지가 라우트 스냅샷뿐이면 새 메시지를 버림
+                self.dropped += 1
+                return True
+        
+        self.queue.append((message_type, text))
+        self._wakeup.set()
+        return True
+    
+    def _drop_one(self) -> bool:
+        """
+        큐 초과 시 대기 메시지 하나 제거 (COALESCE는 traffic_update 외 메시지 우선, 그 외는 가장 오래된 것)
+        
+        라우트 스냅샷(KEYFRAME_TYPE)은 이후 델타의 적용 기준이므로 제거하지 않습니다.
+        
+        Returns:
+            제거할 메시지가 없으면 False
+        """
+        victim = None
+        for index, (queued_type, _) in enumerate(self.queue):
+            if queued_type == KEYFRAME_TYPE:
+                continue
+            if self.policy == COALESCE and queued_type == "traffic_update":
+                if victim is None:
+                    victim = index
+                continue
+            victim = index
+            break
+        if victim is None:
+            return False
+        del self.queue[victim]
+        self.dropped += 1
+        return True
+    
+    async def _write_loop(self):
+        try:
+            while not self.closed:
+                if not self.queue:
+                    self._wakeup.clear()
+                    await self._wakeup.wait()
+                    continue
+                _, text = self.queue.popleft()
+                await asyncio.wait_for(self.websocket.send_text(text), timeout=self.send_timeout)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.warning(f"메시지 전송 실패, 연결 종료: {type(e).__name__} {e}")
+            self.close()
+            if self.on_close is not None:
+                self.on_close()
+    
+    def close(self):
+        """송신 중단 (writer 태스크 종료)"""
+        if self.closed:
+            return
+        self.closed = True
+        self.queue.clear()
+        self._wakeup.set()
+        if self._writer is not asyncio.current_task():
+            self._writer.cancel()
 
 
 class ConnectionManager:
     """WebSocket 연결 관리자"""
     
     def __init__(self):
-        self.active_connections: List[WebSocket] = []
-        self.metrics_buffer = deque(maxlen=60)  # 최근 60초 데이터
-        self.current_minute_requests: List[Dict[str, Any]] = []
-        self.last_reset = datetime.utcnow()
+        self.active_connections: Dict[WebSocket, ClientConnection] = {}
+        self.traffic = TrafficWindow(max_routes=settings.live_metrics_max_routes)  # 초 단위 버킷 링 (최근 15분)
+        self._route_rows: Dict[str, List[Any]] = {}  # 마지막으로 전송한 라우트별 압축 행
+        self._route_seq = 0
+        self.history: Optional[MetricsHistory] = None  # 분 단위 히스토리 링 파일
+        self._history_next = 0  # 다음에 기록할 분 (epoch 초)
+        self._pending: Deque[Tuple[float, Dict[str, Any]]] = deque(maxlen=PENDING_LOG_LIMIT)  # (수신 시각, 로그)
+        self._drain_scheduled = False
+        self._samplers: Dict[SamplingPolicy, RequestSampler] = {}  # 사용 중인 정책별 new_request 표본
+        self.instance_id = f"{socket.gethostname()}:{os.getpid()}"
+        self.backplane: Optional[MetricsBackplane] = None  # 워커/레플리카 간 집계 공유
         self._loop = None
         self.use_dummy_logs = True  # 기본값: 더미 로그 사용
     
@@ -47,83 +236,374 @@ class ConnectionManager:
     
     async def connect(self, websocket: WebSocket):
         await websocket.accept()
-        self.active_connections.append(websocket)
+        self.active_connections[websocket] = ClientConnection(
+            websocket,
+            max_queue=settings.live_metrics_send_queue_size,
+            policy=settings.live_metrics_drop_policy,
+            send_timeout=settings.live_metrics_send_timeout_seconds,
+            sampling=self.default_sampling(),
+            on_close=lambda: self.disconnect(websocket)
+        )
+        self._sampler_for(self.active_connections[websocket].sampling)
+        if self._route_seq:
+            # 라우트 델타 적용 기준이 되는 전체 스냅샷
+            self.active_connections[websocket].offer(KEYFRAME_TYPE, json.dumps({
+                "type": KEYFRAME_TYPE,
+                "data": self.route_snapshot()
+            }))
         logger.info(f"WebSocket 연결됨. 총 연결 수: {len(self.active_connections)}")
     
     def disconnect(self, websocket: WebSocket):
-        if websocket in self.active_connections:
-            self.active_connections.remove(websocket)
+        connection = self.active_connections.pop(websocket, None)
+        if connection is None:
+            return
+        connection.close()
         logger.info(f"WebSocket 연결 해제됨. 총 연결 수: {len(self.active_connections)}")
     
     async def broadcast(self, message: dict):
-        """모든 연결된 클라이언트에 메시지 전송"""
-        disconnected = []
-        for connection in self.active_connections:
-            try:
-                await connection.send_json(message)
-            except Exception as e:
-                logger.error(f"메시지 전송 실패: {e}")
-                disconnected.append(connection)
+        """
+        모든 연결된 클라이언트에 메시지 전송
         
-        for conn in disconnected:
-            self.disconnect(conn)
+        JSON은 메시지당 한 번만 직렬화하고 각 연결의 송신 큐에 넣기만 합니다 (전송 대기 없음).
+        """
+        self.publish(message)
+    
+    def publish(self, message: dict):
+        """broadcast의 동기 버전 (이벤트 루프 스레드 전용)"""
+        if not self.active_connections:
+            return
+        self._offer_all(list(self.active_connections.values()), message)
+    
+    def _offer_all(self, connections: List[ClientConnection], message: dict):
+        """한 번 직렬화한 메시지를 여러 연결의 송신 큐에 적재, 큐 초과 연결은 종료"""
+        text = json.dumps(message, default=str)
+        message_type = message.get("type", "")
+        keyframe = self._route_keyframe(message) if message_type == "traffic_update" else None
+        slow_consumers = [
+            connection
+            for connection in connections
+            if not connection.offer(message_type, text, keyframe)
+        ]
+        for connection in slow_consumers:
+            logger.warning("느린 WebSocket 클라이언트 연결 종료 (송신 큐 초과)")
+            self.disconnect(connection.websocket)
+            asyncio.create_task(self._close_websocket(connection.websocket))
+    
+    def _route_keyframe(self, message: dict) -> Optional[Callable[[], str]]:
+        """라우트 델타 traffic_update의 전체 스냅샷 버전 (coalesce 대체가 일어날 때 한 번만 직렬화)"""
+        data = message.get("data")
+        routes = data.get("routes") if isinstance(data, dict) else None
+        if not isinstance(routes, dict) or routes.get("full"):
+            return None
+        cache: List[str] = []
+        
+        def build() -> str:
+            if not cache:
+                cache.append(json.dumps(
+                    {**message, "data": {**data, "routes": self.route_snapshot()}}, default=str
+                ))
+            return cache[0]
+        return build
+    
+    def send_to(self, websocket: WebSocket, message: dict):
+        """특정 연결에만 메시지 전송 (송신 큐 경유)"""
+        connection = self.active_connections.get(websocket)
+        if connection is not None:
+            self._offer_all([connection], message)
+    
+    @staticmethod
+    async def _close_websocket(websocket: WebSocket):
+        try:
+            await websocket.close(code=1013)  # Try Again Later
+        except Exception:
+            pass
+    
+    def record_request(self, log_data: Dict[str, Any], now: Optional[float] = None):
+        """요청 1건을 초 단위 버킷에 집계 (지연 스케치 포함)"""
+        self.traffic.record(
+            float(log_data.get('duration') or 0),
+            int(log_data.get('status_code') or 200),
+            now=now,
+            route=log_data.get('route') or log_data.get('path')
+        )
     
     async def add_request_log_async(self, log_data: Dict[str, Any]):
-        """요청 로그 추가 및 개별 요청 브로드캐스트 (비동기)"""
-        self.current_minute_requests.append(log_data)
+        """요청 로그 추가 (비동기 호출부 호환용)"""
+        self.add_request_log(log_data)
+    
+    def add_request_log(self, log_data: Dict[str, Any], at: Optional[float] = None):
+        """
+        요청 로그 추가 (스레드 안전, 논블로킹)
         
-        if self.active_connections:
-            logger.debug(
-                f"📡 브로드캐스팅 new_request to {len(self.active_connections)} clients: {log_data['method']} {log_data['path']}"
-            )
-            await self.broadcast({
-                "type": "new_request",
-                "data": log_data
-            })
+        deque에 넣기만 하고 집계와 new_request 샘플링은 이벤트 루프의 drain이 모아서 처리합니다.
+        요청마다 코루틴을 예약하지 않고, 큐가 비어 있다가 채워질 때만 drain 콜백을 한 번 예약합니다.
+        
+        Args:
+            at: 요청 시각 (epoch 초, 컨테이너 로그의 시각). 없거나 미래면 수신 시각
+        """
+        now = time.time()
+        self._pending.append((now if at is None or at > now else at, log_data))
+        if self._drain_scheduled:
+            return
+        self._drain_scheduled = True
+        
+        try:
+            asyncio.get_running_loop().call_soon(self.drain)
+            return
+        except RuntimeError:
+            pass
+        
+        # 이벤트 루프 밖의 스레드: 루프가 알려져 있으면 스레드 안전하게 예약, 아니면 다음 집계 때 drain
+        loop = self._loop
+        if loop is not None and not loop.is_closed():
+            loop.call_soon_threadsafe(self.drain)
         else:
-            logger.warning("⚠️ 활성 연결이 없어 브로드캐스트 건너뜀")
+            self._drain_scheduled = False
     
-    def add_request_log(self, log_data: Dict[str, Any]):
-        """요청 로그 추가 (동기 래퍼)"""
-        self.current_minute_requests.append(log_data)
+    def drain(self) -> int:
+        """
+        대기 중인 요청 로그를 집계하고 new_request 표본에 반영 (이벤트 루프 스레드 전용)
         
-        if self.active_connections and self._loop:
-            asyncio.run_coroutine_threadsafe(
-                self.broadcast({
-                    "type": "new_request",
-                    "data": log_data
-                }),
-                self._loop
-            )
+        Returns:
+            처리한 로그 수
+        """
+        # 먼저 플래그를 내려야 drain 도중 들어온 로그가 새 drain을 예약함
+        self._drain_scheduled = False
+        pending = self._pending
+        samplers = list(self._samplers.values()) if self.active_connections else []
+        drained = 0
+        while pending:
+            received, log_data = pending.popleft()
+            self.record_request(log_data, received)
+            for sampler in samplers:
+                sampler.offer(log_data)
+            drained += 1
+        return drained
     
-    def calculate_metrics(self) -> 'MetricData':
-        """현재 분의 메트릭 계산"""
-        if not self.current_minute_requests:
-            return MetricData(
-                timestamp=datetime.utcnow().isoformat(),
-                request_count=0,
-                avg_duration=0,
-                error_count=0,
-                success_rate=100.0
-            )
+    @staticmethod
+    def default_sampling() -> SamplingPolicy:
+        """subscribe 메시지를 보내지 않은 클라이언트의 정책 (개별 new_request, 기존 프론트엔드 호환)"""
+        return SamplingPolicy(
+            sample_rate=settings.live_metrics_sample_rate,
+            max_per_tick=settings.live_metrics_sample_max_per_tick,
+            slow_ms=settings.live_metrics_slow_request_ms,
+        )
+    
+    def _sampler_for(self, policy: SamplingPolicy) -> RequestSampler:
+        sampler = self._samplers.get(policy)
+        if sampler is None:
+            sampler = self._samplers[policy] = RequestSampler(policy)
+        return sampler
+    
+    def subscribe(self, websocket: WebSocket, message: Dict[str, Any]) -> SamplingPolicy:
+        """
+        클라이언트의 new_request 수신 정책 변경
         
-        total_requests = len(self.current_minute_requests)
-        total_duration = sum(req.get('duration', 0) for req in self.current_minute_requests)
-        error_count = sum(1 for req in self.current_minute_requests if req.get('status_code', 200) >= 400)
-        success_count = total_requests - error_count
+        예: {"type": "subscribe", "sample_rate": 0.1, "max_per_tick": 20, "slow_ms": 500,
+             "include_errors": true, "batch": true}
+        """
+        connection = self.active_connections.get(websocket)
+        if connection is None:
+            raise ValueError("연결되지 않은 WebSocket")
+        connection.sampling = SamplingPolicy.from_message(message, self.default_sampling())
+        self._sampler_for(connection.sampling)
+        return connection.sampling
+    
+    def handle_message(self, websocket: WebSocket, text: str):
+        """클라이언트 메시지 처리 (subscribe: new_request 샘플링/배치 정책 협상, 그 외 메시지는 무시)"""
+        try:
+            message = json.loads(text)
+        except ValueError:
+            return
+        if not isinstance(message, dict) or message.get("type") != "subscribe":
+            return
         
+        try:
+            reply = {"type": "subscribed", "data": self.subscribe(websocket, message)._asdict()}
+        except (ValueError, TypeError, OverflowError) as e:
+            reply = {"type": "error", "data": {"message": f"잘못된 subscribe 메시지: {e}"}}
+        self.send_to(websocket, reply)
+    
+    def flush_requests(self):
+        """
+        이번 틱의 new_request 표본 전송 (집계 루프에서 틱마다 호출)
+        
+        같은 정책의 클라이언트는 표본과 직렬화 결과를 공유합니다.
+        batch 정책은 new_request_batch 1개, 아니면 표본 요청마다 new_request 1개를 보냅니다.
+        """
+        groups: Dict[SamplingPolicy, List[ClientConnection]] = {}
+        for connection in self.active_connections.values():
+            groups.setdefault(connection.sampling, []).append(connection)
+        
+        for policy, sampler in list(self._samplers.items()):
+            connections = groups.get(policy)
+            if not connections:
+                del self._samplers[policy]  # 더 이상 사용하지 않는 정책
+                continue
+            requests, seen = sampler.take()
+            if not requests:
+                continue
+            if policy.batch:
+                self._offer_all(connections, {
+                    "type": "new_request_batch",
+                    "data": {"requests": requests, "total": seen}
+                })
+            else:
+                for log_data in requests:
+                    self._offer_all(connections, {
+                        "type": "new_request",
+                        "data": log_data
+                    })
+    
+    def calculate_metrics(self) -> 'MetricData':
+        """최근 1분/5분/15분 슬라이딩 윈도우 메트릭 계산 (라우트별 분위수는 최근 1분)"""
+        self.drain()
+        windows = self.traffic.summarize_windows()
+        last_minute = windows["1m"]
         return MetricData(
             timestamp=datetime.utcnow().isoformat(),
-            request_count=total_requests,
-            avg_duration=total_duration / total_requests if total_requests > 0 else 0,
-            error_count=error_count,
-            success_rate=(success_count / total_requests * 100) if total_requests > 0 else 100.0
+            request_count=last_minute["request_count"],
+            avg_duration=last_minute["avg_duration"],
+            error_count=last_minute["error_count"],
+            success_rate=last_minute["success_rate"],
+            p50=last_minute["p50"],
+            p95=last_minute["p95"],
+            p99=last_minute["p99"],
+            status_classes=last_minute["status_classes"],
+            windows=windows,
+            routes=self.traffic.summarize_routes(60)
         )
     
-    def reset_minute_buffer(self):
-        """분 단위 버퍼 리셋"""
-        self.current_minute_requests.clear()
-        self.last_reset = datetime.utcnow()
+    async def start_backplane(self, backplane: MetricsBackplane):
+        """백플레인 연결 (이후 로컬 트래픽은 초 단위 델타로도 모아 publish_traffic에서 전송)"""
+        self.backplane = backplane
+        self.traffic.track_outbound = True
+        await backplane.start(self.receive_traffic)
+    
+    async def stop_backplane(self):
+        if self.backplane is None:
+            return
+        await self.publish_traffic()
+        await self.backplane.stop()
+        self.backplane = None
+        self.traffic.track_outbound = False
+    
+    async def publish_traffic(self) -> int:
+        """
+        마지막 전송 이후의 로컬 초 단위 델타를 백플레인으로 전송
+        
+        Returns:
+            전송한 초 버킷 수
+        """
+        if self.backplane is None:
+            return 0
+        self.drain()
+        buckets = self.traffic.take_outbound()
+        if buckets:
+            await self.backplane.publish({
+                "origin": self.instance_id,
+                "buckets": [bucket.to_dict() for bucket in buckets]
+            })
+        return len(buckets)
+    
+    def receive_traffic(self, message: Dict[str, Any]):
+        """다른 워커/레플리카의 델타를 로컬 버킷 링에 병합 (자기 메시지는 무시)"""
+        if message.get("origin") == self.instance_id:
+            return
+        for data in message.get("buckets", []):
+            try:
+                self.traffic.merge_bucket(TrafficBucket.from_dict(data))
+            except (KeyError, TypeError, ValueError) as e:
+                logger.debug(f"백플레인 델타 무시: {type(e).__name__} {e}")
+    
+    def open_history(self, path: str, capacity: int):
+        """히스토리 파일 열기 (이 프로세스가 집계를 시작한 분부터 기록)"""
+        self.history = MetricsHistory(path, capacity)
+        self._history_next = int(time.time()) // 60 * 60
+    
+    def flush_history(self, include_current: bool = False, now: Optional[float] = None) -> int:
+        """
+        끝난 분의 초 단위 버킷을 분 레코드로 롤업해 히스토리에 기록
+        
+        Args:
+            include_current: 진행 중인 분도 기록 (종료 시)
+        
+        Returns:
+            기록한 분 수
+        """
+        if self.history is None:
+            return 0
+        self.drain()
+        current_minute = int(time.time() if now is None else now) // 60 * 60
+        if self.backplane is not None and not self.history.acquire_writer():
+            # 버킷 링에 이미 전체 트래픽이 합쳐져 있으므로 기록은 한 워커만 (중복 합산 방지)
+            self._history_next = current_minute
+            return 0
+        end = current_minute + 60 if include_current else current_minute
+        # 버킷 링에 남아 있는 분만 기록 가능
+        start = max(self._history_next, current_minute - self.traffic.horizon + 60)
+        
+        written = 0
+        for minute in range(start, end, 60):
+            self.history.write(minute, **self.traffic.minute_totals(minute))
+            written += 1
+        self._history_next = max(self._history_next, end)
+        if written:
+            self.history.flush()
+        return written
+    
+    def pending_history(self, now: Optional[float] = None) -> Dict[int, tuple]:
+        """
+        아직 히스토리에 기록하지 않은 분(진행 중인 분 포함)을 버킷 링에서 계산 (파일에 쓰지 않음)
+        
+        Returns:
+            {분 시작 epoch 초: MetricsHistory.make_record() 레코드}
+        """
+        if self.history is None:
+            return {}
+        self.drain()
+        current_minute = int(time.time() if now is None else now) // 60 * 60
+        start = max(self._history_next, current_minute - self.traffic.horizon + 60)
+        return {
+            minute: MetricsHistory.make_record(minute, **self.traffic.minute_totals(minute))
+            for minute in range(start, current_minute + 60, 60)
+        }
+    
+    def close_history(self):
+        if self.history is not None:
+            self.flush_history(include_current=True)
+            self.history.close()
+            self.history = None
+    
+    def encode_routes(self, routes: Dict[str, Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        라우트별 통계를 압축 델타로 인코딩 (traffic_update.routes)
+        
+        행은 ROUTE_FIELDS 순서의 배열이며 변경된 라우트만 "set", 사라진 라우트는 "del"에 담습니다.
+        coalesce 정책이 대기 중인 델타를 대체할 때는 전체 스냅샷 버전(_route_keyframe)을 보내고,
+        live_metrics_route_keyframe_ticks 틱마다 "full": true 인 전체 스냅샷을 보내므로
+        다른 정책으로 델타를 놓친 클라이언트도 seq 불연속을 감지한 뒤 곧 복구됩니다.
+        """
+        rows = {route: _route_row(stats) for route, stats in routes.items()}
+        previous, self._route_rows = self._route_rows, rows
+        self._route_seq += 1
+        
+        if (self._route_seq - 1) % max(1, settings.live_metrics_route_keyframe_ticks) == 0:
+            return self.route_snapshot()
+        return {
+            "seq": self._route_seq,
+            "set": {route: row for route, row in rows.items() if previous.get(route) != row},
+            "del": [route for route in previous if route not in rows],
+        }
+    
+    def route_snapshot(self) -> Dict[str, Any]:
+        """마지막 라우트 통계 전체 (새 연결/키프레임용)"""
+        return {
+            "seq": self._route_seq,
+            "full": True,
+            "fields": ROUTE_FIELDS,
+            "set": self._route_rows,
+        }
 
 
 manager = ConnectionManager()
@@ -131,42 +611,11 @@ manager = ConnectionManager()
 
 def parse_container_log(log_line: str) -> Dict[str, Any] | None:
     """
-    Container App 로그 파싱
+    Container App 로그 한 줄 파싱 (형식은 container_log_parser 참고)
     FastAPI 로그 형식: INFO:     127.0.0.1:12345 - "GET /api/v1/etf/list HTTP/1.1" 200 OK
     """
-    try:
-        pattern = r'(?P<level>\w+):\s+(?P<client>[\d\.:]+)\s+-\s+"(?P<method>\w+)\s+(?P<path>[^\s]+)\s+HTTP/[\d\.]+"\s+(?P<status>\d+)'
-        match = re.search(pattern, log_line)
-        
-        if match:
-            return {
-                'timestamp': datetime.utcnow().isoformat(),
-                'method': match.group('method'),
-                'path': match.group('path'),
-                'status_code': int(match.group('status')),
-                'duration': 0,
-            }
-        
-        if '{' in log_line and '}' in log_line:
-            try:
-                json_match = re.search(r'\{.*\}', log_line)
-                if json_match:
-                    data = json.loads(json_match.group())
-                    if 'resultCode' in data or 'status' in data:
-                        return {
-                            'timestamp': data.get('timestamp', datetime.utcnow().isoformat()),
-                            'method': data.get('method', 'GET'),
-                            'path': data.get('url', '/'),
-                            'status_code': data.get('resultCode', data.get('status', 200)),
-                            'duration': data.get('duration', 0),
-                        }
-            except json.JSONDecodeError:
-                pass
-        
-        return None
-    except Exception as e:
-        logger.debug(f"로그 파싱 오류: {e}")
-        return None
+    parsed = parse_log_line(log_line)
+    return parsed.log_data if parsed else None
 
 
 async def stream_container_logs():
@@ -215,15 +664,21 @@ async def stream_container_logs():
             await stream_dummy_logs()
             return
         
+        # 미들웨어 ⚡ 로그(지연 포함)가 보이면 같은 요청의 uvicorn 접근 로그는 중복이므로 건너뜀
+        has_app_logs = False
         while True:
             line = await process.stdout.readline()
             if not line:
                 break
             
-            log_line = line.decode('utf-8').strip()
-            log_data = parse_container_log(log_line)
-            if log_data:
-                manager.add_request_log(log_data)
+            parsed = parse_log_line(line.decode('utf-8', errors='replace'))
+            if parsed is None:
+                continue
+            if parsed.source == SOURCE_APP:
+                has_app_logs = True
+            elif parsed.source == SOURCE_ACCESS and has_app_logs:
+                continue
+            manager.add_request_log(parsed.log_data, at=parsed.at)
             
     except FileNotFoundError:
         logger.error("Azure CLI가 설치되지 않았습니다. 더미 데이터를 생성합니다.")
@@ -285,24 +740,83 @@ async def start_log_streaming():
 async def metrics_aggregation_loop():
     """
     1초마다 메트릭 계산 및 브로드캐스트
+    
+    프로세스 전체에서 하나만 실행되며 (acquire_aggregation/release_aggregation),
+    계산은 초당 한 번, 전송은 연결당 한 번입니다.
     """
+    loop = asyncio.get_running_loop()
+    next_tick = loop.time()
     while True:
         try:
-            metrics = manager.calculate_metrics()
+            data = manager.calculate_metrics().model_dump()
+            data["routes"] = manager.encode_routes(data["routes"])
+            manager.flush_requests()
             
             await manager.broadcast({
                 "type": "traffic_update",
-                "data": metrics.model_dump()
+                "data": data
             })
-            
-            if (datetime.utcnow() - manager.last_reset).total_seconds() >= 60:
-                manager.reset_minute_buffer()
-            
-            await asyncio.sleep(1)
-            
         except Exception as e:
             logger.error(f"메트릭 집계 오류: {e}", exc_info=True)
-            await asyncio.sleep(1)
+        
+        # 브로드캐스트 소요 시간만큼 주기가 밀리지 않도록 고정 간격으로 예약
+        next_tick += 1
+        await asyncio.sleep(max(0.0, next_tick - loop.time()))
+
+
+async def history_rollup_loop():
+    """매 분 경계 직후 지난 분을 히스토리 파일에 롤업 (백플레인 델타 도착 여유 2초)"""
+    while True:
+        await asyncio.sleep(60 - time.time() % 60 + 2)
+        try:
+            manager.flush_history()
+        except Exception as e:
+            logger.error(f"메트릭 히스토리 기록 오류: {e}", exc_info=True)
+
+
+history_task: Optional[asyncio.Task] = None
+
+
+async def backplane_publish_loop():
+    """1초마다 로컬 트래픽 델타를 백플레인으로 전송 (WebSocket 구독자 유무와 무관)"""
+    while True:
+        await asyncio.sleep(1)
+        try:
+            await manager.publish_traffic()
+        except Exception as e:
+            logger.error(f"백플레인 전송 오류: {e}", exc_info=True)
+
+
+backplane_task: Optional[asyncio.Task] = None
+
+
+aggregation_task: Optional[asyncio.Task] = None
+aggregation_refs = 0
+
+
+def acquire_aggregation():
+    """집계 태스크 참조 획득 (첫 구독자가 태스크 시작)"""
+    global aggregation_task, aggregation_refs
+    
+    aggregation_refs += 1
+    if aggregation_task is None or aggregation_task.done():
+        aggregation_task = asyncio.create_task(metrics_aggregation_loop())
+        logger.info("📊 메트릭 집계 태스크 시작")
+
+
+async def release_aggregation():
+    """집계 태스크 참조 해제 (마지막 구독자가 나가면 태스크 종료)"""
+    global aggregation_task, aggregation_refs
+    
+    aggregation_refs = max(0, aggregation_refs - 1)
+    if aggregation_refs == 0 and aggregation_task is not None:
+        task, aggregation_task = aggregation_task, None
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+        logger.info("🛑 메트릭 집계 태스크 종료")
 
 
 @router.websocket("/ws/traffic")
@@ -321,26 +835,18 @@ async def websocket_traffic(websocket: WebSocket):
     await start_log_streaming()
     logger.info("✅ 로그 스트리밍 시작 완료")
     
-    aggregation_task = asyncio.create_task(metrics_aggregation_loop())
-    logger.info("📊 메트릭 집계 태스크 시작")
+    acquire_aggregation()
     
     try:
         while True:
-            try:
-                await websocket.receive_text()
-            except WebSocketDisconnect:
-                break
-            await asyncio.sleep(0.1)
-                
+            manager.handle_message(websocket, await websocket.receive_text())
     except WebSocketDisconnect:
-        manager.disconnect(websocket)
         logger.info("클라이언트 연결 해제")
     except Exception as e:
         logger.error(f"WebSocket 오류: {e}", exc_info=True)
-        manager.disconnect(websocket)
     finally:
-        aggregation_task.cancel()
-        logger.info("🛑 메트릭 집계 태스크 종료")
+        manager.disconnect(websocket)
+        await release_aggregation()
 
 
 @router.get("/current")
@@ -353,26 +859,29 @@ async def get_current_metrics():
 
 
 @router.get("/history")
-async def get_metrics_history(minutes: int = 60):
+async def get_metrics_history(minutes: int = 60, resolution: str = "1m"):
     """
-    과거 메트릭 조회 (더미 데이터)
+    과거 메트릭 조회 (분 단위 히스토리 링 파일)
     
-    - **minutes**: 조회할 시간 범위 (분)
+    - **minutes**: 조회할 시간 범위 (분, 최대 보관 기간)
+    - **resolution**: 다운샘플링 단위 (1m, 5m, 1h)
     """
-    import random
-
-    history = []
-    for i in range(min(minutes, 60)):
-        timestamp = datetime.utcnow() - timedelta(minutes=minutes-i)
-        history.append({
-            "timestamp": timestamp.isoformat(),
-            "request_count": random.randint(5, 50),
-            "avg_duration": random.uniform(50, 200),
-            "error_count": random.randint(0, 5),
-            "success_rate": random.uniform(90, 100)
-        })
+    if resolution not in RESOLUTIONS:
+        raise HTTPException(status_code=400, detail=f"resolution은 {', '.join(RESOLUTIONS)} 중 하나여야 합니다")
+    if manager.history is None:
+        return {"history": [], "resolution": resolution, "enabled": False}
     
-    return {"history": history}
+    # 조회는 파일에 쓰지 않음: 기록된 분 + 버킷 링의 미기록 분(진행 중인 분 포함)
+    now = time.time()
+    end = int(now) // 60 * 60 + 60
+    minutes = max(1, min(minutes, manager.history.capacity))
+    points = manager.history.query(
+        end - minutes * 60, end, RESOLUTIONS[resolution], pending=manager.pending_history(now)
+    )
+    for point in points:
+        point["timestamp"] = datetime.utcfromtimestamp(point.pop("minute")).isoformat()
+    
+    return {"history": points, "resolution": resolution, "enabled": True}
 
 
 @router.post("/toggle-dummy-logs")
@@ -427,3 +936,38 @@ async def startup_event():
     manager.use_dummy_logs = settings.environment.lower() != "production"
     logger.info(f"초기 더미 로그 상태: {manager.use_dummy_logs} (environment: {settings.environment})")
     logger.info("✅ Production: 실제 HTTP 트래픽이 미들웨어를 통해 Live Metrics에 전송됩니다.")
+    
+    global history_task, backplane_task
+    try:
+        backplane = create_backplane(
+            settings.live_metrics_backplane,
+            socket_path=settings.live_metrics_backplane_socket,
+            redis_url=settings.live_metrics_redis_url,
+            redis_channel=settings.live_metrics_redis_channel
+        )
+        if backplane is not None:
+            await manager.start_backplane(backplane)
+            backplane_task = asyncio.create_task(backplane_publish_loop())
+            logger.info(f"🛰️ Live Metrics 백플레인: {settings.live_metrics_backplane} ({manager.instance_id})")
+    except (RuntimeError, ValueError, OSError) as e:
+        logger.error(f"Live Metrics 백플레인을 시작할 수 없습니다 (프로세스별 집계로 동작): {e}")
+    
+    if settings.live_metrics_history_path:
+        try:
+            manager.open_history(settings.live_metrics_history_path, settings.live_metrics_history_minutes)
+            history_task = asyncio.create_task(history_rollup_loop())
+            logger.info(f"📼 메트릭 히스토리 기록: {settings.live_metrics_history_path}")
+        except OSError as e:
+            logger.error(f"메트릭 히스토리 파일을 열 수 없습니다: {e}")
+
+
+@router.on_event("shutdown")
+async def shutdown_event():
+    """백플레인 종료, 진행 중인 분까지 히스토리에 기록하고 파일 닫기"""
+    global history_task, backplane_task
+    for task in (history_task, backplane_task):
+        if task is not None:
+            task.cancel()
+    history_task = backplane_task = None
+    await manager.stop_backplane()
+    manager.close_history()
@@ -1,28 +1,36 @@
 """
 API 라우터 - 뉴스 관련 엔드포인트 (v1)
 """
-from typing import Any, Dict, List
+import asyncio
+import json
+from datetime import date, datetime, time, timezone
+from typing import Any, AsyncIterator, Dict, List, Optional
 
-from fastapi import APIRouter, Query
+from fastapi import APIRouter, Header, Query, Request
+from fastapi.responses import StreamingResponse
 
-from src.services import get_rss_news_service, get_yfinance_client
+from src.services import (get_news_enrichment_service,
+                          get_news_ingestion_service)
+from src.services.news_ingestion_service import (ORIGIN_MARKET, ORIGIN_RSS,
+                                                 StoredArticle)
 
 router = APIRouter(prefix="/api/v1/news", tags=["News"])
 
+# SSE 연결 유지용 주석 전송 간격 (프록시 유휴 타임아웃 방지)
+STREAM_HEARTBEAT_SECONDS = 15.0
+STREAM_RETRY_MS = 3000
+
 
 @router.get("/market")
 async def get_market_news(
-    category: str = Query(
-        default="general",
-        regex="^(general|forex|crypto|merger)$"
-    ),
     limit: int = Query(default=20, ge=1, le=100)
 ) -> List[Dict[str, Any]]:
-    """시장 뉴스 조회"""
-    yfinance = get_yfinance_client()
-    news = yfinance.get_market_news(category)
+    """시장 뉴스 조회 (수집된 주요 지수 뉴스, 카테고리 구분 없음)"""
+    ingestion = get_news_ingestion_service()
+    await ingestion.wait_ready()
     
-    return news[:limit] if news else []
+    news = ingestion.store.latest(limit=limit, origins=[ORIGIN_MARKET])
+    return get_news_enrichment_service().annotate(news)
 
 
 @router.get("/global")
@@ -33,16 +41,17 @@ async def get_global_news(
     ),
     limit: int = Query(default=30, ge=1, le=100)
 ) -> List[Dict[str, Any]]:
-    """글로벌 금융 뉴스 조회 (RSS 피드)"""
-    rss_service = get_rss_news_service()
+    """글로벌 금융 뉴스 조회 (수집된 RSS 피드)"""
+    ingestion = get_news_ingestion_service()
+    await ingestion.wait_ready()
     
     if sources == "all":
         source_list = None
     else:
         source_list = [s.strip() for s in sources.split(",")]
     
-    news = rss_service.fetch_news(sources=source_list, limit=limit)
-    return news
+    news = ingestion.store.latest(limit=limit, origins=[ORIGIN_RSS], sources=source_list)
+    return get_news_enrichment_service().annotate(news)
 
 
 @router.get("/search")
@@ -52,15 +61,94 @@ async def search_news(
         default="all",
         description="검색할 RSS 소스"
     ),
-    limit: int = Query(default=20, ge=1, le=50)
+    limit: int = Query(default=20, ge=1, le=50),
+    from_date: Optional[date] = Query(default=None, alias="from", description="시작일 (YYYY-MM-DD)"),
+    to_date: Optional[date] = Query(default=None, alias="to", description="종료일 (YYYY-MM-DD, 포함)")
 ) -> List[Dict[str, Any]]:
-    """뉴스 검색"""
-    rss_service = get_rss_news_service()
+    """
+    뉴스 검색 (수집된 RSS 기사, BM25 관련도순)
+    
+    단어 단위로 색인하므로 단어 일부나 불용어만 있는 검색어는 BM25 결과가 없으며,
+    이때는 제목/요약 부분 문자열 일치(최신순)로 대체합니다.
+    """
+    ingestion = get_news_ingestion_service()
+    await ingestion.wait_ready()
     
     if sources == "all":
         source_list = None
     else:
         source_list = [s.strip() for s in sources.split(",")]
     
-    news = rss_service.search_news(keyword=q, sources=source_list, limit=limit)
-    return news
+    start_ts = int(datetime.combine(from_date, time.min, timezone.utc).timestamp()) if from_date else None
+    end_ts = int(datetime.combine(to_date, time.max, timezone.utc).timestamp()) if to_date else None
+    
+    news = ingestion.store.search(
+        q,
+        limit=limit,
+        origins=[ORIGIN_RSS],
+        sources=source_list,
+        start_ts=start_ts,
+        end_ts=end_ts
+    )
+    return get_news_enrichment_service().annotate(news)
+
+
+def _format_event(event_id: str, stored: StoredArticle) -> str:
+    """기사를 SSE 이벤트로 직렬화 (id = 저장소 epoch + 수집 순번)"""
+    data = json.dumps({**stored.article, "origin": stored.origin}, ensure_ascii=False)
+    return f"id: {event_id}\nevent: article\ndata: {data}\n\n"
+
+
+@router.get("/stream")
+async def stream_news(
+    request: Request,
+    sources: str = Query(
+        default="all",
+        description="RSS 소스 필터 (all 또는 콤마 구분)"
+    ),
+    last_event_id: Optional[str] = Header(default=None, alias="Last-Event-ID")
+) -> StreamingResponse:
+    """
+    새로 수집된 기사 스트림 (Server-Sent Events)
+    
+    모든 구독자가 하나의 수집 워커를 공유하며, 재연결 시 Last-Event-ID 이후 기사부터 이어서 보냅니다.
+    다른 워커/레플리카나 재시작 전 프로세스의 id면 이어받지 않고 새 기사부터 보냅니다.
+    """
+    ingestion = get_news_ingestion_service()
+    store = ingestion.store
+    source_set = None if sources == "all" else {s.strip() for s in sources.split(",")}
+    resume_seq = store.resume_seq(last_event_id)
+    
+    async def event_stream() -> AsyncIterator[str]:
+        # 이어받기 구간과 실시간 구간 사이에 기사가 빠지지 않도록 먼저 구독
+        queue = ingestion.subscribe()
+        try:
+            yield f"retry: {STREAM_RETRY_MS}\n\n"
+            last_seq = resume_seq or 0
+            if resume_seq is not None:
+                for stored in store.since(resume_seq):
+                    last_seq = stored.seq
+                    if source_set is None or stored.article.get("source") in source_set:
+                        yield _format_event(store.event_id(stored), stored)
+            
+            while not await request.is_disconnected():
+                try:
+                    stored = await asyncio.wait_for(queue.get(), timeout=STREAM_HEARTBEAT_SECONDS)
+                except asyncio.TimeoutError:
+                    yield ": keep-alive\n\n"
+                    continue
+                if stored is None:
+                    break  # 구독자가 뒤처짐 - 클라이언트가 Last-Event-ID로 재연결
+                if stored.seq <= last_seq:
+                    continue
+                last_seq = stored.seq
+                if source_set is None or stored.article.get("source") in source_set:
+                    yield _format_event(store.event_id(stored), stored)
+        finally:
+            ingestion.unsubscribe(queue)
+    
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
@@ -3,13 +3,15 @@ API 라우터 - 주식 관련 엔드포인트 (v1)
 """
 import asyncio
 from concurrent.futures import ThreadPoolExecutor
-from datetime import datetime, timedelta, timezone
-from typing import Any, Dict, List
+from datetime import date, datetime, time, timedelta, timezone
+from typing import Any, Dict, List, Optional
 
 from fastapi import APIRouter, HTTPException, Query
 
 from src.observability.utils import trace_span
-from src.services import get_cosmos_service, get_yfinance_client
+from src.services import (get_news_enrichment_service,
+                          get_news_ingestion_service, get_storage_service,
+                          get_yfinance_client)
 
 router = APIRouter(prefix="/api/v1/stocks", tags=["Stocks"])
 
@@ -113,7 +115,7 @@ async def get_stock_detail(symbol: str) -> Dict[str, Any]:
     if not profile and not quote:
         raise HTTPException(status_code=404, detail=f"Stock {symbol} not found")
     
-    cosmos = get_cosmos_service()
+    storage = get_storage_service()
     data = {
         "profile": profile,
         "quote": quote,
@@ -128,9 +130,9 @@ async def get_stock_detail(symbol: str) -> Dict[str, Any]:
         except Exception as e:
             print(f"Could not get holdings for {symbol}: {e}")
         
-        cosmos.save_etf_data(symbol.upper(), data)
+        storage.save_etf_data(symbol.upper(), data)
     else:
-        cosmos.save_stock_data(symbol.upper(), data)
+        storage.save_stock_data(symbol.upper(), data)
     
     return {
         "symbol": symbol.upper(),
@@ -170,21 +172,54 @@ async def get_stock_quote(symbol: str) -> Dict[str, Any]:
 @router.get("/{symbol}/news")
 async def get_stock_news(
     symbol: str,
-    days: int = Query(default=7, ge=1, le=30)
+    days: int = Query(default=7, ge=1, le=30),
+    limit: int = Query(default=50, ge=1, le=200),
+    from_date: Optional[date] = Query(default=None, alias="from", description="시작일 (YYYY-MM-DD, days 대신 사용)"),
+    to_date: Optional[date] = Query(default=None, alias="to", description="종료일 (YYYY-MM-DD, 포함)")
 ) -> List[Dict[str, Any]]:
-    """주식 뉴스 조회"""
-    yfinance = get_yfinance_client()
-    
-    end_date = datetime.now()
-    start_date = end_date - timedelta(days=days)
+    """주식 뉴스 조회 (수집된 전체 소스에서 심볼이 언급된 기사, 최신순)"""
+    ingestion = get_news_ingestion_service()
+    await ingestion.wait_ready()
     
-    news = yfinance.get_company_news(
-        symbol.upper(),
-        start_date.strftime("%Y-%m-%d"),
-        end_date.strftime("%Y-%m-%d")
+    end = datetime.combine(to_date, time.max, timezone.utc) if to_date else datetime.now(timezone.utc)
+    if from_date:
+        start = datetime.combine(from_date, time.min, timezone.utc)
+    else:
+        start = end - timedelta(days=days)
+    
+    try:
+        news = await ingestion.company_news(
+            symbol,
+            limit=limit,
+            start_ts=int(start.timestamp()),
+            end_ts=int(end.timestamp())
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return get_news_enrichment_service().annotate(news)
+
+
+@router.get("/{symbol}/history")
+async def get_stock_history(
+    symbol: str,
+    granularity: str = Query(default="hour", regex="^(hour|day)$"),
+    days: int = Query(default=7, ge=1, le=365)
+) -> Dict[str, Any]:
+    """저장된 주식 시세 이력 조회 (시간/일 단위 요약)"""
+    storage = get_storage_service()
+    end = datetime.now(timezone.utc)
+    start = end - timedelta(days=days)
+    
+    summaries = storage.get_summaries(
+        symbol.upper(), "stock", granularity,
+        int(start.timestamp()), int(end.timestamp())
     )
     
-    return news
+    return {
+        "symbol": symbol.upper(),
+        "granularity": granularity,
+        "history": summaries
+    }
 
 
 @router.get("/{symbol}/candles")
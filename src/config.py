@@ -23,6 +23,45 @@ class Settings(BaseSettings):
     cosmos_database_name: str = os.getenv("COSMOS_DATABASE_NAME", "etf-agent")
     cosmos_container_name: str = os.getenv("COSMOS_CONTAINER_NAME", "etf-data")
     
+    # Storage backend (auto | cosmos | local)
+    storage_backend: str = os.getenv("STORAGE_BACKEND", "auto")
+    local_store_path: str = os.getenv("LOCAL_STORE_PATH", ".data/etf-agent.db")
+    
+    # Snapshot retention
+    snapshot_ttl_seconds: int = int(os.getenv("SNAPSHOT_TTL_SECONDS", "0"))  # 원본 스냅샷 TTL (0 = 만료 없음, 첫 압축 백필 후 적용)
+    hourly_summary_ttl_seconds: int = int(os.getenv("HOURLY_SUMMARY_TTL_SECONDS", "7776000"))  # 시간별 요약 90일
+    compaction_interval_seconds: int = int(os.getenv("COMPACTION_INTERVAL_SECONDS", "3600"))
+    
+    # News ingestion
+    news_poll_interval_seconds: int = int(os.getenv("NEWS_POLL_INTERVAL_SECONDS", "60"))
+    news_store_capacity: int = int(os.getenv("NEWS_STORE_CAPACITY", "2000"))
+    news_watchlist_symbols: str = os.getenv("NEWS_WATCHLIST_SYMBOLS", "SPY,QQQ,AAPL,MSFT,NVDA")
+    news_symbol_fetch_ttl_seconds: int = int(os.getenv("NEWS_SYMBOL_FETCH_TTL_SECONDS", "900"))  # 워치리스트 외 심볼 업스트림 보충 주기
+    
+    # News enrichment (원문 추출, 티커 태깅, 감성 점수 - 선택 기능)
+    news_enrichment_enabled: bool = os.getenv("NEWS_ENRICHMENT_ENABLED", "false").lower() == "true"
+    news_enrichment_fetch_text: bool = os.getenv("NEWS_ENRICHMENT_FETCH_TEXT", "true").lower() == "true"
+    news_enrichment_workers: int = int(os.getenv("NEWS_ENRICHMENT_WORKERS", "0"))  # 0 = CPU 코어 수
+    news_enrichment_batch_size: int = int(os.getenv("NEWS_ENRICHMENT_BATCH_SIZE", "32"))
+    news_enrichment_fetch_concurrency: int = int(os.getenv("NEWS_ENRICHMENT_FETCH_CONCURRENCY", "8"))
+    news_enrichment_fetch_timeout_seconds: float = float(os.getenv("NEWS_ENRICHMENT_FETCH_TIMEOUT_SECONDS", "5"))
+    
+    # Live metrics WebSocket
+    live_metrics_send_queue_size: int = int(os.getenv("LIVE_METRICS_SEND_QUEUE_SIZE", "256"))  # 연결별 송신 큐
+    live_metrics_drop_policy: str = os.getenv("LIVE_METRICS_DROP_POLICY", "coalesce")  # drop_oldest | coalesce | disconnect
+    live_metrics_send_timeout_seconds: float = float(os.getenv("LIVE_METRICS_SEND_TIMEOUT_SECONDS", "5"))
+    live_metrics_max_routes: int = int(os.getenv("LIVE_METRICS_MAX_ROUTES", "64"))  # 라우트별 집계 상한 (Top-K)
+    live_metrics_route_keyframe_ticks: int = int(os.getenv("LIVE_METRICS_ROUTE_KEYFRAME_TICKS", "10"))  # 라우트 전체 스냅샷 주기
+    live_metrics_sample_rate: float = float(os.getenv("LIVE_METRICS_SAMPLE_RATE", "1.0"))  # new_request 일반 요청 샘플링 비율
+    live_metrics_sample_max_per_tick: int = int(os.getenv("LIVE_METRICS_SAMPLE_MAX_PER_TICK", "50"))  # 틱(1초)당 new_request 상한
+    live_metrics_slow_request_ms: float = float(os.getenv("LIVE_METRICS_SLOW_REQUEST_MS", "1000"))  # 항상 전송할 느린 요청 기준
+    live_metrics_backplane: str = os.getenv("LIVE_METRICS_BACKPLANE", "none")  # none | unix | redis (워커/레플리카 간 집계 공유)
+    live_metrics_backplane_socket: str = os.getenv("LIVE_METRICS_BACKPLANE_SOCKET", "/tmp/etf-agent-live-metrics.sock")
+    live_metrics_redis_url: str = os.getenv("LIVE_METRICS_REDIS_URL", "")
+    live_metrics_redis_channel: str = os.getenv("LIVE_METRICS_REDIS_CHANNEL", "live-metrics")
+    live_metrics_history_path: str = os.getenv("LIVE_METRICS_HISTORY_PATH", "")  # 빈 값이면 비활성화
+    live_metrics_history_minutes: int = int(os.getenv("LIVE_METRICS_HISTORY_MINUTES", "10080"))  # 링 파일 보관 분 수 (7일)
+    
     # OpenAI
     openai_api_key: str = os.getenv("OPENAI_API_KEY", "")
     openai_org_id: str = os.getenv("OPENAI_ORG_ID", "")
@@ -2,6 +2,7 @@
 ETF Agent Main Module
 FastAPI 서버 진입점
 """
+import asyncio
 import logging
 from pathlib import Path
 
@@ -15,6 +16,9 @@ from opentelemetry.sdk.resources import Resource
 from .api.v1 import analytics, chat, etf, insights, live_metrics, news, stocks
 from .observability import (TracingMiddleware, initialize_metrics,
                             setup_telemetry)
+from .services import (get_news_enrichment_service,
+                       get_news_ingestion_service)
+from .services.retention_service import run_compaction_loop
 
 app = FastAPI(
     title="ETF Agent API",
@@ -44,6 +48,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor"],  # ETF 목록 페이지네이션 cursor
 )
 
 # 커스텀 메트릭 초기화 (Live Metrics용)
@@ -61,6 +66,28 @@ app.include_router(analytics.router)
 app.include_router(insights.router)
 app.include_router(live_metrics.router)
 
+# 백그라운드 작업 (태스크 참조 유지)
+background_tasks: set = set()
+
+
+@app.on_event("startup")
+async def start_background_jobs():
+    """백그라운드 작업 시작 - 스냅샷 압축 및 보존 정책, 뉴스 수집/보강"""
+    task = asyncio.create_task(run_compaction_loop())
+    background_tasks.add(task)
+    task.add_done_callback(background_tasks.discard)
+    logger.info("🗜️ 스냅샷 압축 작업 시작")
+    
+    get_news_ingestion_service().ensure_started()
+    get_news_enrichment_service().ensure_started()
+
+
+@app.on_event("shutdown")
+async def stop_background_jobs():
+    """백그라운드 작업 종료"""
+    await get_news_enrichment_service().stop()
+    await get_news_ingestion_service().stop()
+
 # Frontend 정적 파일 서빙
 frontend_build_path = Path(__file__).parent.parent / "frontend" / "build"
 if frontend_build_path.exists():
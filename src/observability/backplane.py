@@ -0,0 +1,295 @@
+"""
+Live Metrics 집계 백플레인
+여러 uvicorn 워커/Container App 레플리카가 초 단위 트래픽 델타(카운터 + 지연 스케치)를 주고받아
+각 프로세스의 대시보드가 서비스 전체 트래픽을 보여주도록 합니다.
+
+- unix: 같은 호스트의 워커 간 Unix 도메인 소켓 (먼저 바인드한 워커가 허브로서 중계)
+- redis: 레플리카 간 Redis pub/sub (redis 패키지가 설치된 경우에만)
+"""
+import asyncio
+import json
+import logging
+import os
+import random
+from abc import ABC, abstractmethod
+from typing import Any, Callable, Dict, Optional, Set
+
+try:
+    import fcntl
+except ImportError:  # Windows - Unix 소켓 백플레인 미지원
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+MessageHandler = Callable[[Dict[str, Any]], None]
+
+# 피어별 송신 버퍼 상한 (초과 시 해당 피어로의 메시지는 버림 - 메트릭은 최선 노력 전달)
+MAX_PEER_BUFFER = 4 * 1024 * 1024
+
+
+class MetricsBackplane(ABC):
+    """집계 델타 송수신 인터페이스"""
+
+    @abstractmethod
+    async def start(self, on_message: MessageHandler):
+        """수신 시작 (on_message는 이벤트 루프에서 호출됨, 자기 메시지는 전달되지 않을 수 있음)"""
+
+    @abstractmethod
+    async def publish(self, message: Dict[str, Any]):
+        """다른 프로세스로 메시지 전송"""
+
+    @abstractmethod
+    async def stop(self):
+        """연결 종료"""
+
+
+def _encode(message: Dict[str, Any]) -> bytes:
+    return json.dumps(message, separators=(",", ":")).encode("utf-8") + b"\n"
+
+
+class UnixSocketBackplane(MetricsBackplane):
+    """
+    같은 호스트의 워커 간 백플레인
+
+    소켓 경로에 먼저 바인드한 워커가 허브가 되어 다른 워커의 메시지를 나머지 워커에 중계합니다.
+    허브가 종료되면 나머지 워커가 재연결을 시도하며 그중 하나가 새 허브가 됩니다.
+    허브는 살아 있는 동안 path + ".lock" 파일 잠금(flock)을 쥐고 있어, 허브가 강제 종료되어
+    소켓 파일이 남아도 잠금을 얻은 워커 하나만 소켓을 지우고 새 허브가 됩니다.
+    """
+
+    def __init__(self, path: str, reconnect_delay: float = 1.0):
+        self.path = path
+        self.reconnect_delay = reconnect_delay
+        self.is_hub = False
+        self._on_message: Optional[MessageHandler] = None
+        self._task: Optional[asyncio.Task] = None
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._peers: Set[asyncio.StreamWriter] = set()  # 허브: 연결된 워커들
+        self._hub: Optional[asyncio.StreamWriter] = None  # 워커: 허브 연결
+        self._hub_lock_fd: Optional[int] = None  # 허브: 허브 잠금 파일
+
+    async def start(self, on_message: MessageHandler):
+        self._on_message = on_message
+        self._task = asyncio.create_task(self._run())
+
+    async def publish(self, message: Dict[str, Any]):
+        line = _encode(message)
+        if self.is_hub:
+            self._write_all(line)
+        elif self._hub is not None:
+            self._write(self._hub, line)
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        await self._close_server()
+        if self._hub is not None:
+            self._hub.close()
+            self._hub = None
+
+    async def _run(self):
+        while True:
+            try:
+                reader, writer = await asyncio.open_unix_connection(self.path)
+            except (FileNotFoundError, ConnectionRefusedError):
+                if await self._become_hub():
+                    logger.info(f"🛰️ Live Metrics 백플레인 허브: {self.path}")
+                    await asyncio.Event().wait()  # stop()까지 허브 유지
+                await asyncio.sleep(self.reconnect_delay * random.uniform(0.5, 1.5))
+                continue
+            except OSError as e:
+                logger.warning(f"백플레인 연결 실패: {e}")
+                await asyncio.sleep(self.reconnect_delay)
+                continue
+
+            logger.info(f"🛰️ Live Metrics 백플레인 허브에 연결: {self.path}")
+            self._hub = writer
+            try:
+                await self._read_lines(reader)
+            finally:
+                self._hub = None
+                writer.close()
+            # 허브 종료 - 잠시 후 재연결 또는 허브 승계
+            await asyncio.sleep(self.reconnect_delay * random.uniform(0.1, 1.0))
+
+    async def _become_hub(self) -> bool:
+        if not self._acquire_hub_lock():
+            return False  # 다른 워커가 허브이거나 허브가 되는 중
+        try:
+            if os.path.exists(self.path):
+                os.unlink(self.path)  # 종료된 허브가 남긴 소켓 파일 (잠금을 쥔 허브가 없으므로 안전)
+            self._server = await asyncio.start_unix_server(self._serve_peer, path=self.path)
+        except OSError as e:
+            logger.warning(f"백플레인 허브 바인드 실패: {e}")
+            self._release_hub_lock()
+            return False
+        self.is_hub = True
+        return True
+
+    def _acquire_hub_lock(self) -> bool:
+        """허브 잠금 시도 (논블로킹, 허브인 동안 유지 - 프로세스가 죽으면 OS가 해제)"""
+        if fcntl is None:
+            return True
+        fd = os.open(self.path + ".lock", os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            os.close(fd)
+            return False
+        self._hub_lock_fd = fd
+        return True
+
+    def _release_hub_lock(self):
+        if self._hub_lock_fd is not None:
+            os.close(self._hub_lock_fd)  # 닫으면 flock도 해제됨
+            self._hub_lock_fd = None
+
+    async def _close_server(self):
+        if self._server is None:
+            return
+        self._server.close()
+        for peer in list(self._peers):
+            peer.close()
+        self._peers.clear()
+        await self._server.wait_closed()
+        self._server = None
+        self.is_hub = False
+        try:
+            os.unlink(self.path)
+        except OSError:
+            pass
+        self._release_hub_lock()
+
+    async def _serve_peer(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self._peers.add(writer)
+        try:
+            await self._read_lines(reader, relay_from=writer)
+        finally:
+            self._peers.discard(writer)
+            writer.close()
+
+    async def _read_lines(self, reader: asyncio.StreamReader, relay_from: Optional[asyncio.StreamWriter] = None):
+        while True:
+            try:
+                line = await reader.readline()
+            except (ConnectionError, ValueError) as e:
+                logger.warning(f"백플레인 수신 오류: {e}")
+                return
+            if not line:
+                return
+            if relay_from is not None:
+                self._write_all(line, exclude=relay_from)
+            try:
+                message = json.loads(line)
+            except ValueError:
+                continue
+            if self._on_message is not None:
+                self._on_message(message)
+
+    def _write_all(self, line: bytes, exclude: Optional[asyncio.StreamWriter] = None):
+        for peer in list(self._peers):
+            if peer is not exclude:
+                self._write(peer, line)
+
+    @staticmethod
+    def _write(writer: asyncio.StreamWriter, line: bytes):
+        if writer.is_closing() or writer.transport.get_write_buffer_size() > MAX_PEER_BUFFER:
+            return
+        writer.write(line)
+
+
+class RedisBackplane(MetricsBackplane):
+    """
+    레플리카 간 Redis pub/sub 백플레인
+
+    redis 패키지는 이 백플레인을 사용할 때만 import합니다 (pip install redis).
+    """
+
+    def __init__(self, url: str, channel: str):
+        self.url = url
+        self.channel = channel
+        self._client = None
+        self._pubsub = None
+        self._task: Optional[asyncio.Task] = None
+
+    async def start(self, on_message: MessageHandler):
+        try:
+            import redis.asyncio as redis
+        except ImportError as e:
+            raise RuntimeError("redis 백플레인을 사용하려면 redis 패키지가 필요합니다 (pip install redis)") from e
+
+        self._client = redis.from_url(self.url)
+        self._pubsub = self._client.pubsub(ignore_subscribe_messages=True)
+        await self._pubsub.subscribe(self.channel)
+        self._task = asyncio.create_task(self._listen(on_message))
+        logger.info(f"🛰️ Live Metrics Redis 백플레인 구독: {self.channel}")
+
+    async def _listen(self, on_message: MessageHandler):
+        while True:
+            try:
+                async for item in self._pubsub.listen():
+                    if item.get("type") != "message":
+                        continue
+                    try:
+                        on_message(json.loads(item["data"]))
+                    except ValueError:
+                        continue
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"Redis 백플레인 수신 오류, 재구독: {type(e).__name__} {e}")
+                await asyncio.sleep(1)
+                try:
+                    await self._pubsub.subscribe(self.channel)
+                except Exception:
+                    pass
+
+    async def publish(self, message: Dict[str, Any]):
+        if self._client is None:
+            return
+        try:
+            await self._client.publish(self.channel, _encode(message))
+        except Exception as e:
+            logger.warning(f"Redis 백플레인 전송 실패: {type(e).__name__} {e}")
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        if self._pubsub is not None:
+            await self._pubsub.aclose()
+            self._pubsub = None
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+
+def create_backplane(kind: str, socket_path: str = "", redis_url: str = "",
+                     redis_channel: str = "live-metrics") -> Optional[MetricsBackplane]:
+    """
+    설정에 맞는 백플레인 생성
+
+    LIVE_METRICS_BACKPLANE:
+        - none: 사용 안 함 (프로세스별 집계, 기본값)
+        - unix: 같은 호스트 워커 간 Unix 소켓 (LIVE_METRICS_BACKPLANE_SOCKET)
+        - redis: 레플리카 간 Redis pub/sub (LIVE_METRICS_REDIS_URL)
+    """
+    kind = (kind or "none").lower()
+    if kind == "unix":
+        return UnixSocketBackplane(socket_path)
+    if kind == "redis":
+        if not redis_url:
+            raise ValueError("LIVE_METRICS_REDIS_URL이 설정되지 않았습니다")
+        return RedisBackplane(redis_url, redis_channel)
+    if kind != "none":
+        logger.warning(f"알 수 없는 백플레인 '{kind}', 사용하지 않습니다")
+    return None
@@ -0,0 +1,263 @@
+"""
+Container App 로그 파서
+az containerapp logs show 출력 한 줄을 Live Metrics 요청 로그로 변환합니다.
+
+정규식 대신 첫 글자로 형식을 나눈 뒤 문자열 연산으로 읽습니다.
+- {...}  az 로그 봉투 {"TimeStamp", "Log"} (Log를 다시 파싱) 또는 resultCode/status가 있는 요청 JSON
+- INFO:  uvicorn 접근 로그 - INFO:     10.0.0.1:1234 - "GET /path HTTP/1.1" 200 OK (지연 없음)
+- 숫자   CRI 접두사 (2024-05-01T12:00:00.123456789Z stdout F ...)
+         또는 logging asctime (2024-05-01 12:00:00,123 - src.observability.middleware - INFO - ⚡ ...)
+- ⚡     TracingMiddleware 요청 로그 - ⚡ GET /path | Status: 200 | Duration: 12.3ms
+
+JSON은 orjson이 설치되어 있으면 orjson, 없으면 표준 json으로 읽습니다.
+"""
+import calendar
+import json
+import re
+import time
+from typing import Any, Dict, NamedTuple, Optional
+from urllib.parse import urlsplit
+
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:  # 선택 의존성 - 표준 json (줄은 이미 strip되어 있어 앞뒤 공백 검사 생략)
+    _raw_decode = json.JSONDecoder().raw_decode
+
+    def _loads(text: str) -> Any:
+        return _raw_decode(text)[0]
+
+# 요청 로그일 수 있는 JSON 줄의 표식 (나머지 앱 로그는 JSON 디코딩 전에 거름)
+_REQUEST_MARKERS = ("⚡", "\\u26a1", " HTTP/", "resultCode", '"status"')
+
+SOURCE_ACCESS = "access"  # uvicorn 접근 로그 (지연 없음)
+SOURCE_APP = "app"        # TracingMiddleware ⚡ 로그 (지연 포함)
+SOURCE_JSON = "json"      # 요청 JSON (App Insights 형식)
+
+# 접두사로 판별되지 않는 줄 (앞에 다른 접두사가 붙은 접근 로그)
+_ACCESS_RE = re.compile(r'(\w+):\s+[\d\.:]+\s+-\s+"(\w+)\s+(\S+)\s+HTTP/[\d\.]+"\s+(\d{3})')
+
+_CACHE_LIMIT = 4096
+_second_cache: Dict[str, int] = {}  # 타임스탬프 앞 19자 (초 단위) -> epoch 초
+_iso_cache: Dict[int, str] = {}     # epoch 초 -> YYYY-MM-DDTHH:MM:SS
+
+
+class ParsedLog(NamedTuple):
+    """파싱된 요청 로그 한 건"""
+    source: str                 # SOURCE_ACCESS / SOURCE_APP / SOURCE_JSON
+    at: Optional[float]         # 로그 시각 (epoch 초, 로그에 시각이 없으면 None)
+    log_data: Dict[str, Any]    # manager.add_request_log 형식
+
+
+def parse_timestamp(text: str) -> Optional[float]:
+    """
+    ISO 8601 / asctime 타임스탬프를 epoch 초로 변환
+
+    2024-05-01T12:00:00.1234567+00:00, 2024-05-01T12:00:00.123456789Z, 2024-05-01 12:00:00,123 형식.
+    시간대가 없으면 UTC로 봅니다 (컨테이너 기본 시간대). 같은 초의 앞부분은 캐시합니다.
+    """
+    key = text[:19]
+    base = _second_cache.get(key)
+    if base is None:
+        if len(key) != 19 or key[4] != "-" or key[7] != "-" or key[13] != ":" or key[16] != ":":
+            return None
+        try:
+            base = calendar.timegm((
+                int(key[0:4]), int(key[5:7]), int(key[8:10]),
+                int(key[11:13]), int(key[14:16]), int(key[17:19]),
+            ))
+        except ValueError:
+            return None
+        if len(_second_cache) >= _CACHE_LIMIT:
+            _second_cache.clear()
+        _second_cache[key] = base
+
+    rest = text[19:]
+    if not rest:
+        return float(base)
+
+    # 시간대 접미사: Z / +HH:MM / +HHMM / 없음(UTC)
+    offset = 0
+    if rest[-1] in "Zz":
+        rest = rest[:-1]
+    elif len(rest) >= 6 and rest[-3] == ":" and rest[-6] in "+-":
+        offset, rest = _offset(rest[-6], rest[-5:-3], rest[-2:]), rest[:-6]
+    elif len(rest) >= 5 and rest[-5] in "+-" and rest[-4:].isdigit():
+        offset, rest = _offset(rest[-5], rest[-4:-2], rest[-2:]), rest[:-5]
+    if offset is None:
+        return None
+
+    if not rest:
+        return float(base - offset)
+    if rest[0] not in ".," or not rest[1:].isdigit():
+        return None
+    return base - offset + float("0." + rest[1:])
+
+
+def _offset(sign: str, hours: str, minutes: str) -> Optional[int]:
+    if not (hours.isdigit() and minutes.isdigit()):
+        return None
+    offset = int(hours) * 3600 + int(minutes) * 60
+    return offset if sign == "+" else -offset
+
+
+def format_timestamp(at: float) -> str:
+    """epoch 초 -> 2024-05-01T12:00:00.123Z (밀리초, UTC)"""
+    second = int(at)
+    prefix = _iso_cache.get(second)
+    if prefix is None:
+        if len(_iso_cache) >= _CACHE_LIMIT:
+            _iso_cache.clear()
+        prefix = _iso_cache[second] = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(second))
+    return f"{prefix}.{int((at - second) * 1000):03d}Z"
+
+
+def _request(source: str, stamp: Optional[str], method: str, path: str,
+             status_code: int, duration: float) -> ParsedLog:
+    at = parse_timestamp(stamp) if stamp else None
+    return ParsedLog(source, at, {
+        'timestamp': format_timestamp(time.time() if at is None else at),
+        'method': method,
+        'path': path,
+        'status_code': status_code,
+        'duration': duration,
+    })
+
+
+def _parse_access(message: str, stamp: Optional[str]) -> Optional[ParsedLog]:
+    """INFO:     10.0.0.1:1234 - "GET /path?q=1 HTTP/1.1" 200 OK"""
+    start = message.find('"')
+    if start < 0:
+        return None
+    end = message.find('"', start + 1)
+    if end < 0:
+        return None
+    request = message[start + 1:end].split(" ")
+    status = message[end + 2:end + 5]
+    if len(request) != 3 or not status.isdigit():
+        return None
+    return _request(SOURCE_ACCESS, stamp, request[0], request[1].split("?", 1)[0], int(status), 0)
+
+
+def _parse_app(message: str, stamp: Optional[str]) -> Optional[ParsedLog]:
+    """... ⚡ GET /path | Status: 200 | Duration: 12.3ms"""
+    index = message.find("⚡ ")
+    if index < 0:
+        return None
+    parts = message[index + 2:].split(" | ")
+    if len(parts) != 3 or not parts[1].startswith("Status: ") or not parts[2].startswith("Duration: "):
+        return None
+    method, _, path = parts[0].partition(" ")
+    try:
+        status_code = int(parts[1][8:])
+        duration = float(parts[2][10:].rstrip().removesuffix("ms"))
+    except ValueError:
+        return None
+    return _request(SOURCE_APP, stamp, method, path, status_code, duration)
+
+
+def _parse_duration(value: Any) -> float:
+    """밀리초 숫자 또는 App Insights 형식 문자열 (00:00:00.1234567)"""
+    if isinstance(value, (int, float)):
+        return float(value)
+    if isinstance(value, str):
+        if ":" in value:
+            hours, minutes, seconds = value.split(":")
+            return (int(hours) * 3600 + int(minutes) * 60 + float(seconds)) * 1000
+        return float(value)
+    return 0.0
+
+
+def _parse_json(text: str, stamp: Optional[str]) -> Optional[ParsedLog]:
+    for marker in _REQUEST_MARKERS:
+        if marker in text:
+            break
+    else:
+        return None
+    try:
+        data = _loads(text)
+    except ValueError:
+        return None
+    if not isinstance(data, dict):
+        return None
+
+    inner = data.get("Log")
+    if isinstance(inner, str):
+        # az containerapp logs show 봉투: {"TimeStamp": "...", "Log": "F INFO: ..."}
+        if isinstance(data.get("TimeStamp"), str):
+            stamp = data["TimeStamp"]
+        inner = inner.strip()
+        if inner[:2] in ("F ", "P "):  # CRI 스트림 플래그
+            inner = inner[2:]
+        return _parse_message(inner, stamp)
+
+    if "resultCode" not in data and "status" not in data:
+        return None
+    if isinstance(data.get("timestamp"), str):
+        stamp = data["timestamp"]
+    url = str(data.get("url") or "/")
+    try:
+        status_code = int(data.get("resultCode", data.get("status", 200)))
+        duration = _parse_duration(data.get("duration", 0))
+    except (TypeError, ValueError):
+        return None
+    path = (urlsplit(url).path or "/") if "://" in url else url.split("?", 1)[0]
+    return _request(SOURCE_JSON, stamp, data.get("method", "GET"), path, status_code, duration)
+
+
+def _parse_timestamped(line: str, stamp: Optional[str]) -> Optional[ParsedLog]:
+    if line[10:11] == " " and line[23:26] == " - ":
+        # logging asctime: 2024-05-01 12:00:00,123 - 이름 - 레벨 - 메시지 (요청 로그만 관심)
+        if "⚡ " not in line:
+            return None
+        return _parse_app(line[26:], line[:23])
+
+    # CRI: <RFC3339Nano> stdout|stderr F|P <메시지>
+    cri_stamp, _, rest = line.partition(" ")
+    if not rest.startswith(("stdout ", "stderr ")):
+        return None
+    message = rest[7:]
+    if message[:2] in ("F ", "P "):
+        message = message[2:]
+    return _parse_message(message, cri_stamp)
+
+
+def _parse_message(message: str, stamp: Optional[str]) -> Optional[ParsedLog]:
+    if not message:
+        return None
+    first = message[0]
+    if first == "{":
+        return _parse_json(message, stamp)
+    if first == "I" and message.startswith("INFO:"):
+        return _parse_access(message, stamp)
+    if first.isdigit():
+        return _parse_timestamped(message, stamp)
+    if "⚡ " in message:
+        return _parse_app(message, stamp)
+    return None
+
+
+def parse_log_line(line: str) -> Optional[ParsedLog]:
+    """
+    로그 한 줄 파싱
+
+    Returns:
+        요청 로그가 아니면 None
+    """
+    line = line.strip()
+    parsed = _parse_message(line, None)
+    if parsed is not None or not line:
+        return parsed
+
+    # 알 수 없는 접두사가 붙은 줄 - 접근 로그/JSON을 줄 안에서 찾음
+    if "HTTP/" in line:
+        match = _ACCESS_RE.search(line)
+        if match:
+            return _request(SOURCE_ACCESS, None, match.group(2), match.group(3).split("?", 1)[0],
+                            int(match.group(4)), 0)
+    start = line.find("{")
+    if start > 0:
+        end = line.rfind("}")
+        if end > start:
+            return _parse_json(line[start:end + 1], None)
+    return None
@@ -0,0 +1,64 @@
+"""
+Top-K 빈발 항목 (SpaceSaving)
+최대 capacity개의 키만 추적하며, 가득 찬 상태에서 새 키가 들어오면 가장 빈도가 낮은 키를 대체합니다.
+라우트별 메트릭의 카디널리티 상한으로 사용합니다.
+"""
+from typing import Dict, List, Optional, Tuple
+
+
+class SpaceSaving:
+    """
+    SpaceSaving 알고리즘
+
+    추적 중인 키의 count는 실제 빈도의 상한이며, count - error가 하한입니다.
+    빈도가 N/capacity를 넘는 키는 반드시 추적됩니다.
+    """
+
+    def __init__(self, capacity: int):
+        self.capacity = max(1, capacity)
+        self.counts: Dict[str, int] = {}
+        self.errors: Dict[str, int] = {}
+
+    def offer(self, key: str, weight: int = 1) -> Optional[str]:
+        """
+        키 관측
+
+        Returns:
+            새 키를 넣기 위해 밀려난 키 (없으면 None)
+        """
+        counts = self.counts
+        if key in counts:
+            counts[key] += weight
+            return None
+        if len(counts) < self.capacity:
+            counts[key] = weight
+            self.errors[key] = 0
+            return None
+
+        evicted = min(counts, key=counts.__getitem__)
+        floor = counts.pop(evicted)
+        del self.errors[evicted]
+        counts[key] = floor + weight
+        self.errors[key] = floor
+        return evicted
+
+    def is_heavy(self, key: str, min_count: int = 2) -> bool:
+        """
+        별도 집계할 가치가 있는 키인지
+
+        밀어내기 없이 들어온 키(정확한 빈도)이거나, 보장 빈도(count - error)가 min_count 이상이면 True.
+        표가 가득 찬 뒤 한두 번 나타나는 키(원시 URL 스캔 등)는 False입니다.
+        """
+        count = self.counts.get(key)
+        if count is None:
+            return False
+        error = self.errors[key]
+        return error == 0 or count - error >= min_count
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.counts
+
+    def top(self, k: Optional[int] = None) -> List[Tuple[str, int]]:
+        """빈도 내림차순 (키, 추정 빈도)"""
+        ranked = sorted(self.counts.items(), key=lambda item: item[1], reverse=True)
+        return ranked if k is None else ranked[:k]
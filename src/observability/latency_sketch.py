@@ -0,0 +1,129 @@
+"""
+지연 시간 분위수 스케치 (DDSketch)
+상대 오차 보장 로그 버킷 히스토그램으로, 요청당 O(1) 기록과 스케치 간 병합(merge)을 지원합니다.
+초 단위 버킷의 스케치를 합쳐 임의 윈도우의 p50/p95/p99를 계산하는 데 사용합니다.
+"""
+import math
+from typing import Any, Dict, Iterable, Optional
+
+DEFAULT_RELATIVE_ACCURACY = 0.01
+DEFAULT_MAX_BINS = 2048
+
+
+class DDSketch:
+    """
+    DDSketch (양수 값 전용)
+
+    값 x는 키 ceil(log_gamma(x)) 버킷에 집계되며, 분위수 추정값은
+    실제 값 대비 relative_accuracy 이내의 상대 오차를 가집니다.
+    """
+
+    __slots__ = ("relative_accuracy", "max_bins", "_gamma", "_multiplier",
+                 "bins", "zero_count", "count", "sum", "min", "max")
+
+    def __init__(self, relative_accuracy: float = DEFAULT_RELATIVE_ACCURACY,
+                 max_bins: int = DEFAULT_MAX_BINS):
+        self.relative_accuracy = relative_accuracy
+        self.max_bins = max_bins
+        self._gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._multiplier = 1 / math.log(self._gamma)
+        self.bins: Dict[int, int] = {}
+        self.zero_count = 0
+        self.count = 0
+        self.sum = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+
+    def add(self, value: float):
+        """값 1개 기록"""
+        self.count += 1
+        self.sum += value
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+        if value <= 0:
+            self.zero_count += 1
+            return
+        key = math.ceil(math.log(value) * self._multiplier)
+        bins = self.bins
+        bins[key] = bins.get(key, 0) + 1
+        if len(bins) > self.max_bins:
+            self._collapse()
+
+    def merge(self, other: "DDSketch"):
+        """같은 정확도의 다른 스케치를 합침"""
+        if other.count == 0:
+            return
+        if other.relative_accuracy != self.relative_accuracy:
+            raise ValueError("relative_accuracy가 다른 스케치는 병합할 수 없습니다")
+        bins = self.bins
+        for key, count in other.bins.items():
+            bins[key] = bins.get(key, 0) + count
+        self.zero_count += other.zero_count
+        self.count += other.count
+        self.sum += other.sum
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        if len(bins) > self.max_bins:
+            self._collapse()
+
+    def _collapse(self):
+        """버킷 수 상한 초과 시 가장 낮은 키들을 하나로 합침 (꼬리 분위수 정확도 유지)"""
+        keys = sorted(self.bins)
+        excess = len(keys) - self.max_bins + 1
+        target = keys[excess]
+        self.bins[target] += sum(self.bins.pop(key) for key in keys[:excess])
+
+    def value(self, key: int) -> float:
+        """버킷 키의 대표값"""
+        return 2 * self._gamma ** key / (self._gamma + 1)
+
+    def quantile(self, q: float) -> Optional[float]:
+        """q 분위수 (0~1), 비어 있으면 None"""
+        if self.count == 0:
+            return None
+        rank = q * (self.count - 1)
+        cumulative = self.zero_count
+        if cumulative > rank:
+            return max(0.0, self.min)
+        for key in sorted(self.bins):
+            cumulative += self.bins[key]
+            if cumulative > rank:
+                return min(max(self.value(key), self.min), self.max)
+        return self.max
+
+    def percentiles(self, quantiles: Iterable[float] = (0.5, 0.95, 0.99)) -> Dict[str, Optional[float]]:
+        """{"p50": ..., "p95": ..., "p99": ...} 형태의 분위수"""
+        return {f"p{round(q * 100):g}": self.quantile(q) for q in quantiles}
+
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON 직렬화용 (워커/레플리카 간 병합 전송)"""
+        return {
+            "bins": {str(key): count for key, count in self.bins.items()},
+            "zero": self.zero_count,
+            "count": self.count,
+            "sum": self.sum,
+            "min": self.min if self.count else None,
+            "max": self.max if self.count else None,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "DDSketch":
+        sketch = cls()
+        sketch.bins = {int(key): count for key, count in data.get("bins", {}).items()}
+        sketch.zero_count = data.get("zero", 0)
+        sketch.count = data.get("count", 0)
+        sketch.sum = data.get("sum", 0.0)
+        if sketch.count:
+            sketch.min = data["min"]
+            sketch.max = data["max"]
+        return sketch
+
+    @classmethod
+    def merged(cls, sketches: Iterable["DDSketch"]) -> "DDSketch":
+        """여러 스케치를 합친 새 스케치"""
+        result = cls()
+        for sketch in sketches:
+            result.merge(sketch)
+        return result
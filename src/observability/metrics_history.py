@@ -0,0 +1,246 @@
+"""
+분 단위 메트릭 히스토리 (메모리 맵 링 파일)
+분당 고정 크기 레코드를 capacity 분 크기의 링 파일에 저장해 재시작 후에도 과거 트래픽을 조회합니다.
+슬롯 위치는 (분 % capacity)이고 각 슬롯에 분 값을 함께 저장하므로 별도 인덱스 없이 O(조회 구간)으로 읽습니다.
+"""
+import logging
+import math
+import mmap
+import os
+import struct
+from contextlib import contextmanager
+from typing import Any, Dict, List, Optional
+
+try:
+    import fcntl
+except ImportError:  # Windows - 프로세스 간 잠금 없이 동작
+    fcntl = None
+
+from .latency_sketch import DDSketch
+
+logger = logging.getLogger(__name__)
+
+MAGIC = b"LMH1"
+HEADER = struct.Struct("<4sHHI")  # magic, version, record_size, capacity
+HEADER_SIZE = 64
+VERSION = 1
+
+STATUS_CLASSES = ("2xx", "3xx", "4xx", "5xx")
+
+# 분위수용 거친 로그 히스토그램 (상대 오차 약 11%, 1ms ~ 약 27분)
+HISTOGRAM_BINS = 64
+HISTOGRAM_GAMMA = 1.25
+_LOG_GAMMA = math.log(HISTOGRAM_GAMMA)
+
+# 분 시작(epoch 초), 요청 수, 오류 수, 지연 합계, 최대 지연, 상태 코드 클래스별 수, 히스토그램
+RECORD = struct.Struct(f"<qIIdd{len(STATUS_CLASSES)}I{HISTOGRAM_BINS}I")
+
+# 조회 해상도 -> 분
+RESOLUTIONS: Dict[str, int] = {
+    "1m": 1,
+    "5m": 5,
+    "1h": 60,
+}
+
+
+def _histogram_bin(value: float) -> int:
+    if value <= 1:
+        return 0
+    return min(HISTOGRAM_BINS - 1, math.ceil(math.log(value) / _LOG_GAMMA))
+
+
+def _bin_value(index: int) -> float:
+    return 2 * HISTOGRAM_GAMMA ** index / (HISTOGRAM_GAMMA + 1)
+
+
+def sketch_to_histogram(sketch: DDSketch) -> List[int]:
+    """DDSketch를 저장용 거친 히스토그램으로 변환"""
+    histogram = [0] * HISTOGRAM_BINS
+    histogram[0] += sketch.zero_count
+    for key, count in sketch.bins.items():
+        histogram[_histogram_bin(sketch.value(key))] += count
+    return histogram
+
+
+def histogram_quantile(histogram: List[int], q: float) -> Optional[float]:
+    """히스토그램 q 분위수 (비어 있으면 None)"""
+    total = sum(histogram)
+    if total == 0:
+        return None
+    rank = q * (total - 1)
+    cumulative = 0
+    for index, count in enumerate(histogram):
+        cumulative += count
+        if cumulative > rank:
+            return _bin_value(index)
+    return _bin_value(HISTOGRAM_BINS - 1)
+
+
+class MetricsHistory:
+    """분 단위 레코드 링 파일"""
+
+    def __init__(self, path: str, capacity: int = 7 * 24 * 60):
+        self.path = path
+        self.capacity = capacity
+        size = HEADER_SIZE + capacity * RECORD.size
+
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        # O_BINARY: Windows에서 텍스트 모드 변환 방지
+        self._fd = os.open(path, os.O_RDWR | os.O_CREAT | getattr(os, "O_BINARY", 0), 0o644)
+        self._writer_lock_fd: Optional[int] = None
+        try:
+            # 동시에 시작한 다른 워커가 이미 매핑한 파일을 잘라내지 않도록 검사/초기화를 잠금 안에서
+            with self._locked():
+                if os.fstat(self._fd).st_size != size or not self._valid_header():
+                    if os.fstat(self._fd).st_size:
+                        logger.warning(f"히스토리 파일 형식/크기 불일치, 초기화합니다: {path}")
+                    os.ftruncate(self._fd, 0)
+                    os.ftruncate(self._fd, size)
+                    os.lseek(self._fd, 0, os.SEEK_SET)
+                    os.write(self._fd, HEADER.pack(MAGIC, VERSION, RECORD.size, capacity))
+                self._mmap = mmap.mmap(self._fd, size)
+        except Exception:
+            os.close(self._fd)
+            raise
+
+    @contextmanager
+    def _locked(self):
+        """레코드 읽기-합산-쓰기 동안 다른 프로세스의 기록 차단"""
+        if fcntl is None:
+            yield
+            return
+        fcntl.flock(self._fd, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(self._fd, fcntl.LOCK_UN)
+
+    def acquire_writer(self) -> bool:
+        """
+        단일 기록자 잠금 시도 (논블로킹, 한 번 얻으면 close까지 유지)
+
+        워커들이 백플레인으로 이미 합쳐진 전체 트래픽을 보고 있을 때
+        한 워커만 기록해 중복 합산을 막는 데 사용합니다.
+        """
+        if self._writer_lock_fd is not None or fcntl is None:
+            return True
+        fd = os.open(self.path + ".lock", os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            os.close(fd)
+            return False
+        self._writer_lock_fd = fd
+        return True
+
+    def _valid_header(self) -> bool:
+        # os.pread는 Windows에 없음
+        os.lseek(self._fd, 0, os.SEEK_SET)
+        data = os.read(self._fd, HEADER.size)
+        return len(data) == HEADER.size and data == HEADER.pack(MAGIC, VERSION, RECORD.size, self.capacity)
+
+    def _offset(self, minute: int) -> int:
+        return HEADER_SIZE + (minute // 60 % self.capacity) * RECORD.size
+
+    def read(self, minute: int) -> Optional[tuple]:
+        """분 시작 시각(epoch 초)의 레코드, 없거나 덮어써졌으면 None"""
+        values = RECORD.unpack_from(self._mmap, self._offset(minute))
+        return values if values[0] == minute else None
+
+    @staticmethod
+    def make_record(minute: int, count: int, errors: int, duration_sum: float, duration_max: float,
+                    statuses: Dict[str, int], latency: DDSketch) -> tuple:
+        """read()와 같은 형식의 분 레코드 (파일에 쓰지 않은 진행 중인 분 조회용)"""
+        return (minute, count, errors, duration_sum, duration_max,
+                *(statuses.get(status, 0) for status in STATUS_CLASSES), *sketch_to_histogram(latency))
+
+    @staticmethod
+    def _merge(record: tuple, other: tuple) -> tuple:
+        """같은 분 레코드 합산"""
+        return (record[0], record[1] + other[1], record[2] + other[2], record[3] + other[3],
+                max(record[4], other[4]), *(a + b for a, b in zip(record[5:], other[5:])))
+
+    def write(self, minute: int, count: int, errors: int, duration_sum: float, duration_max: float,
+              statuses: Dict[str, int], latency: DDSketch):
+        """
+        분 레코드 기록
+
+        같은 분의 레코드가 이미 있으면 합산합니다 (재시작 전후로 나뉜 분, 같은 파일을 쓰는 여러 워커).
+        """
+        record = self.make_record(minute, count, errors, duration_sum, duration_max, statuses, latency)
+        with self._locked():
+            existing = self.read(minute)
+            if existing is not None:
+                record = self._merge(existing, record)
+            RECORD.pack_into(self._mmap, self._offset(minute), *record)
+
+    def query(self, start_minute: int, end_minute: int, step_minutes: int = 1,
+              pending: Optional[Dict[int, tuple]] = None) -> List[Dict[str, Any]]:
+        """
+        [start_minute, end_minute) 구간을 step_minutes 단위로 다운샘플링
+
+        기록이 없는 구간(서버 중단 등)은 포인트를 만들지 않습니다.
+
+        Args:
+            pending: 아직 파일에 쓰지 않은 분 레코드 {분: make_record()} (기록된 레코드와 합산)
+        """
+        start_minute = max(start_minute, end_minute - self.capacity * 60)
+        step = step_minutes * 60
+        start_minute -= start_minute % step
+        pending = pending or {}
+        statuses_offset = 5
+        histogram_offset = statuses_offset + len(STATUS_CLASSES)
+
+        points = []
+        for bucket_start in range(start_minute, end_minute, step):
+            count = errors = 0
+            duration_sum = duration_max = 0.0
+            status_counts = [0] * len(STATUS_CLASSES)
+            histogram = [0] * HISTOGRAM_BINS
+            found = False
+            for minute in range(bucket_start, min(bucket_start + step, end_minute), 60):
+                record = self.read(minute)
+                if minute in pending:
+                    record = pending[minute] if record is None else self._merge(record, pending[minute])
+                if record is None:
+                    continue
+                found = True
+                count += record[1]
+                errors += record[2]
+                duration_sum += record[3]
+                duration_max = max(duration_max, record[4])
+                for i in range(len(STATUS_CLASSES)):
+                    status_counts[i] += record[statuses_offset + i]
+                for i in range(HISTOGRAM_BINS):
+                    histogram[i] += record[histogram_offset + i]
+            if not found:
+                continue
+
+            points.append({
+                "minute": bucket_start,
+                "request_count": count,
+                "error_count": errors,
+                "avg_duration": duration_sum / count if count else 0.0,
+                "max_duration": duration_max,
+                "success_rate": (count - errors) / count * 100 if count else 100.0,
+                "status_classes": {
+                    status: status_count
+                    for status, status_count in zip(STATUS_CLASSES, status_counts) if status_count
+                },
+                "p50": histogram_quantile(histogram, 0.5),
+                "p95": histogram_quantile(histogram, 0.95),
+                "p99": histogram_quantile(histogram, 0.99),
+            })
+        return points
+
+    def flush(self):
+        self._mmap.flush()
+
+    def close(self):
+        if not self._mmap.closed:
+            self._mmap.flush()
+            self._mmap.close()
+            os.close(self._fd)
+        if self._writer_lock_fd is not None:
+            os.close(self._writer_lock_fd)
+            self._writer_lock_fd = None
@@ -140,10 +140,14 @@ class TracingMiddleware(BaseHTTPMiddleware):
                 # Live Metrics에 실시간 트래픽 전송
                 try:
                     from src.api.v1.live_metrics import manager
+
+                    # 라우트 템플릿 (/api/v1/stocks/{symbol}), 매칭되지 않은 요청은 원시 경로
+                    route = getattr(request.scope.get("route"), "path", None) or request.url.path
                     log_data = {
                         'timestamp': time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime(start_time)),
                         'method': request.method,
                         'path': request.url.path,
+                        'route': route,
                         'status_code': status,
                         'duration': duration_ms,
                     }
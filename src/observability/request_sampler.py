@@ -0,0 +1,105 @@
+"""
+요청 이벤트 샘플러
+틱(1초)마다 전송할 개별 요청 이벤트를 고릅니다.
+오류/느린 요청을 먼저 채우고, 나머지는 sample_rate로 거른 뒤 틱당 상한 크기의 저수지 표본(reservoir)으로 뽑습니다.
+"""
+import math
+import random
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+
+
+class SamplingPolicy(NamedTuple):
+    """클라이언트별 new_request 수신 정책 (같은 정책의 클라이언트는 표본/직렬화를 공유)"""
+    sample_rate: float = 1.0       # 일반 요청 샘플링 비율 (0~1)
+    max_per_tick: int = 50         # 틱당 최대 전송 요청 수
+    slow_ms: float = 1000.0        # 이 이상이면 느린 요청으로 항상 포함
+    include_errors: bool = True    # 4xx/5xx 항상 포함
+    batch: bool = False            # True면 틱당 new_request_batch 1개, False면 new_request 개별 전송
+
+    @classmethod
+    def from_message(cls, message: Dict[str, Any], default: "SamplingPolicy") -> "SamplingPolicy":
+        """
+        subscribe 메시지로 정책 생성 (없는 값은 default, 범위 밖 값은 보정)
+
+        Raises:
+            ValueError: 숫자 필드가 유한한 JSON 숫자가 아니거나 불리언 필드가 JSON 불리언이 아닌 경우
+        """
+        return cls(
+            sample_rate=min(1.0, max(0.0, _number(message, "sample_rate", default.sample_rate))),
+            max_per_tick=int(min(1000.0, max(0.0, _number(message, "max_per_tick", default.max_per_tick)))),
+            slow_ms=max(0.0, _number(message, "slow_ms", default.slow_ms)),
+            include_errors=_flag(message, "include_errors", default.include_errors),
+            batch=_flag(message, "batch", default.batch),
+        )
+
+
+def _number(message: Dict[str, Any], key: str, default: float) -> float:
+    """유한한 JSON 숫자만 허용 (true/false, 문자열, NaN/Infinity 거부)"""
+    value = message.get(key, default)
+    if isinstance(value, bool) or not isinstance(value, (int, float)) or not math.isfinite(value):
+        raise ValueError(f"{key}는 유한한 숫자여야 합니다: {value!r}")
+    return float(value)
+
+
+def _flag(message: Dict[str, Any], key: str, default: bool) -> bool:
+    """JSON 불리언만 허용 ("false" 같은 문자열은 참으로 취급하지 않고 거부)"""
+    value = message.get(key, default)
+    if not isinstance(value, bool):
+        raise ValueError(f"{key}는 true/false여야 합니다: {value!r}")
+    return value
+
+
+class RequestSampler:
+    """한 정책의 틱 단위 표본"""
+
+    def __init__(self, policy: SamplingPolicy, rng: Optional[random.Random] = None):
+        self.policy = policy
+        self._rng = rng or random.Random()
+        self._priority: List[Tuple[int, Dict[str, Any]]] = []
+        self._reservoir: List[Tuple[int, Dict[str, Any]]] = []
+        self._seen = 0       # 틱 동안 관측한 전체 요청
+        self._eligible = 0   # 샘플링 비율을 통과한 일반 요청
+
+    def offer(self, log_data: Dict[str, Any]):
+        policy = self.policy
+        seq = self._seen
+        self._seen += 1
+        if policy.max_per_tick == 0:
+            return
+
+        is_error = (log_data.get("status_code") or 200) >= 400
+        if (policy.include_errors and is_error) or (log_data.get("duration") or 0) >= policy.slow_ms:
+            if len(self._priority) < policy.max_per_tick:
+                self._priority.append((seq, log_data))
+            return
+
+        if policy.sample_rate < 1.0 and self._rng.random() >= policy.sample_rate:
+            return
+        self._eligible += 1
+        if len(self._reservoir) < policy.max_per_tick:
+            self._reservoir.append((seq, log_data))
+        else:
+            index = self._rng.randrange(self._eligible)
+            if index < policy.max_per_tick:
+                self._reservoir[index] = (seq, log_data)
+
+    def take(self) -> Tuple[List[Dict[str, Any]], int]:
+        """
+        이번 틱 표본을 꺼내고 초기화
+
+        Returns:
+            (도착 순서의 표본 요청들, 틱 동안 관측한 전체 요청 수)
+        """
+        room = max(0, self.policy.max_per_tick - len(self._priority))
+        reservoir = self._reservoir
+        if len(reservoir) > room:
+            reservoir = self._rng.sample(reservoir, room)
+        chosen = self._priority + reservoir
+        chosen.sort(key=lambda item: item[0])
+        seen = self._seen
+
+        self._priority = []
+        self._reservoir = []
+        self._seen = 0
+        self._eligible = 0
+        return [log_data for _, log_data in chosen], seen
@@ -0,0 +1,376 @@
+"""
+초 단위 트래픽 버킷 링
+최근 15분을 1초 버킷 900개의 고정 링으로 유지하고 1m/5m/15m 슬라이딩 윈도우 통계를 계산합니다.
+분 단위 리스트를 쌓았다가 비우는 방식과 달리 메모리가 요청 수와 무관하게 일정합니다.
+"""
+import time
+from typing import Any, Dict, List, Optional
+
+from .heavy_hitters import SpaceSaving
+from .latency_sketch import DDSketch
+
+# 윈도우 이름 -> 길이 (초)
+WINDOWS: Dict[str, int] = {
+    "1m": 60,
+    "5m": 300,
+    "15m": 900,
+}
+
+# Top-K 밖의 라우트를 합산하는 키
+OTHER_ROUTE = "__other__"
+
+DEFAULT_MAX_ROUTES = 64
+
+
+def status_class(status_code: int) -> str:
+    """200 -> "2xx" """
+    return f"{status_code // 100}xx"
+
+
+class RouteStats:
+    """라우트 하나의 집계 (요청 수, 오류 수, 상태 코드 클래스별 수, 지연 스케치)"""
+
+    __slots__ = ("count", "errors", "duration_sum", "statuses", "latency")
+
+    def __init__(self):
+        self.count = 0
+        self.errors = 0
+        self.duration_sum = 0.0
+        self.statuses: Dict[str, int] = {}
+        self.latency = DDSketch()
+
+    def add(self, duration_ms: float, status: str, is_error: bool):
+        self.count += 1
+        self.duration_sum += duration_ms
+        if is_error:
+            self.errors += 1
+        self.statuses[status] = self.statuses.get(status, 0) + 1
+        self.latency.add(duration_ms)
+
+    def merge(self, other: "RouteStats"):
+        self.count += other.count
+        self.errors += other.errors
+        self.duration_sum += other.duration_sum
+        for status, count in other.statuses.items():
+            self.statuses[status] = self.statuses.get(status, 0) + count
+        self.latency.merge(other.latency)
+
+    def summary(self) -> Dict[str, object]:
+        return {
+            "request_count": self.count,
+            "error_count": self.errors,
+            "avg_duration": self.duration_sum / self.count if self.count else 0.0,
+            "status_classes": dict(self.statuses),
+            **self.latency.percentiles(),
+        }
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "count": self.count,
+            "errors": self.errors,
+            "duration_sum": self.duration_sum,
+            "statuses": self.statuses,
+            "latency": self.latency.to_dict(),
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "RouteStats":
+        stats = cls()
+        stats.count = data["count"]
+        stats.errors = data["errors"]
+        stats.duration_sum = data["duration_sum"]
+        stats.statuses = dict(data["statuses"])
+        stats.latency = DDSketch.from_dict(data["latency"])
+        return stats
+
+
+class TrafficBucket:
+    """1초 구간 집계"""
+
+    __slots__ = ("second", "count", "duration_sum", "duration_max", "errors",
+                 "statuses", "latency", "routes")
+
+    def __init__(self, second: int = -1):
+        self.reset(second)
+
+    def reset(self, second: int):
+        self.second = second
+        self.count = 0
+        self.duration_sum = 0.0
+        self.duration_max = 0.0
+        self.errors = 0
+        self.statuses: Dict[str, int] = {}
+        self.latency = DDSketch()
+        self.routes: Dict[str, RouteStats] = {}
+
+    def add(self, duration_ms: float, status: str, is_error: bool, route: Optional[str]):
+        self.count += 1
+        self.duration_sum += duration_ms
+        if duration_ms > self.duration_max:
+            self.duration_max = duration_ms
+        if is_error:
+            self.errors += 1
+        self.statuses[status] = self.statuses.get(status, 0) + 1
+        self.latency.add(duration_ms)
+        if route is not None:
+            stats = self.routes.get(route)
+            if stats is None:
+                stats = self.routes[route] = RouteStats()
+            stats.add(duration_ms, status, is_error)
+
+    def merge(self, other: "TrafficBucket", max_routes: int):
+        """같은 초의 다른 버킷(다른 워커/레플리카)을 합침, 라우트 수 상한 초과분은 OTHER_ROUTE로"""
+        self.count += other.count
+        self.duration_sum += other.duration_sum
+        self.duration_max = max(self.duration_max, other.duration_max)
+        self.errors += other.errors
+        for status, count in other.statuses.items():
+            self.statuses[status] = self.statuses.get(status, 0) + count
+        self.latency.merge(other.latency)
+        for route, stats in other.routes.items():
+            if route not in self.routes and len(self.routes) >= max_routes:
+                route = OTHER_ROUTE
+            merged = self.routes.get(route)
+            if merged is None:
+                merged = self.routes[route] = RouteStats()
+            merged.merge(stats)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON 직렬화용 (워커/레플리카 간 병합 전송)"""
+        return {
+            "second": self.second,
+            "count": self.count,
+            "duration_sum": self.duration_sum,
+            "duration_max": self.duration_max,
+            "errors": self.errors,
+            "statuses": self.statuses,
+            "latency": self.latency.to_dict(),
+            "routes": {route: stats.to_dict() for route, stats in self.routes.items()},
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "TrafficBucket":
+        bucket = cls(int(data["second"]))
+        bucket.count = data["count"]
+        bucket.duration_sum = data["duration_sum"]
+        bucket.duration_max = data["duration_max"]
+        bucket.errors = data["errors"]
+        bucket.statuses = dict(data["statuses"])
+        bucket.latency = DDSketch.from_dict(data["latency"])
+        bucket.routes = {route: RouteStats.from_dict(stats) for route, stats in data["routes"].items()}
+        return bucket
+
+
+class TrafficWindow:
+    """
+    초 단위 버킷 링 (가장 긴 윈도우만큼 보관)
+
+    라우트는 SpaceSaving으로 빈도 상위 max_routes개만 따로 집계하고
+    나머지는 OTHER_ROUTE로 합산하므로 원시 URL이 들어와도 메모리가 제한됩니다.
+    락이 없으므로 기록/조회는 한 스레드(이벤트 루프)에서만 수행해야 합니다.
+
+    track_outbound가 True면 로컬 기록을 초 단위 델타로도 모아 두며 (take_outbound),
+    다른 워커/레플리카의 델타는 merge_bucket으로 합칩니다.
+    """
+
+    def __init__(self, horizon_seconds: int = max(WINDOWS.values()),
+                 max_routes: int = DEFAULT_MAX_ROUTES):
+        self.horizon = horizon_seconds
+        self.max_routes = max_routes
+        self._buckets = [TrafficBucket() for _ in range(horizon_seconds)]
+        self._minute_latency: Dict[int, DDSketch] = {}  # 지난 분(시작 초) -> 병합된 지연 스케치
+        self._route_counts = SpaceSaving(max_routes)
+        self.track_outbound = False
+        self._outbound: Dict[int, TrafficBucket] = {}
+
+    def record(self, duration_ms: float, status_code: int, now: Optional[float] = None,
+               route: Optional[str] = None):
+        """요청 1건 기록"""
+        second = int(time.time() if now is None else now)
+        status = status_class(status_code)
+        is_error = status_code >= 400
+        bucket = self._buckets[second % self.horizon]
+        if bucket.second != second:
+            if bucket.second > second:
+                return  # 보관 범위(horizon)보다 늦게 도착한 로그
+            bucket.reset(second)  # 한 바퀴 전의 오래된 버킷 재사용
+        if self._minute_latency:
+            # 컨테이너 로그처럼 지난 분에 늦게 기록되면 캐시된 분 스케치를 다시 계산
+            self._minute_latency.pop(second - second % 60, None)
+
+        if route is not None:
+            self._route_counts.offer(route)
+            if route not in bucket.routes and (
+                len(bucket.routes) >= self.max_routes or not self._route_counts.is_heavy(route)
+            ):
+                route = OTHER_ROUTE
+        bucket.add(duration_ms, status, is_error, route)
+
+        if self.track_outbound:
+            outbound = self._outbound.get(second)
+            if outbound is None:
+                outbound = self._outbound[second] = TrafficBucket(second)
+            outbound.add(duration_ms, status, is_error, route)
+
+    def take_outbound(self) -> List[TrafficBucket]:
+        """마지막 호출 이후 로컬에서 기록한 초 단위 델타를 꺼냄"""
+        outbound, self._outbound = self._outbound, {}
+        return list(outbound.values())
+
+    def merge_bucket(self, other: TrafficBucket, now: Optional[float] = None) -> bool:
+        """
+        다른 워커/레플리카의 초 단위 델타 병합
+
+        Returns:
+            False면 보관 범위(horizon)를 벗어난 오래된 델타라 버림
+        """
+        current = int(time.time() if now is None else now)
+        second = other.second
+        if second <= current - self.horizon or second > current + 5:
+            return False
+        bucket = self._buckets[second % self.horizon]
+        if bucket.second != second:
+            if bucket.second > second:
+                return False
+            bucket.reset(second)
+        bucket.merge(other, self.max_routes)
+        # 이미 캐시된 지난 분이면 다시 계산
+        self._minute_latency.pop(second - second % 60, None)
+        return True
+
+    def summarize(self, seconds: int, now: Optional[float] = None) -> Dict[str, object]:
+        """
+        최근 seconds초 (현재 초 포함) 통계
+
+        Returns:
+            request_count, error_count, avg_duration, max_duration, success_rate, rps,
+            status_classes, p50, p95, p99
+        """
+        seconds = min(seconds, self.horizon)
+        current = int(time.time() if now is None else now)
+        oldest = current - seconds + 1
+        count = errors = 0
+        duration_sum = duration_max = 0.0
+        statuses: Dict[str, int] = {}
+        for bucket in self._buckets:
+            if oldest <= bucket.second <= current:
+                count += bucket.count
+                errors += bucket.errors
+                duration_sum += bucket.duration_sum
+                if bucket.duration_max > duration_max:
+                    duration_max = bucket.duration_max
+                for status, status_count in bucket.statuses.items():
+                    statuses[status] = statuses.get(status, 0) + status_count
+        latency = self._window_latency(oldest, current)
+
+        return {
+            "request_count": count,
+            "error_count": errors,
+            "avg_duration": duration_sum / count if count else 0.0,
+            "max_duration": duration_max,
+            "success_rate": (count - errors) / count * 100 if count else 100.0,
+            "rps": count / seconds,
+            "status_classes": statuses,
+            **latency.percentiles(),
+        }
+
+    def summarize_windows(self, now: Optional[float] = None) -> Dict[str, Dict[str, object]]:
+        """모든 표준 윈도우 (1m/5m/15m) 통계"""
+        now = time.time() if now is None else now
+        return {name: self.summarize(seconds, now) for name, seconds in WINDOWS.items()}
+
+    def summarize_routes(self, seconds: int, now: Optional[float] = None) -> Dict[str, Dict[str, object]]:
+        """
+        최근 seconds초의 라우트별 통계 (요청 수 상위 max_routes개, 나머지는 OTHER_ROUTE로 합산)
+        """
+        seconds = min(seconds, self.horizon)
+        current = int(time.time() if now is None else now)
+        oldest = current - seconds + 1
+        routes: Dict[str, RouteStats] = {}
+        for bucket in self._buckets:
+            if oldest <= bucket.second <= current:
+                for route, stats in bucket.routes.items():
+                    merged = routes.get(route)
+                    if merged is None:
+                        merged = routes[route] = RouteStats()
+                    merged.merge(stats)
+
+        if len(routes) > self.max_routes:
+            other = routes.pop(OTHER_ROUTE, None) or RouteStats()
+            ranked = sorted(routes.items(), key=lambda item: item[1].count, reverse=True)
+            for _, stats in ranked[self.max_routes - 1:]:
+                other.merge(stats)
+            routes = dict(ranked[:self.max_routes - 1])
+            routes[OTHER_ROUTE] = other
+        ranked = sorted(routes.items(), key=lambda item: item[1].count, reverse=True)
+        return {route: stats.summary() for route, stats in ranked}
+
+    def minute_totals(self, minute: int) -> Dict[str, Any]:
+        """
+        minute(분 시작 epoch 초)부터 60초 합계 (히스토리 기록용)
+
+        Returns:
+            count, errors, duration_sum, duration_max, statuses, latency(DDSketch)
+        """
+        count = errors = 0
+        duration_sum = duration_max = 0.0
+        statuses: Dict[str, int] = {}
+        latency = DDSketch()
+        for second in range(minute, minute + 60):
+            bucket = self._buckets[second % self.horizon]
+            if bucket.second != second:
+                continue
+            count += bucket.count
+            errors += bucket.errors
+            duration_sum += bucket.duration_sum
+            duration_max = max(duration_max, bucket.duration_max)
+            for status, status_count in bucket.statuses.items():
+                statuses[status] = statuses.get(status, 0) + status_count
+            latency.merge(bucket.latency)
+        return {
+            "count": count,
+            "errors": errors,
+            "duration_sum": duration_sum,
+            "duration_max": duration_max,
+            "statuses": statuses,
+            "latency": latency,
+        }
+
+    def top_routes(self, k: Optional[int] = None):
+        """프로세스 시작 이후 빈도 상위 라우트 (SpaceSaving 추정치)"""
+        return self._route_counts.top(k)
+
+    def _window_latency(self, oldest: int, current: int) -> DDSketch:
+        """
+        [oldest, current] 구간 지연 스케치
+
+        이미 끝난 분은 분 단위로 병합해 캐시하므로 15분 윈도우도 초 버킷 900개가 아니라
+        분 스케치 최대 15개 + 양 끝 초 버킷만 병합합니다.
+        """
+        current_minute = current - current % 60
+        for minute in [m for m in self._minute_latency if m < current - self.horizon]:
+            del self._minute_latency[minute]
+
+        result = DDSketch()
+        second = oldest
+        while second <= current:
+            if second % 60 == 0 and second + 60 <= current_minute:
+                result.merge(self._minute_sketch(second))
+                second += 60
+                continue
+            bucket = self._buckets[second % self.horizon]
+            if bucket.second == second:
+                result.merge(bucket.latency)
+            second += 1
+        return result
+
+    def _minute_sketch(self, minute: int) -> DDSketch:
+        sketch = self._minute_latency.get(minute)
+        if sketch is None:
+            sketch = DDSketch()
+            for second in range(minute, minute + 60):
+                bucket = self._buckets[second % self.horizon]
+                if bucket.second == second:
+                    sketch.merge(bucket.latency)
+            self._minute_latency[minute] = sketch
+        return sketch
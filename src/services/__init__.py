@@ -2,11 +2,18 @@
 Services 패키지
 """
 from .cosmos_service import get_cosmos_service
+from .news_enrichment_service import get_news_enrichment_service
+from .news_ingestion_service import get_news_ingestion_service
 from .rss_news_service import get_rss_news_service
+from .storage_backend import StorageBackend, get_storage_service
 from .yfinance_service import get_yfinance_client
 
 __all__ = [
     "get_cosmos_service",
+    "get_storage_service",
+    "StorageBackend",
     "get_yfinance_client",
     "get_rss_news_service",
+    "get_news_ingestion_service",
+    "get_news_enrichment_service",
 ]
@@ -3,7 +3,8 @@ Azure Cosmos DB 클라이언트
 """
 import json
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional
+from itertools import islice
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
 from azure.cosmos import CosmosClient, PartitionKey
 from azure.cosmos.container import ContainerProxy
@@ -14,12 +15,52 @@ from opentelemetry import trace
 from opentelemetry.trace import SpanKind
 
 from ..config import get_settings
+from .storage_backend import StorageBackend, decode_cursor, encode_cursor
 
 # OpenTelemetry tracer
 tracer = trace.get_tracer(__name__)
 
+# 쿼리 패턴에 맞춘 인덱싱 정책
+# - 필터: symbol, type / 정렬: _ts DESC
+# - data(holdings, description 등 대용량 payload)는 조회 조건에 쓰이지 않으므로 인덱싱 제외
+INDEXING_POLICY: Dict[str, Any] = {
+    "indexingMode": "consistent",
+    "automatic": True,
+    "includedPaths": [{"path": "/*"}],
+    "excludedPaths": [{"path": "/data/*"}, {"path": '/"_etag"/?'}],
+    "compositeIndexes": [
+        [
+            {"path": "/type", "order": "ascending"},
+            {"path": "/_ts", "order": "descending"},
+        ],
+        [
+            {"path": "/symbol", "order": "ascending"},
+            {"path": "/type", "order": "ascending"},
+            {"path": "/_ts", "order": "descending"},
+        ],
+    ],
+}
 
-class CosmosDBService:
+
+def indexing_policy_matches(current: Dict[str, Any], desired: Dict[str, Any] = INDEXING_POLICY) -> bool:
+    """현재 컨테이너 인덱싱 정책이 원하는 정책을 포함하는지 확인"""
+    def paths(policy: Dict[str, Any], key: str) -> set:
+        return {entry.get("path") for entry in policy.get(key, [])}
+    
+    def composites(policy: Dict[str, Any]) -> set:
+        return {
+            tuple((entry.get("path"), entry.get("order", "ascending")) for entry in composite)
+            for composite in policy.get("compositeIndexes", [])
+        }
+    
+    return (
+        paths(desired, "excludedPaths") <= paths(current, "excludedPaths")
+        and paths(desired, "includedPaths") <= paths(current, "includedPaths")
+        and composites(desired) <= composites(current)
+    )
+
+
+class CosmosDBService(StorageBackend):
     """Cosmos DB 서비스"""
     
     client: Optional[CosmosClient]
@@ -27,6 +68,7 @@ class CosmosDBService:
     container: Optional[ContainerProxy]
     
     def __init__(self):
+        super().__init__()
         settings = get_settings()
         self.enabled = bool(settings.cosmos_endpoint)
         
@@ -54,6 +96,10 @@ class CosmosDBService:
                 
             self.database_name = settings.cosmos_database_name
             self.container_name = settings.cosmos_container_name
+            # 스냅샷 기본 TTL (0 이하 = 만료 없음, 단 문서별 ttl은 적용되도록 -1)
+            # 압축 백필 전까지는 컨테이너에 적용하지 않음 (enable_snapshot_ttl)
+            self.default_ttl = settings.snapshot_ttl_seconds if settings.snapshot_ttl_seconds > 0 else -1
+            self._snapshot_ttl_applied = False
             self.database = None
             self.container = None
             self._initialize_database()
@@ -76,12 +122,63 @@ class CosmosDBService:
             self.container = self.database.create_container_if_not_exists(
                 id=self.container_name,
                 partition_key=PartitionKey(path="/symbol"),
+                indexing_policy=INDEXING_POLICY,
+                default_ttl=-1,
                 offer_throughput=400
             )
+            self._apply_container_policies()
         except Exception as e:
             print(f"Error initializing Cosmos DB: {e}")
             self.enabled = False
     
+    def _apply_container_policies(self, default_ttl: Optional[int] = None) -> bool:
+        """
+        기존 컨테이너에 인덱싱 정책 및 기본 TTL 적용 (멱등)
+        
+        create_container_if_not_exists는 이미 존재하는 컨테이너의 정책을 바꾸지 않으므로
+        현재 정책을 읽어 다를 때만 replace_container를 호출합니다.
+        default_ttl이 없으면 컨테이너의 현재 기본 TTL을 유지합니다 (없으면 문서별 ttl만 적용되는 -1).
+        
+        Returns:
+            적용(또는 이미 일치) 여부
+        """
+        if not self.database or not self.container:
+            return False
+        
+        try:
+            properties = self.container.read()
+            current_ttl = properties.get("defaultTtl")
+            if default_ttl is None:
+                default_ttl = current_ttl if current_ttl is not None else -1
+            if (
+                indexing_policy_matches(properties.get("indexingPolicy", {}))
+                and current_ttl == default_ttl
+            ):
+                return True
+            
+            self.container = self.database.replace_container(
+                self.container,
+                partition_key=PartitionKey(path="/symbol"),
+                indexing_policy=INDEXING_POLICY,
+                default_ttl=default_ttl,
+            )
+            print(
+                f"Applied indexing policy and default TTL ({default_ttl}s) "
+                f"to container '{self.container_name}'"
+            )
+            return True
+        except CosmosHttpResponseError as e:
+            # 권한 부족 등으로 정책 변경에 실패해도 서비스는 계속 동작
+            print(f"Could not apply indexing policy: {e.status_code} - {e.message}")
+            return False
+    
+    def enable_snapshot_ttl(self) -> bool:
+        """스냅샷 기본 TTL을 컨테이너에 적용 (압축이 저장된 이력을 모두 요약한 뒤)"""
+        if not self.enabled or not self.container:
+            return False
+        self._snapshot_ttl_applied = self._apply_container_policies(default_ttl=self.default_ttl)
+        return self._snapshot_ttl_applied
+    
     def save_etf_data(self, symbol: str, data: Dict[str, Any]) -> bool:
         """ETF 데이터 저장"""
         if not self.enabled or not self.container:
@@ -114,6 +211,7 @@ class CosmosDBService:
                 }
                 self.container.create_item(body=item)
                 span.set_attribute("db.response.status", "success")
+                self._index_document(item)
                 return True
             except CosmosHttpResponseError as e:
                 span.set_attribute("db.response.status", "error")
@@ -154,6 +252,7 @@ class CosmosDBService:
                 }
                 self.container.create_item(body=item)
                 span.set_attribute("db.response.status", "success")
+                self._index_document(item)
                 return True
             except CosmosHttpResponseError as e:
                 span.set_attribute("db.response.status", "error")
@@ -162,16 +261,18 @@ class CosmosDBService:
                 print(f"Error saving stock data for {symbol}: {e}")
                 return False
     
+    LATEST_DATA_QUERY = """
+            SELECT TOP 1 * FROM c 
+            WHERE c.symbol = @symbol AND c.type = @type 
+            ORDER BY c._ts DESC
+        """
+    
     def get_latest_data(self, symbol: str, data_type: str = "stock") -> Optional[Dict[str, Any]]:
         """최신 데이터 조회"""
         if not self.enabled or not self.container:
             return None
             
-        query = f"""
-            SELECT TOP 1 * FROM c 
-            WHERE c.symbol = @symbol AND c.type = @type 
-            ORDER BY c._ts DESC
-        """
+        query = self.LATEST_DATA_QUERY
         
         with tracer.start_as_current_span(
             "query_items",
@@ -215,77 +316,104 @@ class CosmosDBService:
                 print(f"Error getting latest data for {symbol}: {e}")
                 return None
     
-    def get_all_etfs(self, limit: int = 50) -> List[Dict[str, Any]]:
-        """모든 ETF 데이터 조회"""
+    ETF_SYMBOLS_QUERY = """
+            SELECT DISTINCT VALUE c.symbol
+            FROM c
+            WHERE c.type = 'etf' AND c.symbol > @after
+            ORDER BY c.symbol ASC
+        """
+    
+    def iter_etf_symbols(self, after: str = "", page_size: int = 100) -> Iterator[str]:
+        """
+        저장된 ETF 심볼 스트리밍 (심볼순, after 다음 심볼부터)
+        
+        Cosmos가 page_size 단위로 읽어 오므로 호출자가 필요한 만큼만 소비하면 나머지는 읽지 않습니다.
+        """
         if not self.enabled or not self.container:
-            return []
-            
-        # 각 심볼별 최신 데이터만 가져오기
-        query = """
-            SELECT c.symbol, c.data, c.timestamp
-            FROM c 
-            WHERE c.type = 'etf'
-            ORDER BY c._ts DESC
+            return
+        
+        yield from self.container.query_items(
+            query=self.ETF_SYMBOLS_QUERY,
+            parameters=[{"name": "@after", "value": after}],
+            enable_cross_partition_query=True,
+            max_item_count=page_size
+        )
+    
+    def get_etfs_page(
+        self,
+        limit: int = 50,
+        cursor: Optional[str] = None
+    ) -> Tuple[List[Dict[str, Any]], Optional[str]]:
         """
+        심볼별 최신 ETF 한 페이지 조회 (심볼순 keyset cursor: 마지막 심볼)
         
-        with tracer.start_as_current_span(
+        심볼 목록은 DISTINCT 쿼리로 이어 읽고, 각 심볼의 최신 문서는 (symbol, type, _ts DESC)
+        복합 인덱스를 쓰는 단일 파티션 TOP 1 쿼리로 읽으므로 cursor 크기와 메모리가 일정합니다.
+        
+        Raises:
+            ValueError: 올바르지 않은 cursor
+        """
+        if not self.enabled or not self.container:
+            return [], None
+        
+        after = ""
+        if cursor:
+            after = decode_cursor(cursor).get("after")
+            if not isinstance(after, str) or not after:
+                raise ValueError(f"Invalid cursor: {cursor}")
+        
+        with self._span(
             "query_items",
-            kind=trace.SpanKind.CLIENT,
-            attributes={
-                "db.system": "cosmosdb",
-                "db.operation": "query_items",
-                "db.name": self.database_name,
-                "db.cosmosdb.container": self.container_name,
-                "db.statement": query,
-                "peer.service": "COSMOS",
-                "component": "cosmosdb",
-                "az.namespace": "Microsoft.DocumentDB",
-                "max_item_count": limit
-            }
+            self.ETF_SYMBOLS_QUERY,
+            max_item_count=limit,
+            **{"db.cosmosdb.continuation": bool(after)}
         ) as span:
             try:
-                items = list(self.container.query_items(
-                    query=query,
-                    enable_cross_partition_query=True,
-                    max_item_count=limit
-                ))
+                symbols = list(islice(self.iter_etf_symbols(after, limit + 1), limit + 1))
+                items: List[Dict[str, Any]] = []
+                for symbol in symbols[:limit]:
+                    latest = self.get_latest_data(symbol, "etf")
+                    if latest:
+                        items.append({
+                            "symbol": latest["symbol"],
+                            "data": latest.get("data"),
+                            "timestamp": latest.get("timestamp"),
+                        })
                 
-                # 중복 제거 (심볼별 최신 데이터만)
-                seen_symbols = set()
-                unique_items = []
-                for item in items:
-                    if item['symbol'] not in seen_symbols:
-                        seen_symbols.add(item['symbol'])
-                        unique_items.append(item)
-                
-                span.set_attribute("db.response.count", len(items))
-                span.set_attribute("db.response.unique_count", len(unique_items))
+                span.set_attribute("db.response.count", len(symbols))
+                span.set_attribute("db.response.unique_count", len(items))
                 span.set_attribute("db.response.status", "success")
-                return unique_items
+                
+                next_cursor = encode_cursor({"after": symbols[limit - 1]}) if len(symbols) > limit else None
+                return items, next_cursor
             except CosmosHttpResponseError as e:
                 span.set_attribute("db.response.status", "error")
                 span.set_attribute("db.response.status_code", str(e.status_code))
                 span.set_attribute("error.type", type(e).__name__)
                 span.record_exception(e)
                 print(f"Cosmos DB HTTP error getting all ETFs: {e.status_code} - {e.message}")
-                return []
+                return [], None
             except Exception as e:
                 span.set_attribute("db.response.status", "error")
                 span.set_attribute("error.type", type(e).__name__)
                 span.record_exception(e)
                 print(f"Error getting all ETFs: {e}")
-                return []
+                return [], None
+    
+    def get_all_etfs(self, limit: int = 50) -> List[Dict[str, Any]]:
+        """모든 ETF 데이터 조회 (심볼별 최신 데이터, 첫 페이지)"""
+        return self.get_etfs_page(limit=limit)[0]
     
     def delete_etf_data(self, symbol: str) -> bool:
-        """ETF 데이터 삭제 (해당 심볼의 모든 기록)"""
+        """ETF 데이터 삭제 (해당 심볼의 모든 기록과 요약)"""
         if not self.enabled or not self.container:
             return False
             
         try:
-            # 심볼의 모든 문서 조회
+            # 심볼의 모든 스냅샷/요약 문서 조회
             query = """
                 SELECT c.id FROM c 
-                WHERE c.symbol = @symbol AND c.type = 'etf'
+                WHERE c.symbol = @symbol AND c.type IN ('etf', 'etf_summary')
             """
             items = list(self.container.query_items(
                 query=query,
@@ -303,55 +431,204 @@ class CosmosDBService:
                     partition_key=symbol
                 )
             
+            self._unindex_symbol(symbol, "etf")
             return True
         except CosmosHttpResponseError as e:
             print(f"Error deleting ETF data for {symbol}: {e}")
             return False
     
-    def search_data(self, query_text: str, limit: int = 20) -> List[Dict[str, Any]]:
-        """데이터 검색"""
-        if not self.enabled or not self.container:
-            return []
-            
-        query = f"""
-            SELECT * FROM c 
-            WHERE CONTAINS(c.symbol, @query) 
-            OR CONTAINS(c.data.name, @query)
-            ORDER BY c._ts DESC
-        """
-        
-        with tracer.start_as_current_span(
-            "query_items",
+    def _span(self, operation: str, statement: str, **attributes: Any):
+        """Cosmos DB 호출 스팬"""
+        return tracer.start_as_current_span(
+            operation,
             kind=trace.SpanKind.CLIENT,
             attributes={
                 "db.system": "cosmosdb",
-                "db.operation": "query_items",
+                "db.operation": operation,
                 "db.name": self.database_name,
                 "db.cosmosdb.container": self.container_name,
-                "db.statement": query,
+                "db.statement": statement,
                 "peer.service": "COSMOS",
                 "component": "cosmosdb",
                 "az.namespace": "Microsoft.DocumentDB",
-                "search_query": query_text,
-                "max_item_count": limit
+                **attributes,
             }
-        ) as span:
+        )
+    
+    def list_symbols(self, data_type: str) -> List[str]:
+        """타입별 저장된 심볼 목록"""
+        if not self.enabled or not self.container:
+            return []
+        
+        query = "SELECT DISTINCT VALUE c.symbol FROM c WHERE c.type = @type"
+        with self._span("query_items", query, data_type=data_type) as span:
+            try:
+                symbols = list(self.container.query_items(
+                    query=query,
+                    parameters=[{"name": "@type", "value": data_type}],
+                    enable_cross_partition_query=True
+                ))
+                span.set_attribute("db.response.count", len(symbols))
+                return symbols
+            except CosmosHttpResponseError as e:
+                span.record_exception(e)
+                print(f"Error listing {data_type} symbols: {e.status_code}")
+                return []
+    
+    def iter_snapshots(
+        self,
+        symbol: str,
+        data_type: str,
+        start_ts: int,
+        end_ts: int
+    ) -> Iterator[Dict[str, Any]]:
+        """[start_ts, end_ts) 구간의 원본 스냅샷 (오래된 순, 단일 파티션 쿼리)"""
+        if not self.enabled or not self.container:
+            return
+        
+        query = """
+            SELECT * FROM c
+            WHERE c.symbol = @symbol AND c.type = @type
+            AND c._ts >= @start AND c._ts < @end
+            ORDER BY c._ts ASC
+        """
+        with self._span("query_items", query, symbol=symbol, data_type=data_type):
+            yield from self.container.query_items(
+                query=query,
+                parameters=[
+                    {"name": "@symbol", "value": symbol},
+                    {"name": "@type", "value": data_type},
+                    {"name": "@start", "value": start_ts},
+                    {"name": "@end", "value": end_ts},
+                ],
+                partition_key=symbol
+            )
+    
+    def upsert_summary(self, document: Dict[str, Any]) -> bool:
+        """요약 문서 저장 (id가 결정적이므로 재실행해도 멱등)"""
+        if not self.enabled or not self.container:
+            return False
+        
+        with self._span("upsert_item", "UPSERT", symbol=document["symbol"], item_type=document["type"]) as span:
+            try:
+                self.container.upsert_item(body=document)
+                return True
+            except CosmosHttpResponseError as e:
+                span.record_exception(e)
+                print(f"Error saving summary {document['id']}: {e.status_code}")
+                return False
+    
+    def get_summaries(
+        self,
+        symbol: str,
+        data_type: str,
+        granularity: str,
+        start_ts: int,
+        end_ts: int
+    ) -> List[Dict[str, Any]]:
+        """요약 문서 조회 (오래된 순)"""
+        if not self.enabled or not self.container:
+            return []
+        
+        query = """
+            SELECT * FROM c
+            WHERE c.symbol = @symbol AND c.type = @type AND c.granularity = @granularity
+            AND c.bucket_ts >= @start AND c.bucket_ts < @end
+            ORDER BY c.bucket_ts ASC
+        """
+        with self._span("query_items", query, symbol=symbol, granularity=granularity) as span:
             try:
                 items = list(self.container.query_items(
                     query=query,
-                    parameters=[{"name": "@query", "value": query_text.upper()}],
-                    enable_cross_partition_query=True,
-                    max_item_count=limit
+                    parameters=[
+                        {"name": "@symbol", "value": symbol},
+                        {"name": "@type", "value": f"{data_type}_summary"},
+                        {"name": "@granularity", "value": granularity},
+                        {"name": "@start", "value": start_ts},
+                        {"name": "@end", "value": end_ts},
+                    ],
+                    partition_key=symbol
                 ))
                 span.set_attribute("db.response.count", len(items))
-                span.set_attribute("db.response.status", "success")
                 return items
+            except CosmosHttpResponseError as e:
+                span.record_exception(e)
+                print(f"Error getting summaries for {symbol}: {e.status_code}")
+                return []
+    
+    def latest_summary_ts(self, symbol: str, data_type: str, granularity: str) -> Optional[int]:
+        """가장 최근 요약 구간 시작 (단일 파티션 TOP 1)"""
+        if not self.enabled or not self.container:
+            return None
+        
+        query = """
+            SELECT TOP 1 VALUE c.bucket_ts FROM c
+            WHERE c.symbol = @symbol AND c.type = @type AND c.granularity = @granularity
+            ORDER BY c.bucket_ts DESC
+        """
+        with self._span("query_items", query, symbol=symbol, granularity=granularity):
+            items = list(self.container.query_items(
+                query=query,
+                parameters=[
+                    {"name": "@symbol", "value": symbol},
+                    {"name": "@type", "value": f"{data_type}_summary"},
+                    {"name": "@granularity", "value": granularity},
+                ],
+                partition_key=symbol
+            ))
+        return items[0] if items else None
+    
+    def purge_expired(self, now_ts: int) -> int:
+        """
+        문서 삭제는 컨테이너 TTL이 처리 - 스냅샷이 모두 만료된 심볼만 검색 인덱스에서 제거
+
+        Returns:
+            0 (직접 삭제한 문서 없음)
+        """
+        if self.enabled and self._snapshot_ttl_applied and self.default_ttl > 0:
+            self._expire_search_index(now_ts - self.default_ttl)
+        return 0
+    
+    def _iter_index_documents(self) -> Iterator[Dict[str, Any]]:
+        """
+        검색 인덱스 구축용 심볼·타입별 최신 문서
+
+        (type, _ts DESC) 복합 인덱스 순서로 인덱스에 필요한 필드만 읽고, 처음 나온 문서만 반환합니다.
+        조회 오류는 그대로 전파하여 일부만 읽은 인덱스가 게시되지 않도록 합니다.
+        """
+        if not self.enabled or not self.container:
+            return
+            
+        query = """
+            SELECT c.id, c.symbol, c.type, c.timestamp, c._ts,
+                   c.data.name AS name, c.data.profile.name AS profile_name
+            FROM c 
+            WHERE c.type IN ('etf', 'stock')
+            ORDER BY c.type ASC, c._ts DESC
+        """
+        
+        with self._span("query_items", query) as span:
+            try:
+                seen = set()
+                for item in self.container.query_items(
+                    query=query,
+                    enable_cross_partition_query=True
+                ):
+                    key = (item.get("symbol"), item.get("type"))
+                    if key in seen:
+                        continue
+                    seen.add(key)
+                    name = item.pop("name", None) or item.pop("profile_name", None)
+                    item.pop("profile_name", None)
+                    item["name"] = name if isinstance(name, str) else ""
+                    yield item
+                span.set_attribute("db.response.count", len(seen))
+                span.set_attribute("db.response.status", "success")
             except Exception as e:
                 span.set_attribute("db.response.status", "error")
                 span.set_attribute("error.type", type(e).__name__)
                 span.record_exception(e)
-                print(f"Error searching data: {e}")
-                return []
+                raise
 
 
 # 싱글톤 인스턴스
@@ -0,0 +1,383 @@
+"""
+로컬 SQLite 저장소
+COSMOS_ENDPOINT 없이도 CosmosDBService와 같은 의미로 스냅샷을 저장/조회합니다.
+"""
+import json
+import sqlite3
+import threading
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from opentelemetry import trace
+
+from ..config import get_settings
+from .storage_backend import StorageBackend, decode_cursor, encode_cursor
+from .symbol_search_index import extract_name
+
+# OpenTelemetry tracer
+tracer = trace.get_tracer(__name__)
+
+# iter_snapshots 한 번에 읽는 행 수
+_SNAPSHOT_BATCH = 500
+
+_SCHEMA = """
+    CREATE TABLE IF NOT EXISTS snapshots (
+        id TEXT PRIMARY KEY,
+        symbol TEXT NOT NULL,
+        type TEXT NOT NULL,
+        name TEXT,
+        timestamp TEXT NOT NULL,
+        _ts INTEGER NOT NULL,
+        data TEXT NOT NULL
+    );
+    CREATE INDEX IF NOT EXISTS idx_snapshots_symbol_type_ts
+        ON snapshots (symbol, type, _ts DESC);
+    CREATE INDEX IF NOT EXISTS idx_snapshots_type_ts
+        ON snapshots (type, _ts DESC);
+    CREATE TABLE IF NOT EXISTS summaries (
+        id TEXT PRIMARY KEY,
+        symbol TEXT NOT NULL,
+        type TEXT NOT NULL,
+        granularity TEXT NOT NULL,
+        bucket_ts INTEGER NOT NULL,
+        expires_at INTEGER,
+        document TEXT NOT NULL
+    );
+    CREATE INDEX IF NOT EXISTS idx_summaries_symbol_type_bucket
+        ON summaries (symbol, type, granularity, bucket_ts);
+"""
+
+
+class LocalStoreService(StorageBackend):
+    """로컬 SQLite 저장소 서비스"""
+
+    def __init__(self, path: Optional[str] = None):
+        super().__init__()
+        settings = get_settings()
+        self.path = path or settings.local_store_path
+        self.snapshot_ttl_seconds = settings.snapshot_ttl_seconds
+        self.enabled = True
+
+        if self.path != ":memory:":
+            Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+
+        # FastAPI 워커 스레드에서 함께 사용하므로 단일 연결 + Lock으로 직렬화
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(_SCHEMA)
+        self._conn.commit()
+        print(f"Using local SQLite store: {self.path}")
+
+    def _span(self, operation: str, statement: str, **attributes: Any):
+        """DB 호출 스팬 (Application Map에 sqlite 의존성으로 표시)"""
+        return tracer.start_as_current_span(
+            operation,
+            kind=trace.SpanKind.CLIENT,
+            attributes={
+                "db.system": "sqlite",
+                "db.operation": operation,
+                "db.name": self.path,
+                "db.statement": statement,
+                "peer.service": "SQLITE",
+                "component": "sqlite",
+                **attributes,
+            }
+        )
+
+    @staticmethod
+    def _to_document(row: sqlite3.Row) -> Dict[str, Any]:
+        """행을 Cosmos 문서와 같은 형태로 변환"""
+        return {
+            "id": row["id"],
+            "symbol": row["symbol"],
+            "type": row["type"],
+            "data": json.loads(row["data"]),
+            "timestamp": row["timestamp"],
+            "_ts": row["_ts"],
+        }
+
+    def _save(self, symbol: str, data: Dict[str, Any], data_type: str) -> bool:
+        """스냅샷 저장"""
+        now = datetime.now(timezone.utc)
+        document = {
+            "id": f"{data_type}_{symbol}_{now.isoformat()}",
+            "symbol": symbol,
+            "type": data_type,
+            "data": data,
+            "timestamp": now.isoformat(),
+            "_ts": int(now.timestamp()),
+        }
+        statement = "INSERT INTO snapshots VALUES (?, ?, ?, ?, ?, ?, ?)"
+
+        with self._span("insert", statement, symbol=symbol, item_type=data_type) as span:
+            try:
+                with self._lock:
+                    self._conn.execute(
+                        statement,
+                        (
+                            document["id"],
+                            symbol,
+                            data_type,
+                            extract_name(data) or None,
+                            document["timestamp"],
+                            document["_ts"],
+                            json.dumps(data, default=str),
+                        )
+                    )
+                    self._conn.commit()
+                span.set_attribute("db.response.status", "success")
+                self._index_document(document)
+                return True
+            except sqlite3.Error as e:
+                span.set_attribute("db.response.status", "error")
+                span.set_attribute("error.type", type(e).__name__)
+                span.record_exception(e)
+                print(f"Error saving {data_type} data for {symbol}: {e}")
+                return False
+
+    def save_etf_data(self, symbol: str, data: Dict[str, Any]) -> bool:
+        """ETF 데이터 저장"""
+        return self._save(symbol, data, "etf")
+
+    def save_stock_data(self, symbol: str, data: Dict[str, Any]) -> bool:
+        """주식 데이터 저장"""
+        return self._save(symbol, data, "stock")
+
+    def get_latest_data(self, symbol: str, data_type: str = "stock") -> Optional[Dict[str, Any]]:
+        """최신 데이터 조회"""
+        query = """
+            SELECT * FROM snapshots
+            WHERE symbol = ? AND type = ?
+            ORDER BY _ts DESC, rowid DESC
+            LIMIT 1
+        """
+
+        with self._span("select", query, symbol=symbol, data_type=data_type) as span:
+            try:
+                with self._lock:
+                    row = self._conn.execute(query, (symbol, data_type)).fetchone()
+                span.set_attribute("db.response.count", 1 if row else 0)
+                return self._to_document(row) if row else None
+            except sqlite3.Error as e:
+                span.set_attribute("db.response.status", "error")
+                span.record_exception(e)
+                print(f"Error getting latest data for {symbol}: {e}")
+                return None
+
+    def get_etfs_page(
+        self,
+        limit: int = 50,
+        cursor: Optional[str] = None
+    ) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """심볼별 최신 ETF 한 페이지 조회 (CosmosDBService와 같은 심볼순 keyset cursor: 마지막 심볼)"""
+        after = ""
+        if cursor:
+            after = decode_cursor(cursor).get("after")
+            if not isinstance(after, str) or not after:
+                raise ValueError(f"Invalid cursor: {cursor}")
+        query = """
+            SELECT symbol, data, timestamp FROM (
+                SELECT symbol, data, timestamp,
+                       ROW_NUMBER() OVER (
+                           PARTITION BY symbol ORDER BY _ts DESC, rowid DESC
+                       ) AS rn
+                FROM snapshots
+                WHERE type = 'etf' AND symbol > ?
+            )
+            WHERE rn = 1
+            ORDER BY symbol ASC
+            LIMIT ?
+        """
+
+        with self._span("select", query, max_item_count=limit) as span:
+            try:
+                with self._lock:
+                    rows = self._conn.execute(query, (after, limit + 1)).fetchall()
+                span.set_attribute("db.response.unique_count", min(len(rows), limit))
+            except sqlite3.Error as e:
+                span.set_attribute("db.response.status", "error")
+                span.record_exception(e)
+                print(f"Error getting all ETFs: {e}")
+                return [], None
+
+        page = rows[:limit]
+        next_cursor = None
+        if len(rows) > limit:
+            next_cursor = encode_cursor({"after": page[-1]["symbol"]})
+        return [
+            {
+                "symbol": row["symbol"],
+                "data": json.loads(row["data"]),
+                "timestamp": row["timestamp"],
+            }
+            for row in page
+        ], next_cursor
+
+    def get_all_etfs(self, limit: int = 50) -> List[Dict[str, Any]]:
+        """모든 ETF 데이터 조회 (심볼별 최신 데이터, 첫 페이지)"""
+        return self.get_etfs_page(limit=limit)[0]
+
+    def delete_etf_data(self, symbol: str) -> bool:
+        """ETF 데이터 삭제 (해당 심볼의 모든 기록과 요약)"""
+        statement = "DELETE FROM snapshots WHERE symbol = ? AND type = 'etf'"
+
+        with self._span("delete", statement, symbol=symbol):
+            try:
+                with self._lock:
+                    deleted = self._conn.execute(statement, (symbol,)).rowcount
+                    deleted += self._conn.execute(
+                        "DELETE FROM summaries WHERE symbol = ? AND type = 'etf_summary'", (symbol,)
+                    ).rowcount
+                    self._conn.commit()
+                self._unindex_symbol(symbol, "etf")
+                return deleted > 0
+            except sqlite3.Error as e:
+                print(f"Error deleting ETF data for {symbol}: {e}")
+                return False
+
+    def list_symbols(self, data_type: str) -> List[str]:
+        """타입별 저장된 심볼 목록"""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT DISTINCT symbol FROM snapshots WHERE type = ?", (data_type,)
+            ).fetchall()
+        return [row["symbol"] for row in rows]
+
+    def iter_snapshots(
+        self,
+        symbol: str,
+        data_type: str,
+        start_ts: int,
+        end_ts: int
+    ) -> Iterator[Dict[str, Any]]:
+        """[start_ts, end_ts) 구간의 원본 스냅샷 (오래된 순, 백필 시 전체 이력을 한 번에 읽지 않도록 배치 단위)"""
+        query = """
+            SELECT *, rowid AS rid FROM snapshots
+            WHERE symbol = ? AND type = ? AND _ts < ?
+              AND (_ts > ? OR (_ts = ? AND rowid > ?))
+            ORDER BY _ts ASC, rowid ASC
+            LIMIT ?
+        """
+        after_ts, after_rid = start_ts, -1
+        while True:
+            with self._lock:
+                rows = self._conn.execute(
+                    query, (symbol, data_type, end_ts, after_ts, after_ts, after_rid, _SNAPSHOT_BATCH)
+                ).fetchall()
+            for row in rows:
+                yield self._to_document(row)
+            if len(rows) < _SNAPSHOT_BATCH:
+                return
+            after_ts, after_rid = rows[-1]["_ts"], rows[-1]["rid"]
+
+    def upsert_summary(self, document: Dict[str, Any]) -> bool:
+        """요약 문서 저장 (같은 id는 덮어씀)"""
+        ttl = document.get("ttl", -1)
+        expires_at = document["bucket_ts"] + ttl if ttl and ttl > 0 else None
+        statement = "INSERT OR REPLACE INTO summaries VALUES (?, ?, ?, ?, ?, ?, ?)"
+
+        with self._span("upsert", statement, symbol=document["symbol"], item_type=document["type"]):
+            try:
+                with self._lock:
+                    self._conn.execute(
+                        statement,
+                        (
+                            document["id"],
+                            document["symbol"],
+                            document["type"],
+                            document["granularity"],
+                            document["bucket_ts"],
+                            expires_at,
+                            json.dumps(document, default=str),
+                        )
+                    )
+                    self._conn.commit()
+                return True
+            except sqlite3.Error as e:
+                print(f"Error saving summary {document['id']}: {e}")
+                return False
+
+    def get_summaries(
+        self,
+        symbol: str,
+        data_type: str,
+        granularity: str,
+        start_ts: int,
+        end_ts: int
+    ) -> List[Dict[str, Any]]:
+        """요약 문서 조회 (오래된 순)"""
+        query = """
+            SELECT document FROM summaries
+            WHERE symbol = ? AND type = ? AND granularity = ?
+              AND bucket_ts >= ? AND bucket_ts < ?
+            ORDER BY bucket_ts ASC
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                query, (symbol, f"{data_type}_summary", granularity, start_ts, end_ts)
+            ).fetchall()
+        return [json.loads(row["document"]) for row in rows]
+
+    def latest_summary_ts(self, symbol: str, data_type: str, granularity: str) -> Optional[int]:
+        """가장 최근 요약 구간 시작"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT MAX(bucket_ts) AS bucket_ts FROM summaries WHERE symbol = ? AND type = ? AND granularity = ?",
+                (symbol, f"{data_type}_summary", granularity)
+            ).fetchone()
+        return row["bucket_ts"]
+
+    def purge_expired(self, now_ts: int) -> int:
+        """TTL이 지난 스냅샷/요약 삭제 (Cosmos DB 컨테이너 TTL과 같은 효과)"""
+        with self._lock:
+            deleted = 0
+            if self.snapshot_ttl_seconds > 0:
+                deleted += self._conn.execute(
+                    "DELETE FROM snapshots WHERE _ts < ?",
+                    (now_ts - self.snapshot_ttl_seconds,)
+                ).rowcount
+            deleted += self._conn.execute(
+                "DELETE FROM summaries WHERE expires_at IS NOT NULL AND expires_at < ?",
+                (now_ts,)
+            ).rowcount
+            self._conn.commit()
+        if self.snapshot_ttl_seconds > 0:
+            self._expire_search_index(now_ts - self.snapshot_ttl_seconds)
+        return deleted
+
+    def _iter_index_documents(self) -> Iterator[Dict[str, Any]]:
+        """검색 인덱스 구축용 심볼·타입별 최신 문서"""
+        query = """
+            SELECT * FROM (
+                SELECT *, ROW_NUMBER() OVER (
+                    PARTITION BY symbol, type ORDER BY _ts DESC, rowid DESC
+                ) AS rn
+                FROM snapshots
+                WHERE type IN ('etf', 'stock')
+            )
+            WHERE rn = 1
+        """
+        with self._lock:
+            rows = self._conn.execute(query).fetchall()
+        for row in rows:
+            yield self._to_document(row)
+
+    def close(self):
+        """연결 종료"""
+        with self._lock:
+            self._conn.close()
+
+
+# 싱글톤 인스턴스
+_local_store_service: Optional[LocalStoreService] = None
+
+
+def get_local_store_service() -> LocalStoreService:
+    """로컬 저장소 서비스 싱글톤"""
+    global _local_store_service
+    if _local_store_service is None:
+        _local_store_service = LocalStoreService()
+    return _local_store_service
@@ -0,0 +1,330 @@
+"""
+뉴스 보강(enrichment) 워커
+수집된 기사의 원문 텍스트 추출, 티커 태깅, 사전 기반 감성 점수를 요청 경로 밖에서 계산합니다.
+
+- 원문 다운로드(I/O)는 이벤트 루프에서 동시 요청 수를 제한해 수행
+- HTML 파싱/점수 계산(CPU)은 프로세스 풀에서 수행해 여러 코어로 확장
+- 결과는 기사 id로 캐시하여 뉴스 API 응답에 "enrichment" 필드로 노출
+"""
+import asyncio
+import logging
+import multiprocessing
+import re
+from collections import OrderedDict
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional
+
+import httpx
+from bs4 import BeautifulSoup
+
+from ..config import get_settings
+from .news_ingestion_service import StoredArticle, get_news_ingestion_service
+from .symbol_news_index import extract_tickers
+
+logger = logging.getLogger(__name__)
+
+_WORD_PATTERN = re.compile(r"[a-z]+(?:'[a-z]+)?")
+
+# 금융 뉴스 감성 사전 (Loughran-McDonald 계열 단어 축약본)
+POSITIVE_WORDS = frozenset("""
+    beat beats gain gains gained surge surges surged rally rallies rallied rise rises rose jump jumps
+    jumped soar soars soared record strong stronger strength growth grow grows grew profit profitable
+    upgrade upgraded upgrades outperform outperformed boost boosted improve improved improves optimism
+    optimistic bullish rebound rebounded recover recovered recovery exceed exceeded exceeds expand
+    expanded expansion positive win wins won success successful dividend raises raised higher
+""".split())
+
+NEGATIVE_WORDS = frozenset("""
+    miss misses missed loss losses lose lost fall falls fell drop drops dropped plunge plunges plunged
+    slump slumped slide slides slid decline declines declined weak weaker weakness cut cuts downgrade
+    downgraded downgrades underperform lawsuit probe investigation fraud default bankrupt bankruptcy
+    layoff layoffs recession bearish warning warns warned concern concerns fear fears risk risks
+    volatile volatility crash crashed selloff slowdown negative lower tumble tumbled sink sank
+""".split())
+
+NEGATIONS = frozenset("not no never without hardly barely isn't wasn't don't doesn't didn't".split())
+
+# 원문 추출 시 제외할 태그
+_BOILERPLATE_TAGS = ("script", "style", "noscript", "nav", "header", "footer", "aside", "form", "figure")
+
+TEXT_MAX_LENGTH = 5000
+_MAX_HTML_BYTES = 2_000_000
+
+
+def extract_article_text(html: str, max_length: int = TEXT_MAX_LENGTH) -> str:
+    """
+    기사 HTML에서 본문 텍스트 추출
+
+    <article> 안의 문단을 우선 사용하고, 없으면 페이지 전체 문단을 사용합니다.
+    """
+    if not html:
+        return ""
+    soup = BeautifulSoup(html, "html.parser")
+    for tag in soup(_BOILERPLATE_TAGS):
+        tag.decompose()
+
+    root = soup.find("article") or soup.body or soup
+    paragraphs = [" ".join(p.get_text(" ").split()) for p in root.find_all("p")]
+    text = "\n".join(p for p in paragraphs if len(p) > 40)
+    if not text:
+        text = " ".join(root.get_text(" ").split())
+    return text[:max_length]
+
+
+def score_sentiment(text: str) -> Dict[str, Any]:
+    """
+    사전 기반 감성 점수
+
+    부정어 바로 뒤(3단어 이내)의 감성 단어는 극성을 뒤집습니다.
+
+    Returns:
+        score (-1 ~ 1), label (positive/negative/neutral), positive/negative 단어 수
+    """
+    positive = negative = 0
+    negate_window = 0
+    for word in _WORD_PATTERN.findall(text.lower()):
+        if word in NEGATIONS:
+            negate_window = 3
+            continue
+        polarity = 1 if word in POSITIVE_WORDS else -1 if word in NEGATIVE_WORDS else 0
+        if polarity and negate_window:
+            polarity = -polarity
+        if polarity > 0:
+            positive += 1
+        elif polarity < 0:
+            negative += 1
+        negate_window = max(negate_window - 1, 0)
+
+    total = positive + negative
+    score = (positive - negative) / total if total else 0.0
+    if score > 0.2:
+        label = "positive"
+    elif score < -0.2:
+        label = "negative"
+    else:
+        label = "neutral"
+    return {
+        "score": round(score, 3),
+        "label": label,
+        "positive": positive,
+        "negative": negative,
+    }
+
+
+def enrich_article(
+    headline: str,
+    summary: str,
+    html: str,
+    known_symbols: FrozenSet[str]
+) -> Dict[str, Any]:
+    """
+    기사 하나 보강 (프로세스 풀 워커에서 실행되는 순수 함수)
+
+    Returns:
+        text (추출 본문), word_count, tickers, sentiment
+    """
+    text = extract_article_text(html) if html else ""
+    combined = "\n".join(part for part in (headline, summary, text) if part)
+    # 헤드라인은 두 번 반영해 본문보다 가중치를 높임
+    sentiment = score_sentiment(f"{headline}\n{combined}")
+    return {
+        "text": text,
+        "word_count": len(text.split()),
+        "tickers": sorted(extract_tickers(combined, known_symbols)),
+        "sentiment": sentiment,
+    }
+
+
+class NewsEnrichmentService:
+    """
+    새로 수집된 기사를 구독해 배치로 보강하는 워커
+
+    수집 파이프라인의 구독 큐(크기 제한)를 사용하므로, 보강이 뒤처지면 오래된 기사는 건너뛰고
+    저장소에 남아 있는 기사부터 다시 이어서 처리합니다.
+    """
+
+    USER_AGENT = "Mozilla/5.0 (compatible; ETF-Agent/1.0)"
+
+    def __init__(self, executor: Optional[Executor] = None):
+        settings = get_settings()
+        self.enabled = settings.news_enrichment_enabled
+        self.fetch_text = settings.news_enrichment_fetch_text
+        self.batch_size = settings.news_enrichment_batch_size
+        self.fetch_concurrency = settings.news_enrichment_fetch_concurrency
+        self.fetch_timeout = settings.news_enrichment_fetch_timeout_seconds
+        self.cache_capacity = settings.news_store_capacity
+        self._workers = settings.news_enrichment_workers or None
+        self._executor = executor
+        self._cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def executor(self) -> Executor:
+        """CPU 작업용 프로세스 풀 (지연 생성)"""
+        if self._executor is None:
+            # 스레드가 있는 프로세스에서 fork하지 않도록 spawn 사용
+            self._executor = ProcessPoolExecutor(
+                max_workers=self._workers,
+                mp_context=multiprocessing.get_context("spawn")
+            )
+        return self._executor
+
+    def ensure_started(self):
+        """보강 워커 시작 (NEWS_ENRICHMENT_ENABLED일 때만)"""
+        if not self.enabled:
+            return
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+            logger.info("🧠 뉴스 보강 워커 시작")
+
+    async def stop(self):
+        """워커 중지 및 프로세스 풀 종료"""
+        if self._task and not self._task.done():
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    def get(self, article_id: str) -> Optional[Dict[str, Any]]:
+        """캐시된 보강 결과"""
+        return self._cache.get(article_id)
+
+    def annotate(self, articles: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """보강 결과가 있는 기사에 enrichment 필드 추가 (원본은 변경하지 않음)"""
+        result = []
+        for article in articles:
+            enrichment = self._cache.get(article.get("id", ""))
+            result.append({**article, "enrichment": enrichment} if enrichment else article)
+        return result
+
+    async def _run(self):
+        ingestion = get_news_ingestion_service()
+        queue = ingestion.subscribe()
+        # 워커 시작 전에 저장된 기사부터 처리
+        backlog = ingestion.store.since(0)
+        last_seq = backlog[-1].seq if backlog else 0
+        try:
+            for start in range(0, len(backlog), self.batch_size):
+                await self._enrich_safely(backlog[start:start + self.batch_size])
+
+            while True:
+                batch: List[StoredArticle] = []
+                stored = await queue.get()
+                while stored is not None:
+                    batch.append(stored)
+                    if len(batch) >= self.batch_size or queue.empty():
+                        break
+                    stored = queue.get_nowait()
+
+                if stored is None:
+                    # 뒤처져서 구독이 끊김 - 다시 구독하고 저장소에서 이어받기
+                    queue = ingestion.subscribe()
+                    batch.extend(ingestion.store.since(last_seq))
+
+                if batch:
+                    last_seq = max(last_seq, max(item.seq for item in batch))
+                    await self._enrich_safely(batch)
+        finally:
+            ingestion.unsubscribe(queue)
+
+    async def _enrich_safely(self, batch: List[StoredArticle]):
+        try:
+            await self.enrich([stored.article for stored in batch])
+        except Exception as e:
+            logger.error(f"News enrichment error: {e}", exc_info=True)
+
+    async def enrich(self, articles: List[Dict[str, Any]]) -> int:
+        """
+        기사 배치 보강 (캐시에 없는 기사만)
+
+        Returns:
+            새로 보강된 기사 수
+        """
+        pending = list({
+            a["id"]: a for a in articles if a.get("id") and a["id"] not in self._cache
+        }.values())
+        if not pending:
+            return 0
+
+        pages = await self._fetch_pages(pending) if self.fetch_text else [""] * len(pending)
+        known_symbols = frozenset(get_news_ingestion_service().store.symbols.known_symbols)
+
+        loop = asyncio.get_running_loop()
+        results = await asyncio.gather(
+            *(
+                loop.run_in_executor(
+                    self.executor,
+                    enrich_article,
+                    article.get("headline", ""),
+                    article.get("summary", ""),
+                    page,
+                    known_symbols,
+                )
+                for article, page in zip(pending, pages)
+            ),
+            return_exceptions=True
+        )
+
+        enriched = 0
+        for article, result in zip(pending, results):
+            if isinstance(result, BaseException):
+                logger.warning(f"Failed to enrich {article.get('url')}: {result}")
+                continue
+            self._cache[article["id"]] = result
+            enriched += 1
+        while len(self._cache) > self.cache_capacity:
+            self._cache.popitem(last=False)
+        return enriched
+
+    async def _fetch_pages(self, articles: List[Dict[str, Any]]) -> List[str]:
+        """기사 원문 HTML 다운로드 (동시 요청 수 제한, 실패 시 빈 문자열)"""
+        semaphore = asyncio.Semaphore(self.fetch_concurrency)
+
+        async def fetch(client: httpx.AsyncClient, url: str) -> str:
+            if not url:
+                return ""
+            body = bytearray()
+            async with semaphore:
+                try:
+                    # 본문은 _MAX_HTML_BYTES까지만 읽고 연결을 닫음 (큰 응답 전체를 받지 않음)
+                    async with client.stream("GET", url) as response:
+                        response.raise_for_status()
+                        if "html" not in response.headers.get("content-type", "html"):
+                            return ""
+                        async for chunk in response.aiter_bytes():
+                            body += chunk
+                            if len(body) >= _MAX_HTML_BYTES:
+                                break
+                except (httpx.HTTPError, httpx.InvalidURL) as e:
+                    # InvalidURL은 HTTPError 하위가 아님 - 잘못된 URL 하나가 gather 전체를 실패시키지 않도록 함께 처리
+                    logger.debug(f"Article fetch failed {url}: {type(e).__name__} {e}")
+                    return ""
+            body = bytes(body[:_MAX_HTML_BYTES])
+            try:
+                return body.decode(response.encoding or "utf-8", errors="replace")
+            except LookupError:
+                # 알 수 없는 charset 선언
+                return body.decode("utf-8", errors="replace")
+
+        async with httpx.AsyncClient(
+            timeout=self.fetch_timeout,
+            follow_redirects=True,
+            headers={"User-Agent": self.USER_AGENT}
+        ) as client:
+            return await asyncio.gather(*(fetch(client, a.get("url", "")) for a in articles))
+
+
+# 싱글톤 인스턴스
+_news_enrichment_service: Optional[NewsEnrichmentService] = None
+
+
+def get_news_enrichment_service() -> NewsEnrichmentService:
+    """뉴스 보강 서비스 싱글톤"""
+    global _news_enrichment_service
+    if _news_enrichment_service is None:
+        _news_enrichment_service = NewsEnrichmentService()
+    return _news_enrichment_service
@@ -0,0 +1,557 @@
+"""
+뉴스 수집 파이프라인
+백그라운드에서 RSS/Yahoo 뉴스를 주기적으로 수집하고 중복을 제거해 저장합니다.
+뉴스 API는 이 저장소만 읽습니다.
+"""
+import asyncio
+import hashlib
+import logging
+import re
+import threading
+import time
+import uuid
+from bisect import insort
+from collections import OrderedDict, deque
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Any, Callable, Deque, Dict, FrozenSet, Iterable, List, Optional, Set
+
+from ..config import get_settings
+from .news_search_index import NewsSearchIndex
+from .rss_news_service import get_rss_news_service
+from .storage_backend import get_storage_service
+from .symbol_news_index import SymbolNewsIndex
+from .yfinance_service import get_yfinance_client
+
+logger = logging.getLogger(__name__)
+
+_HEADLINE_TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+# 종목 심볼 (AAPL, BRK.B, BRK-B, 005930.KS, ^GSPC, EURUSD=X)
+_SYMBOL_PATTERN = re.compile(r"^[A-Z0-9^][A-Z0-9.\-=^]{0,14}$")
+
+# 워치리스트 외 심볼의 조회 시각/락 보관 상한 (LRU)
+MAX_TRACKED_SYMBOLS = 1024
+
+# 기사 출처 구분 (API별 필터링용)
+ORIGIN_RSS = "rss"
+ORIGIN_MARKET = "market"
+ORIGIN_COMPANY = "company"
+
+
+def article_id_for_url(url: str) -> str:
+    """URL 기반 기사 ID (RSSNewsService와 같은 md5 해시)"""
+    return hashlib.md5(url.encode('utf-8')).hexdigest()
+
+
+def headline_tokens(headline: str) -> FrozenSet[str]:
+    """헤드라인 유사도 비교용 토큰 집합"""
+    return frozenset(_HEADLINE_TOKEN_PATTERN.findall(headline.lower()))
+
+
+def headline_similarity(a: FrozenSet[str], b: FrozenSet[str]) -> float:
+    """토큰 집합 Jaccard 유사도"""
+    if not a or not b:
+        return 0.0
+    return len(a & b) / len(a | b)
+
+
+@dataclass(order=True)
+class StoredArticle:
+    """저장된 기사 (정렬 키: 발행 시각, 수집 순번)"""
+    published: int
+    seq: int
+    article: Dict[str, Any] = field(compare=False)
+    origin: str = field(compare=False)  # 처음 수집된 출처
+    tokens: FrozenSet[str] = field(compare=False)
+    # 같은 기사가 수집된 모든 출처 (RSS로 먼저 들어온 기사가 시장 뉴스로도 들어오면 둘 다)
+    origins: Set[str] = field(default_factory=set, compare=False)
+
+    def __post_init__(self):
+        self.origins.add(self.origin)
+
+
+class ArticleStore:
+    """
+    중복 제거 기사 저장소
+
+    발행 시각 순으로 정렬된 고정 크기 저장소로, 용량을 넘으면 가장 오래된 기사부터 제거합니다.
+    중복 판정:
+        1. URL 해시(id)가 같으면 중복
+        2. 최근 기사 중 헤드라인 토큰 유사도가 임계값 이상이면 중복 (다른 소스의 같은 기사)
+    중복이면 기존 기사에 출처만 추가합니다.
+    """
+
+    def __init__(
+        self,
+        capacity: int = 2000,
+        similarity_threshold: float = 0.8,
+        similarity_window: int = 500
+    ):
+        self.capacity = capacity
+        self.similarity_threshold = similarity_threshold
+        self._lock = threading.RLock()
+        self._articles: List[StoredArticle] = []
+        self._by_id: Dict[str, StoredArticle] = {}
+        # 최근 수집된 기사의 헤드라인 (유사도 비교 범위 제한)
+        self._recent: Deque[StoredArticle] = deque(maxlen=similarity_window)
+        self._seq = 0
+        # 저장소 인스턴스 식별자 - 수집 순번은 프로세스마다 0부터 시작하므로 이벤트 id에 함께 넣음
+        self.epoch = uuid.uuid4().hex[:12]
+        self.index = NewsSearchIndex()
+        self.symbols = SymbolNewsIndex()
+
+    def __len__(self) -> int:
+        return len(self._articles)
+
+    def add(self, article: Dict[str, Any], origin: str) -> Optional[StoredArticle]:
+        """
+        기사 추가
+
+        Returns:
+            새로 저장된 기사 (중복이거나 저장소의 모든 기사보다 오래되어 바로 밀려나면 None)
+        """
+        article_id = article.get("id")
+        if not article_id:
+            return None
+        tokens = headline_tokens(article.get("headline", ""))
+        published = article.get("datetime") or 0
+
+        with self._lock:
+            existing = self._by_id.get(article_id) or self._find_similar(tokens)
+            if existing is not None:
+                existing.origins.add(origin)
+                self._merge_related(existing, article)
+                return None
+            if len(self._articles) >= self.capacity and published < self._articles[0].published:
+                return None
+
+            self._seq += 1
+            stored = StoredArticle(
+                published=published,
+                seq=self._seq,
+                article=article,
+                origin=origin,
+                tokens=tokens,
+            )
+            insort(self._articles, stored)
+            self._by_id[article_id] = stored
+            self._recent.append(stored)
+            self.index.add(article_id, article)
+            self.symbols.add(article_id, article)
+
+            while len(self._articles) > self.capacity:
+                evicted = self._articles.pop(0)
+                self._by_id.pop(evicted.article["id"], None)
+                self._on_evict(evicted)
+            return stored
+
+    def _merge_related(self, existing: StoredArticle, article: Dict[str, Any]):
+        """중복 기사의 related 심볼을 기존 기사에 합치고 심볼 인덱스 재태깅"""
+        related = [r.strip() for r in (existing.article.get("related") or "").split(",") if r.strip()]
+        added = [
+            r.strip() for r in (article.get("related") or "").split(",")
+            if r.strip() and r.strip() not in related
+        ]
+        if not added:
+            return
+        existing.article = {**existing.article, "related": ",".join(related + added)}
+        self.symbols.add(existing.article["id"], existing.article)
+
+    def _find_similar(self, tokens: FrozenSet[str]) -> Optional[StoredArticle]:
+        if len(tokens) < 3:
+            return None
+        for recent in self._recent:
+            # 용량 초과로 밀려난 기사는 저장소에 없으므로 비교 대상에서 제외
+            if self._by_id.get(recent.article["id"]) is not recent:
+                continue
+            if headline_similarity(tokens, recent.tokens) >= self.similarity_threshold:
+                return recent
+        return None
+
+    def _on_evict(self, stored: StoredArticle):
+        """기사 제거 훅 - 역색인/심볼 인덱스에서도 제거"""
+        self.index.remove(stored.article["id"])
+        self.symbols.remove(stored.article["id"], stored.published)
+
+    def event_id(self, stored: StoredArticle) -> str:
+        """SSE 이벤트 id (<epoch>-<수집 순번>)"""
+        return f"{self.epoch}-{stored.seq}"
+
+    def resume_seq(self, event_id: Optional[str]) -> Optional[int]:
+        """
+        Last-Event-ID를 이 저장소의 수집 순번으로 변환
+
+        Returns:
+            이어받을 순번 (다른 프로세스/재시작 전 저장소의 id, 형식 오류, 아직 없는 순번이면 None)
+        """
+        epoch, _, seq = (event_id or "").partition("-")
+        if epoch != self.epoch or not seq.isdigit():
+            return None
+        seq = int(seq)
+        with self._lock:
+            return seq if seq <= self._seq else None
+
+    def since(self, seq: int) -> List[StoredArticle]:
+        """수집 순번이 seq보다 큰 저장 기사 (수집 순, 이어받기용)"""
+        with self._lock:
+            return sorted(
+                (stored for stored in self._articles if stored.seq > seq),
+                key=lambda stored: stored.seq
+            )
+
+    def add_known_symbols(self, symbols: Iterable[str]) -> int:
+        """
+        티커 추출 대상 심볼 등록 (새 심볼은 저장된 기사에 소급 태깅)
+
+        Returns:
+            새로 등록된 심볼 수
+        """
+        with self._lock:
+            new_symbols = self.symbols.add_known(symbols)
+            if new_symbols:
+                for stored in self._articles:
+                    self.symbols.add(stored.article["id"], stored.article, new_symbols)
+            return len(new_symbols)
+
+    def by_symbol(
+        self,
+        symbol: str,
+        limit: int = 50,
+        start_ts: Optional[int] = None,
+        end_ts: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """심볼 관련 기사 조회 (최신순, 발행 시각 범위 필터)"""
+        with self._lock:
+            doc_ids = self.symbols.query(symbol, limit=limit, start_ts=start_ts, end_ts=end_ts)
+            return [self._by_id[doc_id].article for doc_id in doc_ids if doc_id in self._by_id]
+
+    def latest(
+        self,
+        limit: int = 30,
+        origins: Optional[Iterable[str]] = None,
+        sources: Optional[Iterable[str]] = None
+    ) -> List[Dict[str, Any]]:
+        """최신순 기사 조회"""
+        origin_set = set(origins) if origins else None
+        source_set = set(sources) if sources else None
+        result = []
+        with self._lock:
+            for stored in reversed(self._articles):
+                if origin_set and origin_set.isdisjoint(stored.origins):
+                    continue
+                if source_set and stored.article.get("source") not in source_set:
+                    continue
+                result.append(stored.article)
+                if len(result) >= limit:
+                    break
+        return result
+
+    def search(
+        self,
+        keyword: str,
+        limit: int = 20,
+        origins: Optional[Iterable[str]] = None,
+        sources: Optional[Iterable[str]] = None,
+        start_ts: Optional[int] = None,
+        end_ts: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        키워드 검색 (BM25 랭킹, 여러 단어 검색, 발행 시각 범위 필터)
+        
+        BM25 결과가 없으면 (단어 일부, 불용어만 있는 검색어 등) 제목/요약 부분 문자열 일치로 대체합니다.
+        
+        Returns:
+            관련도 순 기사 리스트 (동점이면 최신순, 부분 문자열 일치는 최신순)
+        """
+        origin_set = set(origins) if origins else None
+        source_set = set(sources) if sources else None
+
+        def accept(doc_id: str) -> bool:
+            stored = self._by_id.get(doc_id)
+            if stored is None:
+                return False
+            if origin_set and origin_set.isdisjoint(stored.origins):
+                return False
+            if source_set and stored.article.get("source") not in source_set:
+                return False
+            return True
+
+        with self._lock:
+            ranked = self.index.search(
+                keyword, limit=limit, start_ts=start_ts, end_ts=end_ts, accept=accept
+            )
+            if ranked:
+                return [self._by_id[doc_id].article for doc_id, _ in ranked]
+            return self._substring_search(keyword, limit, accept, start_ts, end_ts)
+
+    def _substring_search(
+        self,
+        keyword: str,
+        limit: int,
+        accept: Callable[[str], bool],
+        start_ts: Optional[int],
+        end_ts: Optional[int]
+    ) -> List[Dict[str, Any]]:
+        """제목 또는 요약에 검색어가 포함된 기사 (최신순, 호출자가 잠금 보유)"""
+        needle = keyword.strip().lower()
+        if not needle:
+            return []
+        result = []
+        for stored in reversed(self._articles):
+            article = stored.article
+            if start_ts is not None and stored.published < start_ts:
+                continue
+            if end_ts is not None and stored.published > end_ts:
+                continue
+            if needle not in article.get("headline", "").lower() and needle not in article.get("summary", "").lower():
+                continue
+            if accept(article["id"]):
+                result.append(article)
+                if len(result) >= limit:
+                    break
+        return result
+
+
+class NewsIngestionService:
+    """뉴스 수집 워커 (모든 소스를 주기적으로 폴링)"""
+
+    def __init__(self, store: Optional[ArticleStore] = None):
+        settings = get_settings()
+        self.store = store or ArticleStore(capacity=settings.news_store_capacity)
+        self.poll_interval = settings.news_poll_interval_seconds
+        self.watchlist = [
+            symbol.strip().upper()
+            for symbol in settings.news_watchlist_symbols.split(",")
+            if symbol.strip()
+        ]
+        self.symbol_fetch_ttl = settings.news_symbol_fetch_ttl_seconds
+        self.store.add_known_symbols(self.watchlist)
+        self._task: Optional[asyncio.Task] = None
+        self._ready: Optional[asyncio.Event] = None
+        # 새 기사 구독자 (SSE 스트림별 큐, None = 구독 종료 신호)
+        self._subscribers: Set["asyncio.Queue[Optional[StoredArticle]]"] = set()
+        # 워치리스트 외 심볼의 마지막 업스트림 조회 시각 (monotonic), 최근 사용 순
+        self._symbol_fetched: "OrderedDict[str, float]" = OrderedDict()
+        self._symbol_locks: "OrderedDict[str, asyncio.Lock]" = OrderedDict()
+
+    def ensure_started(self):
+        """워커가 실행 중이 아니면 시작 (이벤트 루프 안에서 호출)"""
+        if self._task is None or self._task.done():
+            self._ready = asyncio.Event()
+            self._task = asyncio.create_task(self._run())
+            logger.info("📰 뉴스 수집 워커 시작")
+
+    async def wait_ready(self, timeout: float = 10.0):
+        """첫 수집이 끝날 때까지 대기 (콜드 스타트 시 빈 응답 방지)"""
+        self.ensure_started()
+        if self._ready is None or self._ready.is_set():
+            return
+        try:
+            await asyncio.wait_for(self._ready.wait(), timeout=timeout)
+        except asyncio.TimeoutError:
+            logger.warning(f"News ingestion not ready after {timeout}s")
+
+    async def stop(self):
+        """워커 중지"""
+        if self._task and not self._task.done():
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+
+    def subscribe(self, maxsize: int = 256) -> "asyncio.Queue[Optional[StoredArticle]]":
+        """
+        새로 저장되는 기사 구독
+
+        모든 구독자가 하나의 수집 워커를 공유합니다. 구독자가 큐를 비우지 못해 가득 차면
+        구독을 끊고 None을 넣어 알립니다 (클라이언트는 Last-Event-ID로 다시 이어받음).
+        """
+        self.ensure_started()
+        queue: "asyncio.Queue[Optional[StoredArticle]]" = asyncio.Queue(maxsize=maxsize)
+        self._subscribers.add(queue)
+        return queue
+
+    def unsubscribe(self, queue: "asyncio.Queue[Optional[StoredArticle]]"):
+        """구독 해제"""
+        self._subscribers.discard(queue)
+
+    def _publish(self, stored: StoredArticle):
+        for queue in list(self._subscribers):
+            try:
+                queue.put_nowait(stored)
+            except asyncio.QueueFull:
+                self._subscribers.discard(queue)
+                queue.get_nowait()
+                queue.put_nowait(None)
+                logger.warning("News subscriber lagged behind; closing stream")
+
+    def _add(self, article: Dict[str, Any], origin: str) -> bool:
+        """저장소에 추가하고 구독자에게 전달"""
+        stored = self.store.add(article, origin)
+        if stored is None:
+            return False
+        self._publish(stored)
+        return True
+
+    async def _run(self):
+        while True:
+            try:
+                await self.poll_once()
+            except Exception as e:
+                logger.error(f"News ingestion error: {e}", exc_info=True)
+            finally:
+                if self._ready is not None:
+                    self._ready.set()
+            await asyncio.sleep(self.poll_interval)
+
+    async def poll_once(self) -> int:
+        """
+        모든 소스를 한 번 폴링하여 저장
+
+        Returns:
+            새로 저장된 기사 수
+        """
+        await self._refresh_known_symbols()
+        results = await asyncio.gather(
+            self._collect_rss(),
+            self._collect_market(),
+            *(self._collect_company(symbol) for symbol in self.watchlist),
+            return_exceptions=True
+        )
+
+        added = 0
+        for result in results:
+            if isinstance(result, BaseException):
+                logger.error(f"News source failed: {result}")
+                continue
+            origin, articles = result
+            for article in articles:
+                if self._add(article, origin):
+                    added += 1
+
+        logger.info(f"News ingestion: {added} new articles (store size: {len(self.store)})")
+        return added
+
+    async def company_news(
+        self,
+        symbol: str,
+        limit: int = 50,
+        start_ts: Optional[int] = None,
+        end_ts: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        심볼 관련 뉴스 조회 (모든 수집 소스에서 티커가 태깅된 기사)
+
+        워치리스트 외 심볼은 TTL마다 최대 한 번 Yahoo 종목 뉴스를 가져와 저장소에 보충하며,
+        업스트림에 기사가 있는 심볼만 티커 추출 대상에 등록합니다.
+
+        Raises:
+            ValueError: 심볼 형식이 잘못된 경우
+        """
+        symbol = symbol.strip().upper()
+        if not _SYMBOL_PATTERN.match(symbol):
+            raise ValueError(f"Invalid symbol: {symbol!r}")
+
+        if symbol not in self.watchlist and self._symbol_fetch_due(symbol):
+            async with self._symbol_lock(symbol):
+                if self._symbol_fetch_due(symbol):
+                    self._touch_symbol(self._symbol_fetched, symbol, time.monotonic())
+                    try:
+                        origin, articles = await self._collect_company(symbol, days=30)
+                    except Exception as e:
+                        logger.warning(f"Company news fetch failed for {symbol}: {e}")
+                        articles = []
+                    if articles:
+                        self.store.add_known_symbols([symbol])
+                        for article in articles:
+                            self._add(article, origin)
+
+        return self.store.by_symbol(symbol, limit=limit, start_ts=start_ts, end_ts=end_ts)
+
+    def _symbol_fetch_due(self, symbol: str) -> bool:
+        fetched = self._symbol_fetched.get(symbol)
+        return fetched is None or time.monotonic() - fetched >= self.symbol_fetch_ttl
+
+    def _symbol_lock(self, symbol: str) -> asyncio.Lock:
+        lock = self._symbol_locks.get(symbol)
+        if lock is not None:
+            self._symbol_locks.move_to_end(symbol)
+            return lock
+        if len(self._symbol_locks) >= MAX_TRACKED_SYMBOLS:
+            # 사용 중이 아닌 가장 오래된 락 제거 (사용 중인 락은 같은 심볼의 동시 조회를 묶고 있음)
+            for key, value in self._symbol_locks.items():
+                if not value.locked():
+                    del self._symbol_locks[key]
+                    break
+        lock = self._symbol_locks[symbol] = asyncio.Lock()
+        return lock
+
+    @staticmethod
+    def _touch_symbol(cache: "OrderedDict[str, Any]", symbol: str, value: Any):
+        """LRU 갱신 (상한을 넘으면 가장 오래 쓰지 않은 심볼 제거)"""
+        cache[symbol] = value
+        cache.move_to_end(symbol)
+        while len(cache) > MAX_TRACKED_SYMBOLS:
+            cache.popitem(last=False)
+
+    async def _refresh_known_symbols(self):
+        """저장소에 있는 ETF/주식 심볼을 티커 추출 대상에 추가"""
+        def list_symbols():
+            storage = get_storage_service()
+            if not storage.enabled:
+                return []
+            return [
+                symbol
+                for data_type in ("etf", "stock")
+                for symbol in storage.list_symbols(data_type)
+            ]
+
+        try:
+            symbols = await asyncio.to_thread(list_symbols)
+        except Exception as e:
+            logger.warning(f"Failed to load known symbols: {e}")
+            return
+        self.store.add_known_symbols(symbols)
+
+    async def _collect_rss(self):
+        rss = get_rss_news_service()
+        articles = await rss.fetch_news(limit=len(rss.RSS_FEEDS) * 100)
+        return ORIGIN_RSS, articles
+
+    async def _collect_market(self):
+        yfinance = get_yfinance_client()
+        articles = await asyncio.to_thread(yfinance.get_market_news)
+        return ORIGIN_MARKET, [self._normalize(article) for article in articles]
+
+    async def _collect_company(self, symbol: str, days: int = 7):
+        yfinance = get_yfinance_client()
+        end_date = datetime.now()
+        start_date = end_date - timedelta(days=days)
+        articles = await asyncio.to_thread(
+            yfinance.get_company_news,
+            symbol,
+            start_date.strftime("%Y-%m-%d"),
+            end_date.strftime("%Y-%m-%d")
+        )
+        return ORIGIN_COMPANY, [self._normalize(article) for article in articles]
+
+    @staticmethod
+    def _normalize(article: Dict[str, Any]) -> Dict[str, Any]:
+        """Yahoo 뉴스 항목을 RSS 기사와 같은 id 체계(URL md5)로 정규화"""
+        url = article.get("url") or ""
+        if not url:
+            return article
+        return {**article, "id": article_id_for_url(url)}
+
+
+# 싱글톤 인스턴스
+_news_ingestion_service: Optional[NewsIngestionService] = None
+
+
+def get_news_ingestion_service() -> NewsIngestionService:
+    """뉴스 수집 서비스 싱글톤"""
+    global _news_ingestion_service
+    if _news_ingestion_service is None:
+        _news_ingestion_service = NewsIngestionService()
+    return _news_ingestion_service
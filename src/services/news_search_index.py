@@ -0,0 +1,141 @@
+"""
+뉴스 역색인 (BM25 랭킹)
+수집된 기사에 대해 증분으로 유지되며 /api/v1/news/search를 네트워크 없이 처리합니다.
+"""
+import math
+import re
+import threading
+from collections import Counter
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+# 티커 표기($AAPL, ^GSPC, BRK.B)를 하나의 토큰으로 유지하고 나머지는 단어 단위로 분리
+_TOKEN_PATTERN = re.compile(r"[$^]?[A-Za-z]{1,5}\.[A-Za-z]{1,2}\b|[$^]?\w+")
+
+_STOPWORDS = frozenset(
+    "a an and are as at be by for from has have in into is it its of on or that the "
+    "to was were will with s".split()
+)
+
+# 헤드라인 토큰 가중치 (요약보다 제목 일치를 높게 평가)
+HEADLINE_WEIGHT = 2
+
+
+def tokenize(text: str) -> List[str]:
+    """
+    검색용 토큰화
+
+    - 소문자 정규화, 불용어 제거
+    - $AAPL, ^GSPC 같은 티커 표기는 접두사를 떼어 aapl, gspc로 색인
+    - BRK.B 같은 점 포함 티커는 분리하지 않음
+    """
+    if not text:
+        return []
+    tokens = []
+    for raw in _TOKEN_PATTERN.findall(text):
+        token = raw.lstrip("$^").lower()
+        if token and token not in _STOPWORDS:
+            tokens.append(token)
+    return tokens
+
+
+class NewsSearchIndex:
+    """기사 역색인 (term -> {doc_id: tf}) + BM25 점수 계산"""
+
+    def __init__(self, k1: float = 1.2, b: float = 0.75):
+        self.k1 = k1
+        self.b = b
+        self._lock = threading.RLock()
+        self._postings: Dict[str, Dict[str, int]] = {}
+        self._doc_lengths: Dict[str, int] = {}
+        self._doc_terms: Dict[str, Counter] = {}
+        self._doc_times: Dict[str, int] = {}
+        self._total_length = 0
+
+    def __len__(self) -> int:
+        return len(self._doc_lengths)
+
+    def add(self, doc_id: str, article: Dict[str, Any]):
+        """기사 색인 (같은 id는 교체)"""
+        terms = Counter(tokenize(article.get("headline", "")) * HEADLINE_WEIGHT)
+        terms.update(tokenize(article.get("summary", "")))
+        terms.update(tokenize(article.get("related", "")))
+
+        with self._lock:
+            if doc_id in self._doc_lengths:
+                self.remove(doc_id)
+            for term, tf in terms.items():
+                self._postings.setdefault(term, {})[doc_id] = tf
+            length = sum(terms.values())
+            self._doc_lengths[doc_id] = length
+            self._doc_terms[doc_id] = terms
+            self._doc_times[doc_id] = article.get("datetime") or 0
+            self._total_length += length
+
+    def remove(self, doc_id: str):
+        """기사 색인 제거"""
+        with self._lock:
+            terms = self._doc_terms.pop(doc_id, None)
+            if terms is None:
+                return
+            for term in terms:
+                postings = self._postings.get(term)
+                if postings is None:
+                    continue
+                postings.pop(doc_id, None)
+                if not postings:
+                    del self._postings[term]
+            self._total_length -= self._doc_lengths.pop(doc_id)
+            self._doc_times.pop(doc_id, None)
+
+    def search(
+        self,
+        query: str,
+        limit: int = 20,
+        start_ts: Optional[int] = None,
+        end_ts: Optional[int] = None,
+        accept: Optional[Callable[[str], bool]] = None
+    ) -> List[Tuple[str, float]]:
+        """
+        BM25 검색
+
+        Args:
+            query: 검색어 (여러 단어 가능, 일치 단어가 많을수록 높은 점수)
+            limit: 최대 결과 수
+            start_ts: 발행 시각 하한 (포함)
+            end_ts: 발행 시각 상한 (포함)
+            accept: 추가 필터 (doc_id -> bool)
+
+        Returns:
+            (doc_id, score) 리스트 (점수 내림차순, 동점이면 최신순)
+        """
+        terms = set(tokenize(query))
+        with self._lock:
+            doc_count = len(self._doc_lengths)
+            if not terms or not doc_count:
+                return []
+            avg_length = self._total_length / doc_count
+
+            scores: Dict[str, float] = {}
+            for term in terms:
+                postings = self._postings.get(term)
+                if not postings:
+                    continue
+                idf = math.log(1 + (doc_count - len(postings) + 0.5) / (len(postings) + 0.5))
+                for doc_id, tf in postings.items():
+                    published = self._doc_times[doc_id]
+                    if start_ts is not None and published < start_ts:
+                        continue
+                    if end_ts is not None and published > end_ts:
+                        continue
+                    norm = self.k1 * (1 - self.b + self.b * self._doc_lengths[doc_id] / avg_length)
+                    scores[doc_id] = scores.get(doc_id, 0.0) + idf * tf * (self.k1 + 1) / (tf + norm)
+
+            ranked = sorted(
+                scores.items(),
+                key=lambda item: (item[1], self._doc_times[item[0]]),
+                reverse=True
+            )
+
+        if accept is not None:
+            ranked = [item for item in ranked if accept(item[0])]
+        return ranked[:limit]
@@ -0,0 +1,213 @@
+"""
+스냅샷 보존 정책 및 압축(compaction) 서비스
+
+요청마다 저장되는 원본 스냅샷(holdings 전체 포함)을 심볼별 시간/일 단위 요약 문서로 롤업합니다.
+스냅샷 TTL(SNAPSHOT_TTL_SECONDS, 기본 비활성)은 첫 압축이 저장된 전체 이력을 요약한 뒤에만 적용하므로
+TTL을 켜도 요약되지 않은 스냅샷이 만료되지 않습니다.
+"""
+import asyncio
+import logging
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Tuple
+
+from ..config import get_settings
+from .storage_backend import StorageBackend, get_storage_service
+
+logger = logging.getLogger(__name__)
+
+GRANULARITY_SECONDS = {
+    "hour": 3600,
+    "day": 86400,
+}
+
+# 요약에서 제외하는 대용량 필드
+_HEAVY_PROFILE_FIELDS = ("description",)
+
+
+def summarize_snapshots(
+    snapshots: List[Dict[str, Any]],
+    symbol: str,
+    data_type: str,
+    granularity: str,
+    bucket_ts: int,
+    ttl: int
+) -> Dict[str, Any]:
+    """
+    한 구간(bucket)의 스냅샷을 요약 문서 하나로 롤업
+
+    Args:
+        snapshots: 구간 내 원본 스냅샷 (오래된 순)
+        symbol: 심볼
+        data_type: 원본 타입 (etf, stock)
+        granularity: hour 또는 day
+        bucket_ts: 구간 시작 (epoch seconds)
+        ttl: 요약 문서 TTL (-1 = 만료 없음)
+    """
+    quotes = [
+        snapshot["data"]["quote"]
+        for snapshot in snapshots
+        if isinstance(snapshot.get("data"), dict)
+        and isinstance(snapshot["data"].get("quote"), dict)
+        and snapshot["data"]["quote"].get("c") is not None
+    ]
+
+    quote: Dict[str, Any] = {}
+    if quotes:
+        quote = {
+            "open": quotes[0]["c"],
+            "high": max(q.get("h") or q["c"] for q in quotes),
+            "low": min(q.get("l") or q["c"] for q in quotes),
+            "close": quotes[-1]["c"],
+            "change_percent": quotes[-1].get("dp"),
+        }
+
+    profile: Dict[str, Any] = {}
+    for snapshot in reversed(snapshots):
+        candidate = snapshot.get("data", {}).get("profile") if isinstance(snapshot.get("data"), dict) else None
+        if candidate:
+            profile = {k: v for k, v in candidate.items() if k not in _HEAVY_PROFILE_FIELDS}
+            break
+
+    bucket_start = datetime.fromtimestamp(bucket_ts, timezone.utc).isoformat()
+    return {
+        "id": f"{data_type}_summary_{granularity}_{symbol}_{bucket_start}",
+        "symbol": symbol,
+        "type": f"{data_type}_summary",
+        "granularity": granularity,
+        "bucket_start": bucket_start,
+        "bucket_ts": bucket_ts,
+        "count": len(snapshots),
+        "first_timestamp": snapshots[0].get("timestamp"),
+        "last_timestamp": snapshots[-1].get("timestamp"),
+        "quote": quote,
+        "profile": profile,
+        "ttl": ttl,
+    }
+
+
+class SnapshotCompactor:
+    """원본 스냅샷을 시간/일 단위 요약으로 롤업"""
+
+    DATA_TYPES = ("etf", "stock")
+
+    def __init__(self, storage: Optional[StorageBackend] = None):
+        settings = get_settings()
+        self.storage = storage or get_storage_service()
+        self.ttls = {
+            "hour": settings.hourly_summary_ttl_seconds if settings.hourly_summary_ttl_seconds > 0 else -1,
+            "day": -1,
+        }
+        # (data_type, symbol, granularity) -> 요약이 끝난 구간의 끝 (이 시각 이전 구간은 다시 롤업하지 않음)
+        self._compacted_until: Dict[Tuple[str, str, str], int] = {}
+        self._snapshot_ttl_enabled = False
+
+    def compact(self, now_ts: Optional[int] = None) -> Dict[str, int]:
+        """
+        닫힌(완료된) 시간/일 구간을 요약
+
+        심볼·단위별 워터마크 이후에 닫힌 구간만 롤업합니다. 워터마크는 프로세스 첫 실행 시
+        저장된 마지막 요약 구간에서 복원하고, 요약이 없으면 가장 오래된 스냅샷부터 백필합니다.
+        요약 id가 구간으로 결정되므로 겹쳐 처리해도 결과는 같습니다.
+
+        모든 요약 저장이 성공한 실행 뒤에만 스냅샷 TTL을 적용하고 만료 문서를 삭제합니다.
+
+        Returns:
+            처리 통계 (snapshots, hour, day, failed, purged)
+        """
+        now_ts = now_ts or int(datetime.now(timezone.utc).timestamp())
+        stats = {"snapshots": 0, "hour": 0, "day": 0, "failed": 0, "purged": 0}
+
+        if not self.storage.enabled:
+            return stats
+
+        compacted_until: Dict[Tuple[str, str, str], int] = {}
+        for data_type in self.DATA_TYPES:
+            for symbol in self.storage.list_symbols(data_type):
+                for granularity, seconds in GRANULARITY_SECONDS.items():
+                    end_ts = now_ts - now_ts % seconds  # 현재 진행 중인 구간 제외
+                    key = (data_type, symbol, granularity)
+                    start_ts = self._watermark(key)
+                    compacted_until[key] = start_ts
+                    if start_ts >= end_ts:
+                        continue
+                    failed = stats["failed"]
+                    stats[granularity] += self._compact_range(
+                        symbol, data_type, granularity, start_ts, end_ts, stats
+                    )
+                    if stats["failed"] == failed:
+                        compacted_until[key] = end_ts
+        # 더 이상 저장되지 않은 심볼의 워터마크는 버림
+        self._compacted_until = compacted_until
+
+        if stats["failed"]:
+            # 요약되지 않은 스냅샷이 만료되지 않도록 TTL 적용/만료 삭제를 다음 실행으로 미룸
+            logger.warning(f"Snapshot compaction incomplete, skipping expiry: {stats}")
+            return stats
+
+        if not self._snapshot_ttl_enabled:
+            self._snapshot_ttl_enabled = self.storage.enable_snapshot_ttl()
+        if self._snapshot_ttl_enabled:
+            stats["purged"] = self.storage.purge_expired(now_ts)
+        logger.info(f"Snapshot compaction finished: {stats}")
+        return stats
+
+    def _watermark(self, key: Tuple[str, str, str]) -> int:
+        """이미 요약된 구간의 끝 (처음 보는 심볼·단위는 저장된 마지막 요약에서 복원, 없으면 0 = 전체 백필)"""
+        if key in self._compacted_until:
+            return self._compacted_until[key]
+        data_type, symbol, granularity = key
+        latest = self.storage.latest_summary_ts(symbol, data_type, granularity)
+        if latest is None:
+            return 0
+        return latest + GRANULARITY_SECONDS[granularity]
+
+    def _compact_range(
+        self,
+        symbol: str,
+        data_type: str,
+        granularity: str,
+        start_ts: int,
+        end_ts: int,
+        stats: Dict[str, int]
+    ) -> int:
+        """구간별로 스냅샷을 모아 요약 저장 (스트리밍, 구간 하나 분량만 메모리에 유지)"""
+        seconds = GRANULARITY_SECONDS[granularity]
+        written = 0
+        bucket_ts: Optional[int] = None
+        bucket: List[Dict[str, Any]] = []
+
+        def flush():
+            nonlocal written
+            if bucket and bucket_ts is not None:
+                summary = summarize_snapshots(
+                    bucket, symbol, data_type, granularity, bucket_ts, self.ttls[granularity]
+                )
+                if self.storage.upsert_summary(summary):
+                    written += 1
+                else:
+                    stats["failed"] += 1
+
+        for snapshot in self.storage.iter_snapshots(symbol, data_type, start_ts, end_ts):
+            if granularity == "hour":
+                stats["snapshots"] += 1
+            snapshot_bucket = snapshot["_ts"] - snapshot["_ts"] % seconds
+            if snapshot_bucket != bucket_ts:
+                flush()
+                bucket_ts = snapshot_bucket
+                bucket = []
+            bucket.append(snapshot)
+        flush()
+        return written
+
+
+async def run_compaction_loop():
+    """주기적으로 압축 실행 (블로킹 I/O는 스레드에서 수행)"""
+    settings = get_settings()
+    compactor = SnapshotCompactor()
+
+    while True:
+        try:
+            await asyncio.to_thread(compactor.compact)
+        except Exception as e:
+            logger.error(f"Snapshot compaction error: {e}", exc_info=True)
+        await asyncio.sleep(settings.compaction_interval_seconds)
@@ -0,0 +1,129 @@
+"""
+RSS 항목 정규화
+feedparser 항목을 뉴스 기사 형식으로 변환합니다 (HTML 제거, 엔티티 복원, 공백 정리).
+같은 기사는 피드를 다시 받아도 변환 결과를 재사용합니다 (제목/요약/수정 시각이 바뀌면 다시 변환).
+"""
+import hashlib
+import html
+import re
+import threading
+from collections import OrderedDict
+from datetime import datetime
+from time import mktime
+from typing import Any, Dict, Mapping, Optional, Tuple
+
+_TAG_PATTERN = re.compile(r"<[^<>]*>")
+
+SUMMARY_MAX_LENGTH = 500
+
+
+def clean_text(text: Any, max_length: Optional[int] = None) -> str:
+    """
+    HTML 텍스트 정리
+
+    태그 제거 -> 엔티티 복원(&amp; -> &) -> 연속 공백 축약 순으로 처리합니다.
+    태그/엔티티가 없는 일반 텍스트는 정규식을 건너뜁니다.
+    """
+    if not text:
+        return ""
+    text = str(text)
+    if "<" in text:
+        text = _TAG_PATTERN.sub(" ", text)
+    if "&" in text:
+        text = html.unescape(text)
+        # 엔티티로 인코딩된 태그(&lt;p&gt;)가 복원된 경우
+        if "<" in text:
+            text = _TAG_PATTERN.sub(" ", text)
+    text = " ".join(text.split())
+    if max_length is not None:
+        text = text[:max_length]
+    return text
+
+
+def _published_time(fields: Mapping[str, Any]) -> int:
+    parsed = fields.get("published_parsed") or fields.get("updated_parsed")
+    if parsed:
+        try:
+            return int(mktime(parsed))
+        except (TypeError, ValueError, OverflowError):
+            pass
+    return int(datetime.now().timestamp())
+
+
+def _image_url(fields: Mapping[str, Any]) -> str:
+    media = fields.get("media_content") or fields.get("media_thumbnail")
+    if media:
+        return str(media[0].get("url", ""))
+    # feedparser는 enclosure를 links에 rel="enclosure"로 보관
+    enclosures = fields.get("enclosures") or [
+        link for link in fields.get("links") or () if link.get("rel") == "enclosure"
+    ]
+    for enclosure in enclosures:
+        if "image" in str(enclosure.get("type", "")):
+            return str(enclosure.get("href", ""))
+    return ""
+
+
+def _fingerprint(fields: Mapping[str, Any]) -> int:
+    """변환 결과에 영향을 주는 원본 필드의 지문 (같은 링크의 수정된 항목 감지)"""
+    return hash((
+        fields.get("title"),
+        fields.get("summary") or fields.get("description"),
+        fields.get("published"),
+        fields.get("updated"),
+    ))
+
+
+class EntryNormalizer:
+    """
+    feedparser 항목 -> 기사 dict 변환기
+
+    (소스, 링크)로 변환 결과를 LRU 캐시하여, 주기적 재수집 시 이미 본 기사의
+    HTML 정리와 md5 계산을 반복하지 않습니다. 원본 제목/요약/발행·수정 시각의 지문을
+    함께 저장해 두고, 지문이 다르면(기사 수정) 다시 변환해 캐시를 교체합니다.
+    """
+
+    def __init__(self, capacity: int = 5000):
+        self.capacity = capacity
+        self._lock = threading.Lock()
+        # (소스, 링크) -> (원본 지문, 기사)
+        self._cache: "OrderedDict[Tuple[str, str], Tuple[int, Dict[str, Any]]]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+    def normalize(self, entry: Mapping[str, Any], source: str) -> Dict[str, Any]:
+        """항목 하나를 기사로 변환 (캐시된 결과는 복사본 반환)"""
+        # FeedParserDict.get은 키 별칭 처리로 느리므로 일반 dict로 복사해 조회
+        fields = dict(entry)
+        link = str(fields.get("link") or "")
+        key = (source, link)
+        fingerprint = _fingerprint(fields)
+        if link:
+            with self._lock:
+                cached = self._cache.get(key)
+                if cached is not None and cached[0] == fingerprint:
+                    self._cache.move_to_end(key)
+                    return dict(cached[1])
+
+        article = {
+            "category": "market",
+            "datetime": _published_time(fields),
+            "headline": clean_text(fields.get("title")),
+            "id": hashlib.md5(link.encode("utf-8")).hexdigest(),
+            "image": _image_url(fields),
+            "related": source,
+            "source": source,
+            "summary": clean_text(
+                fields.get("summary") or fields.get("description"), SUMMARY_MAX_LENGTH
+            ),
+            "url": link,
+        }
+
+        if link:
+            with self._lock:
+                self._cache[key] = (fingerprint, article)
+                self._cache.move_to_end(key)
+                if len(self._cache) > self.capacity:
+                    self._cache.popitem(last=False)
+        return dict(article)
@@ -1,19 +1,30 @@
 """
 RSS 피드 뉴스 서비스
 """
-import hashlib
+import asyncio
 import logging
-from datetime import datetime
-from time import mktime
+import time
+from dataclasses import dataclass, field
 from typing import Any, Dict, List, Optional
 
 import feedparser
+import httpx
 
 from ..observability import trace_span
+from .rss_entry_normalizer import EntryNormalizer
 
 logger = logging.getLogger(__name__)
 
 
+@dataclass
+class FeedState:
+    """피드별 캐시 상태 (조건부 요청용 검증자 + 파싱 결과)"""
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    entries: List[Dict[str, Any]] = field(default_factory=list)
+    fetched_at: float = 0.0
+
+
 class RSSNewsService:
     """RSS 피드에서 금융 뉴스를 가져오는 서비스"""
     
@@ -26,14 +37,33 @@ class RSSNewsService:
         "investing": "https://www.investing.com/rss/news.rss",
     }
     
+    # 피드별 요청 timeout (초) - 느린 피드는 자신의 timeout만큼만 지연
+    FEED_TIMEOUT = 5.0
+    FEED_TIMEOUTS: Dict[str, float] = {
+        "reuters_business": 3.0,
+    }
+    
+    # 이 시간 동안은 캐시된 항목을 그대로 사용하고, 이후에는 조건부 요청으로 갱신 확인
+    FEED_CACHE_TTL = 300.0
+    
+    HEADERS = {
+        "User-Agent": "Mozilla/5.0 (compatible; etf-agent/0.1; +https://github.com/dotnetpower/sk-appinsights)",
+        "Accept": "application/rss+xml, application/xml;q=0.9, */*;q=0.8",
+    }
+    
+    def __init__(self):
+        self._feed_states: Dict[str, FeedState] = {}
+        self._feed_locks: Dict[str, asyncio.Lock] = {}
+        self._normalizer = EntryNormalizer()
+    
     @trace_span(name="rss.fetch_news", attributes={"source": "rss"})
-    def fetch_news(
+    async def fetch_news(
         self, 
         sources: Optional[List[str]] = None,
         limit: int = 30
     ) -> List[Dict[str, Any]]:
         """
-        RSS 피드에서 뉴스 가져오기
+        RSS 피드에서 뉴스 가져오기 (피드별 동시 요청)
         
         Args:
             sources: 사용할 RSS 소스 리스트 (None이면 모든 소스)
@@ -45,110 +75,101 @@ class RSSNewsService:
         if sources is None:
             sources = list(self.RSS_FEEDS.keys())
         
-        all_news = []
-        
+        valid_sources = []
         for source in sources:
             if source not in self.RSS_FEEDS:
                 logger.warning(f"Unknown RSS source: {source}")
                 continue
-            
-            try:
-                feed_url = self.RSS_FEEDS[source]
-                news_items = self._parse_feed(feed_url, source)
-                all_news.extend(news_items)
-                logger.info(f"Fetched {len(news_items)} articles from {source}")
-            except Exception as e:
-                logger.error(f"Error fetching RSS from {source}: {e}")
-                continue
+            valid_sources.append(source)
+        
+        async with httpx.AsyncClient(headers=self.HEADERS, follow_redirects=True) as client:
+            results = await asyncio.gather(
+                *(self._fetch_source(client, source) for source in valid_sources)
+            )
+        
+        all_news = []
+        for news_items in results:
+            all_news.extend(news_items)
         
         # 시간순 정렬 (최신순)
         all_news.sort(key=lambda x: x.get('datetime', 0), reverse=True)
         
         return all_news[:limit]
     
-    def _parse_feed(self, feed_url: str, source: str) -> List[Dict[str, Any]]:
+    async def _fetch_source(self, client: httpx.AsyncClient, source: str) -> List[Dict[str, Any]]:
+        """
+        단일 RSS 소스 조회 (캐시 + 조건부 GET)
+        
+        - TTL 이내: 네트워크 요청 없이 캐시 반환
+        - TTL 경과: ETag/Last-Modified로 조건부 요청, 304면 파싱 없이 캐시 재사용
+        - 실패/timeout: 이전 캐시(없으면 빈 리스트)를 반환하여 다른 소스에 영향을 주지 않음
+        """
+        lock = self._feed_locks.setdefault(source, asyncio.Lock())
+        # 같은 피드에 대한 동시 요청은 한 번만 갱신
+        async with lock:
+            state = self._feed_states.setdefault(source, FeedState())
+            if state.fetched_at and time.monotonic() - state.fetched_at < self.FEED_CACHE_TTL:
+                return state.entries
+            
+            feed_url = self.RSS_FEEDS[source]
+            timeout = self.FEED_TIMEOUTS.get(source, self.FEED_TIMEOUT)
+            
+            headers = {}
+            if state.etag:
+                headers["If-None-Match"] = state.etag
+            if state.last_modified:
+                headers["If-Modified-Since"] = state.last_modified
+            
+            try:
+                # httpx timeout은 연결/읽기 단계별이므로 전체 소요 시간은 wait_for로 제한
+                response = await asyncio.wait_for(
+                    client.get(feed_url, headers=headers, timeout=timeout),
+                    timeout=timeout
+                )
+                if response.status_code == 304:
+                    state.fetched_at = time.monotonic()
+                    logger.debug(f"RSS not modified: {source}")
+                    return state.entries
+                response.raise_for_status()
+            except asyncio.TimeoutError:
+                logger.warning(f"RSS fetch timed out after {timeout}s: {source}")
+                return state.entries
+            except httpx.HTTPError as e:
+                logger.error(f"Error fetching RSS from {source}: {type(e).__name__} {e}")
+                return state.entries
+            
+            # 파싱은 CPU 작업이므로 이벤트 루프를 막지 않도록 스레드에서 수행
+            news_items = await asyncio.to_thread(self._parse_feed, response.content, source)
+            state.etag = response.headers.get("etag")
+            state.last_modified = response.headers.get("last-modified")
+            state.entries = news_items
+            state.fetched_at = time.monotonic()
+            logger.info(f"Fetched {len(news_items)} articles from {source}")
+            return news_items
+    
+    def _parse_feed(self, content: bytes, source: str) -> List[Dict[str, Any]]:
         """
         RSS 피드 파싱
         
         Args:
-            feed_url: RSS 피드 URL
+            content: 다운로드한 RSS 피드 본문
             source: 소스 이름
             
         Returns:
             파싱된 뉴스 리스트
         """
         try:
-            feed = feedparser.parse(feed_url)
+            feed = feedparser.parse(content)
             
             if not feed.entries:
-                logger.warning(f"No entries found in RSS feed: {feed_url}")
+                logger.warning(f"No entries found in RSS feed: {source}")
                 return []
             
             news_list = []
             
             for entry in feed.entries[:20]:  # 각 소스에서 최대 20개
                 try:
-                    # 발행 시간 파싱
-                    published_time = None
-                    if hasattr(entry, 'published_parsed') and entry.published_parsed:
-                        try:
-                            published_time = int(mktime(entry.published_parsed))  # type: ignore
-                        except (TypeError, ValueError):
-                            published_time = int(datetime.now().timestamp())
-                    elif hasattr(entry, 'updated_parsed') and entry.updated_parsed:
-                        try:
-                            published_time = int(mktime(entry.updated_parsed))  # type: ignore
-                        except (TypeError, ValueError):
-                            published_time = int(datetime.now().timestamp())
-                    else:
-                        published_time = int(datetime.now().timestamp())
-                    
-                    # 이미지 URL 추출
-                    image_url = ""
-                    if hasattr(entry, 'media_content') and entry.media_content:
-                        image_url = str(entry.media_content[0].get('url', ''))
-                    elif hasattr(entry, 'media_thumbnail') and entry.media_thumbnail:
-                        image_url = str(entry.media_thumbnail[0].get('url', ''))
-                    elif hasattr(entry, 'enclosures') and entry.enclosures:
-                        for enclosure in entry.enclosures:
-                            enc_type = str(enclosure.get('type', ''))
-                            if 'image' in enc_type:
-                                image_url = str(enclosure.get('href', ''))
-                                break
-                    
-                    # 요약문 추출
-                    summary = ""
-                    if hasattr(entry, 'summary'):
-                        summary = str(entry.summary)
-                    elif hasattr(entry, 'description'):
-                        summary = str(entry.description)
-                    
-                    # HTML 태그 제거
-                    if summary:
-                        import re
-                        summary = re.sub('<[^<]+?>', '', summary)
-                        summary = summary.strip()[:500]  # 최대 500자
-                    
-                    # 고유 ID 생성 (URL 기반 해시)
-                    link_str = str(entry.link) if hasattr(entry, 'link') else ""
-                    article_id = hashlib.md5(
-                        link_str.encode('utf-8')
-                    ).hexdigest()
-                    
-                    news_item = {
-                        "category": "market",
-                        "datetime": published_time,
-                        "headline": str(entry.title) if hasattr(entry, 'title') else "",
-                        "id": article_id,
-                        "image": image_url,
-                        "related": source,
-                        "source": source,
-                        "summary": summary,
-                        "url": link_str,
-                    }
-                    
-                    news_list.append(news_item)
-                    
+                    news_list.append(self._normalizer.normalize(entry, source))
                 except Exception as e:
                     logger.error(f"Error parsing RSS entry: {e}")
                     continue
@@ -156,38 +177,8 @@ class RSSNewsService:
             return news_list
             
         except Exception as e:
-            logger.error(f"Error parsing RSS feed {feed_url}: {e}")
+            logger.error(f"Error parsing RSS feed {source}: {e}")
             return []
-    
-    @trace_span(name="rss.search_news")
-    def search_news(
-        self, 
-        keyword: str,
-        sources: Optional[List[str]] = None,
-        limit: int = 20
-    ) -> List[Dict[str, Any]]:
-        """
-        키워드로 뉴스 검색
-        
-        Args:
-            keyword: 검색 키워드
-            sources: 검색할 RSS 소스
-            limit: 최대 결과 개수
-            
-        Returns:
-            검색된 뉴스 리스트
-        """
-        all_news = self.fetch_news(sources=sources, limit=100)
-        
-        # 키워드 필터링 (제목 또는 요약에 포함)
-        keyword_lower = keyword.lower()
-        filtered_news = [
-            news for news in all_news
-            if keyword_lower in news.get('headline', '').lower()
-            or keyword_lower in news.get('summary', '').lower()
-        ]
-        
-        return filtered_news[:limit]
 
 
 # 싱글톤 인스턴스
@@ -0,0 +1,248 @@
+"""
+스냅샷 저장소 공통 인터페이스
+Cosmos DB와 로컬(SQLite) 백엔드가 동일한 API를 구현합니다.
+"""
+import base64
+import json
+import threading
+from abc import ABC, abstractmethod
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from opentelemetry import trace
+
+from ..config import get_settings
+from .symbol_search_index import SymbolSearchIndex
+
+# OpenTelemetry tracer
+tracer = trace.get_tracer(__name__)
+
+
+def encode_cursor(state: Dict[str, Any]) -> str:
+    """페이지 상태를 URL-safe cursor 문자열로 인코딩"""
+    raw = json.dumps(state, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Dict[str, Any]:
+    """
+    cursor 문자열 디코딩
+    
+    Raises:
+        ValueError: 올바르지 않은 cursor
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        state = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+    except (ValueError, UnicodeError) as e:
+        raise ValueError(f"Invalid cursor: {cursor}") from e
+    if not isinstance(state, dict):
+        raise ValueError(f"Invalid cursor: {cursor}")
+    return state
+
+
+class StorageBackend(ABC):
+    """ETF/주식 스냅샷 저장소 인터페이스"""
+
+    enabled: bool
+
+    def __init__(self):
+        self._search_index: Optional[SymbolSearchIndex] = None
+        self._search_index_lock = threading.Lock()  # 인덱스 구축 (인스턴스당 한 번)
+        # 구축 중 저장/삭제된 문서 - 게시 직전에 재생 (None이면 구축 중 아님)
+        self._index_updates: Optional[List[Callable[[SymbolSearchIndex], Any]]] = None
+        self._index_updates_lock = threading.Lock()
+
+    @abstractmethod
+    def save_etf_data(self, symbol: str, data: Dict[str, Any]) -> bool:
+        """ETF 데이터 저장"""
+
+    @abstractmethod
+    def save_stock_data(self, symbol: str, data: Dict[str, Any]) -> bool:
+        """주식 데이터 저장"""
+
+    @abstractmethod
+    def get_latest_data(self, symbol: str, data_type: str = "stock") -> Optional[Dict[str, Any]]:
+        """최신 데이터 조회"""
+
+    @abstractmethod
+    def get_all_etfs(self, limit: int = 50) -> List[Dict[str, Any]]:
+        """모든 ETF 데이터 조회 (심볼별 최신 데이터)"""
+
+    @abstractmethod
+    def get_etfs_page(
+        self,
+        limit: int = 50,
+        cursor: Optional[str] = None
+    ) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """
+        심볼별 최신 ETF 한 페이지 조회 (심볼순)
+
+        cursor는 마지막 심볼을 담는 keyset이므로 크기가 일정하고, 조회 중 새 스냅샷이
+        저장되어도 심볼이 건너뛰어지거나 중복되지 않습니다.
+
+        Args:
+            limit: 페이지당 최대 심볼 수
+            cursor: 이전 페이지가 반환한 cursor (None이면 첫 페이지)
+
+        Returns:
+            (ETF 리스트, 다음 페이지 cursor 또는 None)
+
+        Raises:
+            ValueError: 올바르지 않은 cursor
+        """
+
+    @abstractmethod
+    def delete_etf_data(self, symbol: str) -> bool:
+        """ETF 데이터 삭제 (해당 심볼의 모든 기록)"""
+
+    @abstractmethod
+    def list_symbols(self, data_type: str) -> List[str]:
+        """타입별 저장된 심볼 목록"""
+
+    @abstractmethod
+    def iter_snapshots(
+        self,
+        symbol: str,
+        data_type: str,
+        start_ts: int,
+        end_ts: int
+    ) -> Iterator[Dict[str, Any]]:
+        """[start_ts, end_ts) 구간의 원본 스냅샷 (오래된 순)"""
+
+    @abstractmethod
+    def upsert_summary(self, document: Dict[str, Any]) -> bool:
+        """시간/일 단위 요약 문서 저장 (같은 id는 덮어씀)"""
+
+    @abstractmethod
+    def get_summaries(
+        self,
+        symbol: str,
+        data_type: str,
+        granularity: str,
+        start_ts: int,
+        end_ts: int
+    ) -> List[Dict[str, Any]]:
+        """[start_ts, end_ts) 구간의 요약 문서 (오래된 순)"""
+
+    @abstractmethod
+    def latest_summary_ts(self, symbol: str, data_type: str, granularity: str) -> Optional[int]:
+        """가장 최근 요약 구간 시작 (epoch seconds, 요약이 없으면 None)"""
+
+    def enable_snapshot_ttl(self) -> bool:
+        """
+        스냅샷 TTL 적용 (압축이 저장된 이력을 모두 요약한 뒤 호출)
+
+        Returns:
+            적용 완료 여부 (False면 다음 압축 후 다시 시도)
+        """
+        return True
+
+    def purge_expired(self, now_ts: int) -> int:
+        """
+        만료된 문서 삭제 (TTL을 자체 지원하지 않는 백엔드용, enable_snapshot_ttl 이후에만 호출)
+
+        Returns:
+            삭제된 문서 수
+        """
+        return 0
+
+    @abstractmethod
+    def _iter_index_documents(self) -> Iterator[Dict[str, Any]]:
+        """검색 인덱스 초기 구축용 스냅샷 문서 (etf/stock)"""
+
+    def _get_search_index(self) -> SymbolSearchIndex:
+        """검색 인덱스 (최초 검색 시 저장된 스냅샷으로 한 번만 구축, 조회 중 오류는 그대로 전파)"""
+        if self._search_index is None:
+            with self._search_index_lock:
+                if self._search_index is None:
+                    with self._index_updates_lock:
+                        self._index_updates = []
+                    try:
+                        index = SymbolSearchIndex()
+                        for document in self._iter_index_documents():
+                            index.add(document)
+                        with self._index_updates_lock:
+                            # 조회 중 커밋된 쓰기는 결과에 없을 수 있으므로 재생 후 게시
+                            for update in self._index_updates:
+                                update(index)
+                            self._search_index = index
+                    finally:
+                        with self._index_updates_lock:
+                            self._index_updates = None
+        return self._search_index
+
+    def _update_search_index(self, update: Callable[[SymbolSearchIndex], Any]):
+        """검색 인덱스 변경 (구축 전이면 무시, 구축 중이면 기록했다가 게시 직전에 재생)"""
+        with self._index_updates_lock:
+            index = self._search_index
+            if index is None:
+                if self._index_updates is not None:
+                    self._index_updates.append(update)
+                return
+        update(index)
+
+    def _index_document(self, document: Dict[str, Any]):
+        """저장된 문서를 검색 인덱스에 반영"""
+        self._update_search_index(lambda index: index.add(document))
+
+    def _unindex_symbol(self, symbol: str, data_type: str):
+        """삭제된 심볼을 검색 인덱스에서 제거"""
+        self._update_search_index(lambda index: index.remove(symbol, data_type))
+
+    def _expire_search_index(self, cutoff_ts: int):
+        """스냅샷 TTL이 지난 심볼을 검색 인덱스에서 제거"""
+        self._update_search_index(lambda index: index.remove_older_than(cutoff_ts))
+
+    def search_data(self, query_text: str, limit: int = 20) -> List[Dict[str, Any]]:
+        """
+        데이터 검색 (심볼 prefix 또는 이름 토큰, 대소문자 무시)
+
+        Returns:
+            심볼·타입별 최신 항목 (id, symbol, type, name, timestamp, _ts) - 전체 데이터는 get_latest_data로 조회
+        """
+        if not self.enabled:
+            return []
+
+        with tracer.start_as_current_span(
+            "search_index.search",
+            attributes={"search_query": query_text, "max_item_count": limit}
+        ) as span:
+            try:
+                index = self._get_search_index()
+            except Exception as e:
+                # 구축 실패 시 인덱스를 게시하지 않음 - 다음 검색에서 다시 구축
+                span.record_exception(e)
+                print(f"Error building search index: {e}")
+                return []
+            results = index.search(query_text, limit=limit)
+            span.set_attribute("search.response.count", len(results))
+            return results
+
+
+# 싱글톤 인스턴스
+_storage_service: Optional[StorageBackend] = None
+
+
+def get_storage_service() -> StorageBackend:
+    """
+    설정에 맞는 저장소 백엔드 싱글톤
+
+    STORAGE_BACKEND:
+        - cosmos: Azure Cosmos DB
+        - local: 로컬 SQLite 파일 (LOCAL_STORE_PATH)
+        - auto: COSMOS_ENDPOINT가 설정되어 있으면 cosmos, 아니면 local
+    """
+    global _storage_service
+    if _storage_service is None:
+        settings = get_settings()
+        backend = settings.storage_backend.lower()
+        if backend == "auto":
+            backend = "cosmos" if settings.cosmos_endpoint else "local"
+
+        if backend == "local":
+            from .local_store_service import get_local_store_service
+            _storage_service = get_local_store_service()
+        else:
+            from .cosmos_service import get_cosmos_service
+            _storage_service = get_cosmos_service()
+    return _storage_service
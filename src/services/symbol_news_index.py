@@ -0,0 +1,125 @@
+"""
+심볼별 뉴스 인덱스
+수집된 모든 기사의 헤드라인/요약에서 알려진 티커를 추출해 심볼 -> 기사(발행 시각순) 목록을 유지합니다.
+/api/v1/stocks/{symbol}/news를 업스트림 호출 없이 날짜 범위로 처리합니다.
+"""
+import re
+import threading
+from bisect import bisect_left, bisect_right, insort
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+# $AAPL, (AAPL), NASDAQ: AAPL, BRK.B, 그리고 대문자 단어
+_TICKER_PATTERN = re.compile(
+    r"(\$|\(|\b(?:NYSE Arca|NYSEARCA|NYSE|NASDAQ|Nasdaq|AMEX)\s*:\s*)?"
+    r"(?<![\w.])([A-Z]{1,5}(?:\.[A-Z]{1,2})?)(?![\w])"
+)
+
+
+def extract_tickers(text: str, known_symbols: Set[str]) -> Set[str]:
+    """
+    텍스트에서 알려진 티커 추출
+
+    - 대문자 표기만 인정 (일반 단어 오인 방지)
+    - 한 글자 티커(F, T 등)는 $F, (F), NYSE: F 처럼 명시된 경우만 인정
+    """
+    if not text:
+        return set()
+    found = set()
+    for marker, ticker in _TICKER_PATTERN.findall(text):
+        if ticker not in known_symbols:
+            continue
+        if len(ticker) == 1 and not marker:
+            continue
+        found.add(ticker)
+    return found
+
+
+class SymbolNewsIndex:
+    """심볼 -> [(발행 시각, 기사 id)] 정렬 목록"""
+
+    def __init__(self, known_symbols: Optional[Iterable[str]] = None):
+        self._lock = threading.RLock()
+        self.known_symbols: Set[str] = set()
+        self._postings: Dict[str, List[Tuple[int, str]]] = {}
+        self._doc_symbols: Dict[str, Set[str]] = {}
+        if known_symbols:
+            self.add_known(known_symbols)
+
+    def add_known(self, symbols: Iterable[str]) -> Set[str]:
+        """
+        추출 대상 심볼 등록
+
+        Returns:
+            새로 등록된 심볼 (기존 기사 재태깅용)
+        """
+        new_symbols = {symbol.strip().upper() for symbol in symbols if symbol and symbol.strip()}
+        with self._lock:
+            new_symbols -= self.known_symbols
+            self.known_symbols |= new_symbols
+        return new_symbols
+
+    def tag(self, article: Dict[str, Any], symbols: Optional[Set[str]] = None) -> Set[str]:
+        """
+        기사의 관련 심볼 추출 (헤드라인, 요약, related 필드)
+
+        Args:
+            symbols: 비교 대상 심볼 (기본: 등록된 전체)
+        """
+        symbols = self.known_symbols if symbols is None else symbols
+        text = f"{article.get('headline', '')}\n{article.get('summary', '')}"
+        tags = extract_tickers(text, symbols)
+        for related in (article.get("related") or "").split(","):
+            related = related.strip().upper()
+            if related in symbols:
+                tags.add(related)
+        return tags
+
+    def add(self, doc_id: str, article: Dict[str, Any], symbols: Optional[Set[str]] = None) -> Set[str]:
+        """기사 색인 (symbols가 주어지면 해당 심볼만 추가 태깅)"""
+        tags = self.tag(article, symbols)
+        if not tags:
+            return tags
+        entry = (article.get("datetime") or 0, doc_id)
+        with self._lock:
+            existing = self._doc_symbols.setdefault(doc_id, set())
+            for symbol in tags - existing:
+                insort(self._postings.setdefault(symbol, []), entry)
+            existing |= tags
+        return tags
+
+    def remove(self, doc_id: str, published: int):
+        """기사 색인 제거"""
+        entry = (published or 0, doc_id)
+        with self._lock:
+            for symbol in self._doc_symbols.pop(doc_id, ()):
+                postings = self._postings.get(symbol)
+                if not postings:
+                    continue
+                position = bisect_left(postings, entry)
+                if position < len(postings) and postings[position] == entry:
+                    del postings[position]
+                if not postings:
+                    del self._postings[symbol]
+
+    def symbols_for(self, doc_id: str) -> Set[str]:
+        """기사에 태깅된 심볼"""
+        with self._lock:
+            return set(self._doc_symbols.get(doc_id, ()))
+
+    def query(
+        self,
+        symbol: str,
+        limit: int = 50,
+        start_ts: Optional[int] = None,
+        end_ts: Optional[int] = None
+    ) -> List[str]:
+        """
+        심볼 관련 기사 id 조회 (최신순, 발행 시각 범위 포함)
+        """
+        with self._lock:
+            postings = self._postings.get(symbol.upper())
+            if not postings:
+                return []
+            low = bisect_left(postings, (start_ts, "")) if start_ts is not None else 0
+            high = bisect_right(postings, (end_ts, "\uffff")) if end_ts is not None else len(postings)
+            return [doc_id for _, doc_id in reversed(postings[max(low, high - limit):high])]
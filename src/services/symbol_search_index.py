@@ -0,0 +1,194 @@
+"""
+저장된 ETF/주식 스냅샷 인메모리 검색 인덱스
+심볼 prefix trie + 이름 토큰 역색인으로 CONTAINS 전체 스캔을 대체합니다.
+"""
+import re
+import threading
+from bisect import bisect_left, insort
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+_TOKEN_PATTERN = re.compile(r"\w+")
+
+# (symbol, type)
+IndexKey = Tuple[str, str]
+
+
+def tokenize_name(text: str) -> List[str]:
+    """이름을 소문자 토큰으로 분리 (대소문자 무시)"""
+    return _TOKEN_PATTERN.findall(text.casefold()) if text else []
+
+
+def extract_name(data: Any) -> str:
+    """스냅샷 data에서 종목명 추출 (data.name 또는 data.profile.name)"""
+    if not isinstance(data, dict):
+        return ""
+    name = data.get("name")
+    if not name and isinstance(data.get("profile"), dict):
+        name = data["profile"].get("name")
+    return name if isinstance(name, str) else ""
+
+
+def _index_entry(document: Dict[str, Any]) -> Dict[str, Any]:
+    """인덱스에 보관할 항목 (holdings 등 전체 data 대신 종목명만)"""
+    name = document.get("name")
+    return {
+        "id": document.get("id"),
+        "symbol": document["symbol"],
+        "type": document["type"],
+        "name": name if isinstance(name, str) else extract_name(document.get("data")),
+        "timestamp": document.get("timestamp"),
+        "_ts": document.get("_ts", 0),
+    }
+
+
+class _TrieNode:
+    __slots__ = ("children", "keys")
+
+    def __init__(self):
+        self.children: Dict[str, "_TrieNode"] = {}
+        # 이 노드 아래(서브트리)에 있는 모든 키
+        self.keys: Set[IndexKey] = set()
+
+
+class SymbolSearchIndex:
+    """심볼/이름 검색 인덱스 (심볼·타입별 최신 문서 1건 유지)"""
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._trie = _TrieNode()
+        self._name_postings: Dict[str, Set[IndexKey]] = {}
+        self._vocabulary: List[str] = []  # prefix 검색용 정렬된 토큰 목록
+        self._documents: Dict[IndexKey, Dict[str, Any]] = {}
+        self._document_tokens: Dict[IndexKey, Set[str]] = {}
+
+    def __len__(self) -> int:
+        return len(self._documents)
+
+    def add(self, document: Dict[str, Any]):
+        """문서 추가 (같은 심볼·타입의 더 오래된 문서는 교체, data는 종목명만 보관)"""
+        symbol = document.get("symbol")
+        data_type = document.get("type")
+        if not symbol or not data_type:
+            return
+        key = (symbol, data_type)
+
+        with self._lock:
+            current = self._documents.get(key)
+            if current is not None and current.get("_ts", 0) > document.get("_ts", 0):
+                return
+
+            entry = _index_entry(document)
+            if current is None:
+                self._insert_symbol(key)
+            self._replace_tokens(key, set(tokenize_name(entry["name"])))
+            self._documents[key] = entry
+
+    def remove(self, symbol: str, data_type: str):
+        """문서 제거"""
+        key = (symbol, data_type)
+        with self._lock:
+            if self._documents.pop(key, None) is None:
+                return
+            self._replace_tokens(key, set())
+            self._document_tokens.pop(key, None)
+            node = self._trie
+            node.keys.discard(key)
+            for char in symbol.upper():
+                child = node.children.get(char)
+                if child is None:
+                    break
+                child.keys.discard(key)
+                if not child.keys:
+                    del node.children[char]
+                    break
+                node = child
+
+    def remove_older_than(self, cutoff_ts: int) -> int:
+        """
+        최신 문서가 cutoff_ts 이전인 심볼·타입 제거 (스냅샷이 모두 만료된 경우)
+
+        Returns:
+            제거된 문서 수
+        """
+        with self._lock:
+            expired = [key for key, document in self._documents.items() if document.get("_ts", 0) < cutoff_ts]
+            for symbol, data_type in expired:
+                self.remove(symbol, data_type)
+        return len(expired)
+
+    def search(self, query_text: str, limit: int = 20) -> List[Dict[str, Any]]:
+        """
+        검색
+
+        심볼 prefix 일치 또는 모든 검색어 토큰이 이름 토큰의 prefix와 일치하는 문서를
+        (정확한 심볼 일치 > 심볼 prefix 일치 > 이름 일치, 최신순)으로 반환합니다.
+        """
+        symbol_query = "".join(query_text.split()).upper()
+        name_tokens = tokenize_name(query_text)
+
+        with self._lock:
+            symbol_hits = self._symbol_prefix(symbol_query) if symbol_query else set()
+            name_hits = self._name_match(name_tokens) if name_tokens else set()
+
+            def rank(key: IndexKey):
+                if key[0] == symbol_query:
+                    group = 0
+                elif key in symbol_hits:
+                    group = 1
+                else:
+                    group = 2
+                return (group, -self._documents[key].get("_ts", 0))
+
+            keys = sorted(symbol_hits | name_hits, key=rank)[:limit]
+            return [self._documents[key] for key in keys]
+
+    def _insert_symbol(self, key: IndexKey):
+        node = self._trie
+        node.keys.add(key)
+        for char in key[0].upper():
+            node = node.children.setdefault(char, _TrieNode())
+            node.keys.add(key)
+
+    def _symbol_prefix(self, prefix: str) -> Set[IndexKey]:
+        node: Optional[_TrieNode] = self._trie
+        for char in prefix:
+            node = node.children.get(char)
+            if node is None:
+                return set()
+        return set(node.keys)
+
+    def _replace_tokens(self, key: IndexKey, tokens: Set[str]):
+        previous = self._document_tokens.get(key, set())
+        for token in previous - tokens:
+            postings = self._name_postings.get(token)
+            if postings is None:
+                continue
+            postings.discard(key)
+            if not postings:
+                del self._name_postings[token]
+                index = bisect_left(self._vocabulary, token)
+                if index < len(self._vocabulary) and self._vocabulary[index] == token:
+                    self._vocabulary.pop(index)
+        for token in tokens - previous:
+            if token not in self._name_postings:
+                self._name_postings[token] = set()
+                insort(self._vocabulary, token)
+            self._name_postings[token].add(key)
+        self._document_tokens[key] = tokens
+
+    def _token_prefix(self, prefix: str) -> Set[IndexKey]:
+        matches: Set[IndexKey] = set()
+        index = bisect_left(self._vocabulary, prefix)
+        while index < len(self._vocabulary) and self._vocabulary[index].startswith(prefix):
+            matches |= self._name_postings[self._vocabulary[index]]
+            index += 1
+        return matches
+
+    def _name_match(self, tokens: List[str]) -> Set[IndexKey]:
+        result: Optional[Set[IndexKey]] = None
+        for token in tokens:
+            matches = self._token_prefix(token)
+            result = matches if result is None else result & matches
+            if not result:
+                return set()
+        return result or set()
@@ -2,8 +2,12 @@
 Yahoo Finance API 클라이언트 (yfinance)
 """
 import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
-from typing import Any, Dict, List, Optional
+from email.utils import parsedate_to_datetime
+from typing import Any, Dict, List, Optional, Tuple
 
 import pandas as pd
 import yfinance as yf
@@ -14,10 +18,42 @@ from .totalrealreturns_service import get_totalrealreturns_client
 
 logger = logging.getLogger(__name__)
 
+# 지수별 뉴스 동시 조회용
+_news_executor = ThreadPoolExecutor(max_workers=3, thread_name_prefix="yf-news")
+
+
+def parse_pub_date(pub_date: str) -> Optional[int]:
+    """
+    뉴스 발행 시각을 epoch seconds로 변환
+    
+    Yahoo pubDate는 고정 ISO 8601 형식(2025-01-15T14:30:00Z)이므로 fromisoformat으로 빠르게 처리하고,
+    RFC 822 형식(RSS)은 email.utils로 처리합니다.
+    """
+    if not pub_date:
+        return None
+    try:
+        dt = datetime.fromisoformat(pub_date)
+    except ValueError:
+        try:
+            dt = parsedate_to_datetime(pub_date)
+        except (TypeError, ValueError):
+            return None
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return int(dt.timestamp())
+
 
 class YFinanceClient:
     """Yahoo Finance API 클라이언트"""
     
+    # 시장 뉴스 대상 지수: S&P 500, Dow Jones, NASDAQ
+    MARKET_NEWS_INDICES = ["^GSPC", "^DJI", "^IXIC"]
+    MARKET_NEWS_CACHE_TTL = 300  # 지수별 뉴스 캐시 (초)
+    
+    def __init__(self):
+        self._market_news_cache: Dict[str, Tuple[float, List[Dict[str, Any]]]] = {}
+        self._market_news_lock = threading.Lock()
+    
     @trace_span(name="yfinance.get_etf_profile", attributes={"source": "yfinance"})
     def get_etf_profile(self, symbol: str) -> Dict[str, Any]:
         """ETF 프로필 조회 (yfinance 사용)"""
@@ -325,59 +361,24 @@ class YFinanceClient:
             print(f"Error fetching news for {symbol}: {e}")
             return []
     
-    def get_market_news(self, category: str = "general") -> List[Dict[str, Any]]:
-        """시장 뉴스 조회 (yfinance는 전체 시장 뉴스를 제공하지 않음)"""
+    @trace_span(name="yfinance.get_market_news", attributes={"source": "yfinance"})
+    def get_market_news(self) -> List[Dict[str, Any]]:
+        """시장 뉴스 조회 (yfinance는 전체 시장 뉴스를 제공하지 않음, 카테고리 구분 없음)"""
         # yfinance는 특정 심볼에 대한 뉴스만 제공
-        # 주요 지수의 뉴스를 가져오는 방식으로 대체
+        # 주요 지수의 뉴스를 동시에 가져오는 방식으로 대체
         try:
-            indices = ["^GSPC", "^DJI", "^IXIC"]  # S&P 500, Dow Jones, NASDAQ
-            all_news = []
+            per_index = list(_news_executor.map(self._get_index_news, self.MARKET_NEWS_INDICES))
             
-            for index in indices:
-                ticker = yf.Ticker(index)
-                news = ticker.news
-                
-                if news:
-                    for item in news[:10]:  # 각 지수에서 10개씩
-                        # 새로운 응답 구조: content 객체 안에 데이터
-                        content = item.get('content', {})
-                        
-                        # pubDate를 timestamp로 변환
-                        pub_date = content.get('pubDate', '')
-                        if pub_date:
-                            from dateutil import parser
-                            try:
-                                dt = parser.parse(pub_date)
-                                publish_time = int(dt.timestamp())
-                            except:
-                                publish_time = int(datetime.now(timezone.utc).timestamp())
-                        else:
-                            publish_time = int(datetime.now(timezone.utc).timestamp())
-                        
-                        # 썸네일 URL 추출
-                        thumbnail = content.get('thumbnail') or {}
-                        resolutions = thumbnail.get('resolutions', [])
-                        image_url = ''
-                        if resolutions:
-                            # 중간 크기 이미지 선택 (170x128)
-                            for res in resolutions:
-                                if res.get('tag') == '170x128':
-                                    image_url = res.get('url', '')
-                                    break
-                            if not image_url and resolutions:
-                                image_url = resolutions[0].get('url', '')
-                        
-                        all_news.append({
-                            "category": category,
-                            "datetime": publish_time,
-                            "headline": content.get('title', ''),
-                            "id": content.get('id', ''),
-                            "image": image_url,
-                            "related": index,
-                            "source": content.get('provider', {}).get('displayName', ''),
-                            "summary": content.get('summary', ''),
-                            "url": content.get('canonicalUrl', {}).get('url', ''),
-                        })
+            # 같은 기사가 여러 지수에 걸쳐 나오면 한 번만 포함
+            all_news = []
+            seen = set()
+            for items in per_index:
+                for item in items:
+                    key = item["id"] or item["url"]
+                    if key and key in seen:
+                        continue
+                    seen.add(key)
+                    all_news.append(item)
             
             # 시간순 정렬 (None 값 처리)
             all_news.sort(key=lambda x: x.get('datetime') or 0, reverse=True)
@@ -388,6 +389,61 @@ class YFinanceClient:
             traceback.print_exc()
             return []
     
+    def _get_index_news(self, index: str) -> List[Dict[str, Any]]:
+        """지수 하나의 뉴스 조회 (TTL 캐시)"""
+        now = time.monotonic()
+        with self._market_news_lock:
+            cached = self._market_news_cache.get(index)
+            if cached and now - cached[0] < self.MARKET_NEWS_CACHE_TTL:
+                return cached[1]
+        
+        try:
+            news = yf.Ticker(index).news
+        except Exception as e:
+            logger.warning(f"Error fetching news for {index}: {e}")
+            # 실패 시 만료된 캐시라도 반환
+            return cached[1] if cached else []
+        
+        items = [self._normalize_market_news(item, index) for item in (news or [])[:10]]  # 각 지수에서 10개씩
+        with self._market_news_lock:
+            self._market_news_cache[index] = (now, items)
+        return items
+    
+    @staticmethod
+    def _normalize_market_news(item: Dict[str, Any], index: str) -> Dict[str, Any]:
+        """yfinance 뉴스 항목을 기사 형식으로 변환"""
+        # 새로운 응답 구조: content 객체 안에 데이터
+        content = item.get('content', {})
+        
+        publish_time = parse_pub_date(content.get('pubDate', ''))
+        if publish_time is None:
+            publish_time = int(datetime.now(timezone.utc).timestamp())
+        
+        # 썸네일 URL 추출
+        thumbnail = content.get('thumbnail') or {}
+        resolutions = thumbnail.get('resolutions', [])
+        image_url = ''
+        if resolutions:
+            # 중간 크기 이미지 선택 (170x128)
+            for res in resolutions:
+                if res.get('tag') == '170x128':
+                    image_url = res.get('url', '')
+                    break
+            if not image_url and resolutions:
+                image_url = resolutions[0].get('url', '')
+        
+        return {
+            "category": "general",
+            "datetime": publish_time,
+            "headline": content.get('title', ''),
+            "id": content.get('id', ''),
+            "image": image_url,
+            "related": index,
+            "source": (content.get('provider') or {}).get('displayName', ''),
+            "summary": content.get('summary', ''),
+            "url": (content.get('canonicalUrl') or {}).get('url', ''),
+        }
+    
     def get_candles(
         self,
         symbol: str,
@@ -0,0 +1,46 @@
+"""
+벤치마크 공통 설정 (뉴스 경로, Live Metrics 수집)
+
+pytest-benchmark가 없으면 이 디렉터리의 벤치마크는 건너뜁니다.
+벤치마크는 slow 마커가 붙어 있어 기본 실행(addopts -m "not slow")에서 제외되며 -m slow로 실행합니다.
+각 벤치마크의 처리량(items/sec)과 p95 지연을 extra_info에 기록하고 실행 후 요약합니다.
+입력은 합성 피드/응답/로그입니다 (tests/fixtures/README.md) - 실제 피드 처리량과 다를 수 있습니다.
+
+    pytest tests/benchmarks -m slow --no-cov --benchmark-only
+    pytest tests/benchmarks -m slow --no-cov --benchmark-json=bench.json   # CI 비교용
+"""
+from typing import List, Tuple
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+_results: List[Tuple[str, int, float, float]] = []
+
+
+def record_throughput(benchmark, items: int):
+    """처리 항목 수로 items/sec, p95(ms) 계산 (--benchmark-disable이면 생략)"""
+    stats = getattr(benchmark, "stats", None)
+    if not stats:
+        return
+    timings = sorted(stats.stats.data)
+    if not timings:
+        return
+    median = stats.stats.median
+    p95 = timings[min(len(timings) - 1, int(len(timings) * 0.95))]
+    benchmark.extra_info.update(
+        items=items,
+        items_per_sec=round(items / median, 1) if median else None,
+        p95_ms=round(p95 * 1000, 3),
+    )
+    _results.append((benchmark.name, items, items / median if median else 0.0, p95 * 1000))
+
+
+def pytest_terminal_summary(terminalreporter):
+    if not _results:
+        return
+    terminalreporter.section("throughput")
+    terminalreporter.write_line("input: synthetic fixtures (tests/fixtures/README.md), not recorded traffic")
+    terminalreporter.write_line(f"{'benchmark':<48}{'items':>8}{'items/sec':>14}{'p95 ms':>10}")
+    for name, items, rate, p95 in _results:
+        terminalreporter.write_line(f"{name:<48}{items:>8}{rate:>14,.0f}{p95:>10.3f}")
@@ -0,0 +1,63 @@
+"""
+Live Metrics 요청 수집 처리량 벤치마크
+
+- 수집: TracingMiddleware가 호출하는 add_request_log (deque 적재)
+- 집계: 이벤트 루프 drain (초 버킷/지연 스케치/라우트 집계, 구독자 없음)
+"""
+import random
+
+import pytest
+
+from src.api.v1.live_metrics import ConnectionManager
+
+from .conftest import record_throughput
+
+pytestmark = pytest.mark.slow
+
+REQUESTS = 10_000
+ROUTES = ["/api/v1/stocks/{symbol}", "/api/v1/news/", "/api/v1/etf/list", "/api/v1/chat/", "/health"]
+
+
+@pytest.fixture(scope="module")
+def request_logs():
+    rng = random.Random(42)
+    return [
+        {
+            "timestamp": "2025-01-01T00:00:00Z",
+            "method": "GET",
+            "path": "/x",
+            "route": rng.choice(ROUTES),
+            "status_code": rng.choices([200, 404, 500], weights=[95, 3, 2])[0],
+            "duration": rng.lognormvariate(3.5, 0.8),
+        }
+        for _ in range(REQUESTS)
+    ]
+
+
+def test_ingest(benchmark, request_logs):
+    """add_request_log만 (요청 경로에서 드는 비용)"""
+    manager = ConnectionManager()
+    manager._drain_scheduled = True  # drain 예약 없이 적재 비용만 측정
+
+    def ingest():
+        manager._pending.clear()
+        for log_data in request_logs:
+            manager.add_request_log(log_data)
+
+    benchmark(ingest)
+    assert len(manager._pending) == REQUESTS
+    record_throughput(benchmark, REQUESTS)
+
+
+def test_ingest_and_drain(benchmark, request_logs):
+    """적재 + drain 집계 (초당 10k+ 요청 처리 가능 여부)"""
+    manager = ConnectionManager()
+    manager._drain_scheduled = True
+
+    def ingest_and_drain():
+        for log_data in request_logs:
+            manager.add_request_log(log_data)
+        return manager.drain()
+
+    assert benchmark(ingest_and_drain) == REQUESTS
+    record_throughput(benchmark, REQUESTS)
@@ -0,0 +1,74 @@
+"""
+Container App 로그 파서 처리량 벤치마크 (lines/sec)
+
+az containerapp logs show 형식의 합성 로그 50,000줄(benchmarks/record_container_logs.py의 synthesize)을
+한 줄씩 파싱합니다. 로컬에 녹화한 로그(tests/fixtures/container_logs.jsonl.gz, 커밋하지 않음)가 있으면 그것을 씁니다. 비교 기준으로 이전 parse_container_log 구현(줄마다 re.search + 정규식 JSON 추출)도 측정합니다.
+"""
+import gzip
+import json
+import re
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+from benchmarks.record_container_logs import synthesize
+from src.observability.container_log_parser import parse_log_line
+
+from .conftest import record_throughput
+
+pytestmark = pytest.mark.slow
+
+LOG_FILE = Path(__file__).parent.parent / "fixtures" / "container_logs.jsonl.gz"
+SYNTHETIC_LINES = 50_000
+
+
+def legacy_parse_container_log(log_line):
+    """이전 구현 (비교 기준)"""
+    pattern = r'(?P<level>\w+):\s+(?P<client>[\d\.:]+)\s+-\s+"(?P<method>\w+)\s+(?P<path>[^\s]+)\s+HTTP/[\d\.]+"\s+(?P<status>\d+)'
+    match = re.search(pattern, log_line)
+    if match:
+        return {
+            'timestamp': datetime.utcnow().isoformat(),
+            'method': match.group('method'),
+            'path': match.group('path'),
+            'status_code': int(match.group('status')),
+            'duration': 0,
+        }
+    if '{' in log_line and '}' in log_line:
+        try:
+            json_match = re.search(r'\{.*\}', log_line)
+            if json_match:
+                data = json.loads(json_match.group())
+                if 'resultCode' in data or 'status' in data:
+                    return {'status_code': data.get('resultCode', data.get('status', 200))}
+        except json.JSONDecodeError:
+            pass
+    return None
+
+
+@pytest.fixture(scope="module")
+def log_lines():
+    if not LOG_FILE.exists():
+        return synthesize(SYNTHETIC_LINES)
+    with gzip.open(LOG_FILE, "rt", encoding="utf-8") as f:
+        return f.read().splitlines()
+
+
+def test_parse_log_lines(benchmark, log_lines):
+    """프리픽스 분기 파서 (로그 시각/지연 추출 포함)"""
+    def parse_all():
+        return sum(1 for line in log_lines if parse_log_line(line) is not None)
+
+    parsed = benchmark(parse_all)
+    assert parsed > len(log_lines) // 2
+    record_throughput(benchmark, len(log_lines))
+
+
+def test_parse_log_lines_legacy(benchmark, log_lines):
+    """이전 정규식 파서"""
+    def parse_all():
+        return sum(1 for line in log_lines if legacy_parse_container_log(line) is not None)
+
+    benchmark(parse_all)
+    record_throughput(benchmark, len(log_lines))
@@ -0,0 +1,130 @@
+"""
+뉴스 경로 처리량 벤치마크 (네트워크 없이 합성 피드/응답 사용, tests/fixtures/README.md)
+
+- _parse_feed: 5개 소스 합성 피드 파싱 + 항목 정규화
+- fetch_news: 로컬 피드 서버 대상 전체 다운로드 / 조건부 재검증(304)
+- 검색: 수집 저장소 ArticleStore.search BM25 검색 (/api/v1/news/search 경로,
+  RSSNewsService.search_news의 피드 재다운로드 + 부분 문자열 필터를 대체)
+- 시장 뉴스: Yahoo 지수 뉴스 정규화 및 병합
+"""
+import asyncio
+import json
+from pathlib import Path
+
+import pytest
+
+from src.services import yfinance_service
+from src.services.news_ingestion_service import ORIGIN_RSS, ArticleStore
+from src.services.rss_news_service import RSSNewsService
+from src.services.yfinance_service import YFinanceClient
+from tests.feed_server import FEED_SOURCES, FEEDS_DIR
+
+from .conftest import record_throughput
+
+pytestmark = pytest.mark.slow
+
+FIXTURES_DIR = Path(__file__).parent.parent / "fixtures"
+SEARCH_QUERIES = ["apple", "fed rates", "nvidia ai chips", "oil opec", "record high", "$TSLA", "brk.b buyback"]
+
+
+@pytest.fixture(scope="module")
+def feed_bodies():
+    return {source: (FEEDS_DIR / f"{source}.xml").read_bytes() for source in FEED_SOURCES}
+
+
+@pytest.fixture(scope="module")
+def parsed_articles(feed_bodies):
+    service = RSSNewsService()
+    return [item for source, body in feed_bodies.items() for item in service._parse_feed(body, source)]
+
+
+@pytest.fixture(scope="module")
+def market_news_fixture():
+    return json.loads((FIXTURES_DIR / "yahoo_market_news.json").read_text())
+
+
+def test_parse_feed(benchmark, feed_bodies):
+    """피드 파싱 (첫 수집 - 정규화 캐시 없음)"""
+    def parse_all():
+        service = RSSNewsService()
+        return sum(len(service._parse_feed(body, source)) for source, body in feed_bodies.items())
+
+    items = benchmark(parse_all)
+    assert items == 20 * len(FEED_SOURCES)
+    record_throughput(benchmark, items)
+
+
+def test_parse_feed_repoll(benchmark, feed_bodies):
+    """피드 재파싱 (같은 기사 재수집 - 정규화 캐시 적중)"""
+    service = RSSNewsService()
+
+    def parse_all():
+        return sum(len(service._parse_feed(body, source)) for source, body in feed_bodies.items())
+
+    items = benchmark(parse_all)
+    record_throughput(benchmark, items)
+
+
+def test_fetch_news(benchmark, feed_server):
+    """로컬 피드 서버에서 전체 소스 다운로드 + 파싱"""
+    service = RSSNewsService()
+    service.RSS_FEEDS = feed_server.feed_urls()
+
+    def fetch():
+        service._feed_states.clear()
+        return asyncio.run(service.fetch_news(limit=1000))
+
+    news = benchmark(fetch)
+    assert {item["source"] for item in news} == set(FEED_SOURCES)
+    record_throughput(benchmark, len(news))
+
+
+def test_fetch_news_revalidate(benchmark, feed_server):
+    """캐시 만료 후 조건부 재검증 (모든 피드 304)"""
+    service = RSSNewsService()
+    service.RSS_FEEDS = feed_server.feed_urls()
+    service.FEED_CACHE_TTL = 0
+    asyncio.run(service.fetch_news(limit=1000))
+
+    news = benchmark(lambda: asyncio.run(service.fetch_news(limit=1000)))
+    record_throughput(benchmark, len(news))
+
+
+def test_search(benchmark, parsed_articles):
+    """저장소 BM25 검색 (기사 2000개)"""
+    store = ArticleStore(capacity=2000)
+    store.similarity_threshold = 1.1  # 복제 기사가 유사 헤드라인 중복으로 걸러지지 않도록
+    copies = 2000 // len(parsed_articles) + 1
+    for copy in range(copies):
+        for article in parsed_articles:
+            store.add(
+                {**article, "id": f"{article['id']}-{copy}", "headline": f"{article['headline']} #{copy}"},
+                ORIGIN_RSS
+            )
+    assert len(store) == 2000
+
+    def search_all():
+        return [store.search(query, limit=20) for query in SEARCH_QUERIES]
+
+    results = benchmark(search_all)
+    assert all(results[:2])
+    record_throughput(benchmark, len(SEARCH_QUERIES))
+
+
+def test_market_news_normalize(benchmark, market_news_fixture, monkeypatch):
+    """Yahoo 지수 뉴스 정규화 + 지수 간 중복 제거 (지수별 캐시 미사용)"""
+    class RecordedTicker:
+        def __init__(self, symbol):
+            self.news = market_news_fixture.get(symbol, [])
+
+    monkeypatch.setattr(yfinance_service.yf, "Ticker", RecordedTicker)
+    client = YFinanceClient()
+    raw_items = sum(len(items) for items in market_news_fixture.values())
+
+    def normalize():
+        client._market_news_cache.clear()
+        return client.get_market_news()
+
+    news = benchmark(normalize)
+    assert 0 < len(news) < raw_items  # 지수 간 공통 기사 제거
+    record_throughput(benchmark, raw_items)
@@ -70,3 +70,12 @@ def skip_if_no_openai():
     """OpenAI API 키가 없으면 테스트 스킵"""
     if not os.getenv("AZURE_OPENAI_ENDPOINT") and not os.getenv("OPENAI_API_KEY"):
         pytest.skip("Neither AZURE_OPENAI_ENDPOINT nor OPENAI_API_KEY is set")
+
+
+@pytest.fixture(scope="session")
+def feed_server():
+    """합성 피드(tests/fixtures/feeds)를 제공하는 로컬 피드 서버"""
+    from tests.feed_server import FeedServer
+
+    with FeedServer() as server:
+        yield server
@@ -0,0 +1,72 @@
+"""
+로컬 RSS 피드 서버 (테스트/벤치마크용 실제 피드 대체)
+
+tests/fixtures/feeds/<소스>.xml (합성 피드) 을 /feeds/<소스>.xml 로 제공하며
+ETag/If-None-Match 조건부 요청(304)을 지원합니다.
+"""
+import hashlib
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Dict
+
+FEEDS_DIR = Path(__file__).parent / "fixtures" / "feeds"
+
+# RSSNewsService.RSS_FEEDS 와 같은 소스 이름
+FEED_SOURCES = ("yahoo_finance", "marketwatch", "reuters_business", "cnbc", "investing")
+
+
+class _FeedHandler(BaseHTTPRequestHandler):
+    feeds: Dict[str, bytes] = {}
+
+    def do_GET(self):
+        name = self.path.split("?", 1)[0].rsplit("/", 1)[-1].removesuffix(".xml")
+        body = self.feeds.get(name)
+        if body is None:
+            self.send_error(404)
+            return
+
+        etag = f'"{hashlib.md5(body).hexdigest()}"'
+        if self.headers.get("If-None-Match") == etag:
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.end_headers()
+            return
+
+        self.send_response(200)
+        self.send_header("Content-Type", "application/rss+xml; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("ETag", etag)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class FeedServer:
+    """백그라운드 스레드에서 실행되는 피드 서버 (포트 자동 할당)"""
+
+    def __init__(self, feeds_dir: Path = FEEDS_DIR):
+        handler = type("FeedHandler", (_FeedHandler,), {
+            "feeds": {path.stem: path.read_bytes() for path in feeds_dir.glob("*.xml")}
+        })
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def feed_urls(self) -> Dict[str, str]:
+        """RSSNewsService.RSS_FEEDS 대체용 {소스: URL}"""
+        return {source: f"{self.base_url}/feeds/{source}.xml" for source in FEED_SOURCES}
+
+    def __enter__(self) -> "FeedServer":
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._server.shutdown()
+        self._server.server_close()
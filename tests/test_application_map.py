@@ -179,7 +179,7 @@ class ApplicationMapTester:
             ("/api/v1/etf/list?limit=5", "ETF 목록 조회", "GET", None),
             
             # 뉴스 API 테스트
-            ("/api/v1/news/market?category=general&limit=5", "시장 뉴스 조회", "GET", None),
+            ("/api/v1/news/market?limit=5", "시장 뉴스 조회", "GET", None),
             ("/api/v1/news/global?sources=all&limit=5", "글로벌 뉴스 조회", "GET", None),
             
             # 주식 API 테스트
@@ -0,0 +1,205 @@
+"""
+Live Metrics 백플레인 (워커/레플리카 간 집계 병합) 테스트
+"""
+import asyncio
+import json
+import shutil
+import tempfile
+from pathlib import Path
+
+import pytest
+
+from src.api.v1 import live_metrics
+from src.observability.backplane import UnixSocketBackplane, create_backplane
+from src.observability.traffic_window import TrafficBucket, TrafficWindow
+
+
+def test_bucket_delta_merge_matches_single_window():
+    """두 워커의 델타를 병합하면 한 곳에서 기록한 것과 같은 통계"""
+    now = 50_000.0
+    worker_a, worker_b, combined = TrafficWindow(), TrafficWindow(), TrafficWindow()
+    worker_a.track_outbound = True
+    for i in range(40):
+        for window in (worker_a, combined):
+            window.record(10.0 + i, 200, now - i % 3, route="/a")
+        for window in (worker_b, combined):
+            window.record(200.0 + i, 503, now - i % 5, route="/b")
+
+    for bucket in worker_a.take_outbound():
+        wire = json.loads(json.dumps(bucket.to_dict()))
+        assert worker_b.merge_bucket(TrafficBucket.from_dict(wire), now)
+    assert worker_a.take_outbound() == []
+
+    assert worker_b.summarize_windows(now) == combined.summarize_windows(now)
+    assert worker_b.summarize_routes(60, now) == combined.summarize_routes(60, now)
+    assert not worker_b.merge_bucket(TrafficBucket(int(now) - 5_000), now)  # 보관 범위 밖
+
+
+class _Collector:
+    def __init__(self):
+        self.messages = []
+
+    def __call__(self, message):
+        self.messages.append(message)
+
+
+async def _wait_for(predicate, timeout=3.0):
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    while not predicate():
+        if loop.time() > deadline:
+            raise AssertionError("timeout")
+        await asyncio.sleep(0.02)
+
+
+async def test_unix_socket_hub_relays_and_fails_over():
+    """허브가 워커 메시지를 중계, 허브 종료 시 남은 워커 중 하나가 허브 승계"""
+    directory = tempfile.mkdtemp(dir="/tmp")  # Unix 소켓 경로 길이 제한 때문에 짧은 경로
+    path = str(Path(directory) / "lm.sock")
+    nodes = [UnixSocketBackplane(path, reconnect_delay=0.05) for _ in range(3)]
+    inboxes = [_Collector() for _ in nodes]
+    for node, inbox in zip(nodes, inboxes):
+        await node.start(inbox)
+        await asyncio.sleep(0.05)
+
+    await _wait_for(lambda: sum(node.is_hub for node in nodes) == 1 and len(next(n for n in nodes if n.is_hub)._peers) == 2)
+    hub = next(node for node in nodes if node.is_hub)
+    workers = [node for node in nodes if node is not hub]
+
+    await workers[0].publish({"from": "w0"})
+    await hub.publish({"from": "hub"})
+    await _wait_for(lambda: len(inboxes[nodes.index(workers[1])].messages) == 2)
+    assert inboxes[nodes.index(hub)].messages == [{"from": "w0"}]
+    assert inboxes[nodes.index(workers[0])].messages == [{"from": "hub"}]
+
+    await hub.stop()
+    await _wait_for(lambda: any(node.is_hub for node in workers))
+    new_hub = next(node for node in workers if node.is_hub)
+    other = next(node for node in workers if node is not new_hub)
+    await _wait_for(lambda: len(new_hub._peers) == 1)
+    await other.publish({"from": "after"})
+    await _wait_for(lambda: {"from": "after"} in inboxes[nodes.index(new_hub)].messages)
+
+    for node in workers:
+        await node.stop()
+    shutil.rmtree(directory, ignore_errors=True)
+
+
+async def test_stale_socket_is_taken_over_by_one_hub():
+    """허브가 남긴 소켓 파일을 여러 워커가 동시에 발견해도 허브는 하나"""
+    import socket
+
+    directory = tempfile.mkdtemp(dir="/tmp")
+    path = str(Path(directory) / "lm.sock")
+    stale = socket.socket(socket.AF_UNIX)
+    stale.bind(path)
+    stale.close()  # 소켓 파일만 남음 (연결 거부)
+
+    nodes = [UnixSocketBackplane(path) for _ in range(3)]
+    results = await asyncio.gather(*(node._become_hub() for node in nodes))
+    assert sorted(results) == [False, False, True]
+
+    for node in nodes:
+        await node.stop()
+    shutil.rmtree(directory, ignore_errors=True)
+
+
+async def test_unix_socket_failover_after_hub_crash():
+    """SIGKILL된 허브의 소켓 파일이 남아도 남은 워커 중 정확히 하나가 허브가 되어 나머지를 연결"""
+    import os
+    import signal
+    import sys
+
+    directory = tempfile.mkdtemp(dir="/tmp")
+    path = str(Path(directory) / "lm.sock")
+    script = (
+        "import asyncio, sys\n"
+        "from src.observability.backplane import UnixSocketBackplane\n"
+        "async def main():\n"
+        f"    node = UnixSocketBackplane({path!r})\n"
+        "    await node.start(lambda message: None)\n"
+        "    while not node.is_hub:\n"
+        "        await asyncio.sleep(0.01)\n"
+        "    print('hub', flush=True)\n"
+        "    await asyncio.sleep(60)\n"
+        "asyncio.run(main())\n"
+    )
+    process = await asyncio.create_subprocess_exec(
+        sys.executable, "-c", script,
+        cwd=str(Path(__file__).parent.parent), stdout=asyncio.subprocess.PIPE
+    )
+    try:
+        assert (await asyncio.wait_for(process.stdout.readline(), 10)).strip() == b"hub"
+        nodes = [UnixSocketBackplane(path, reconnect_delay=0.05) for _ in range(3)]
+        inboxes = [_Collector() for _ in nodes]
+        for node, inbox in zip(nodes, inboxes):
+            await node.start(inbox)
+        await _wait_for(lambda: all(node._hub is not None for node in nodes))
+
+        os.kill(process.pid, signal.SIGKILL)
+        await process.wait()
+        assert os.path.exists(path)  # 강제 종료된 허브는 소켓 파일을 지우지 못함
+
+        await _wait_for(lambda: any(node.is_hub and len(node._peers) == 2 for node in nodes))
+        await asyncio.sleep(0.3)  # 재시도 몇 번이 지나도 허브는 하나
+        assert sum(node.is_hub for node in nodes) == 1
+        hub = next(node for node in nodes if node.is_hub)
+        sender = next(node for node in nodes if node is not hub)
+        await sender.publish({"from": "after-crash"})
+        await _wait_for(lambda: all(
+            {"from": "after-crash"} in inbox.messages
+            for node, inbox in zip(nodes, inboxes) if node is not sender
+        ))
+
+        for node in nodes:
+            await node.stop()
+    finally:
+        if process.returncode is None:
+            process.kill()
+            await process.wait()
+        shutil.rmtree(directory, ignore_errors=True)
+
+
+class _MemoryBackplane:
+    """프로세스 내 백플레인 대역 (Redis처럼 자기 메시지도 되돌아옴)"""
+
+    def __init__(self, bus):
+        self.bus = bus
+
+    async def start(self, on_message):
+        self.bus.append(on_message)
+
+    async def publish(self, message):
+        for handler in self.bus:
+            handler(json.loads(json.dumps(message)))
+
+    async def stop(self):
+        pass
+
+
+async def test_managers_share_whole_service_traffic():
+    """각 워커의 대시보드가 전체 워커의 트래픽을 보여줌"""
+    bus = []
+    workers = [live_metrics.ConnectionManager() for _ in range(3)]
+    for index, manager in enumerate(workers):
+        manager.instance_id = f"worker-{index}"
+        await manager.start_backplane(_MemoryBackplane(bus))
+
+    for index, manager in enumerate(workers):
+        for _ in range(10 * (index + 1)):
+            manager.add_request_log({"path": "/x", "route": "/x", "status_code": 200, "duration": 5})
+        manager.drain()
+    for manager in workers:
+        await manager.publish_traffic()
+
+    for manager in workers:
+        metrics = manager.calculate_metrics()
+        assert metrics.request_count == 60
+        assert metrics.routes["/x"].request_count == 60
+
+
+def test_create_backplane():
+    assert create_backplane("none") is None
+    assert isinstance(create_backplane("unix", socket_path="/tmp/x.sock"), UnixSocketBackplane)
+    with pytest.raises(ValueError):
+        create_backplane("redis")
@@ -0,0 +1,98 @@
+"""
+Container App 로그 파서 테스트
+"""
+import json
+
+from src.api.v1.live_metrics import parse_container_log
+from src.observability.container_log_parser import (
+    SOURCE_ACCESS,
+    SOURCE_APP,
+    SOURCE_JSON,
+    parse_log_line,
+    parse_timestamp,
+)
+
+ACCESS = 'INFO:     10.0.0.1:52314 - "GET /api/v1/etf/list?limit=10 HTTP/1.1" 404 Not Found'
+APP = "2025-01-01 00:00:01,250 - src.observability.middleware - INFO - ⚡ POST /api/v1/chat/ | Status: 500 | Duration: 812.5ms"
+
+
+def test_parse_timestamp_formats():
+    """az(100ns 7자리+오프셋), CRI(나노초 Z), asctime(쉼표 밀리초) 모두 UTC epoch로"""
+    base = 1_735_689_600  # 2025-01-01T00:00:00Z
+    assert parse_timestamp("2025-01-01T00:00:00.1234567+00:00") == base + 0.1234567
+    assert parse_timestamp("2025-01-01T00:00:00.5Z") == base + 0.5
+    assert parse_timestamp("2025-01-01 00:00:01,250") == base + 1.25
+    assert parse_timestamp("2025-01-01T09:00:00+09:00") == base
+    assert parse_timestamp("not a timestamp") is None
+
+
+def test_uvicorn_access_log():
+    """접근 로그는 쿼리 문자열을 뺀 경로, 시각/지연 없음"""
+    parsed = parse_log_line(ACCESS)
+    assert parsed.source == SOURCE_ACCESS
+    assert parsed.at is None
+    assert parsed.log_data["method"] == "GET"
+    assert parsed.log_data["path"] == "/api/v1/etf/list"
+    assert parsed.log_data["status_code"] == 404
+    assert parsed.log_data["duration"] == 0
+
+
+def test_middleware_log_has_time_and_duration():
+    """asctime 접두사의 ⚡ 로그에서 로그 시각과 지연"""
+    parsed = parse_log_line(APP)
+    assert parsed.source == SOURCE_APP
+    assert parsed.at == 1_735_689_601.25
+    assert parsed.log_data["timestamp"] == "2025-01-01T00:00:01.250Z"
+    assert parsed.log_data["status_code"] == 500
+    assert parsed.log_data["duration"] == 812.5
+    assert parse_log_line("2025-01-01 00:00:01,250 - src.main - INFO - 🚀 started") is None
+
+
+def test_az_envelope_and_cri_prefix():
+    """az 봉투의 TimeStamp와 CRI 접두사 시각을 사용"""
+    envelope = json.dumps({"TimeStamp": "2025-01-01T00:00:02.0000000+00:00", "Log": f"F {ACCESS}"})
+    parsed = parse_log_line(envelope)
+    assert parsed.source == SOURCE_ACCESS
+    assert parsed.at == 1_735_689_602
+
+    parsed = parse_log_line(f"2025-01-01T00:00:03.000000000Z stdout F {ACCESS}")
+    assert parsed.at == 1_735_689_603
+    assert parsed.log_data["status_code"] == 404
+
+    # 봉투 안의 asctime 시각이 더 정확 (봉투 시각은 수집 시각)
+    parsed = parse_log_line(json.dumps({"TimeStamp": "2025-01-01T00:00:05+00:00", "Log": f"F {APP}"}))
+    assert parsed.at == 1_735_689_601.25
+
+
+def test_request_json():
+    """resultCode/duration JSON (App Insights 형식 지연 문자열 포함)"""
+    line = json.dumps({
+        "timestamp": "2025-01-01T00:00:04Z",
+        "url": "https://example.com/api/v1/news/?q=fed",
+        "resultCode": "201",
+        "duration": "00:00:00.2500000",
+    })
+    parsed = parse_log_line(line)
+    assert parsed.source == SOURCE_JSON
+    assert parsed.at == 1_735_689_604
+    assert parsed.log_data["path"] == "/api/v1/news/"
+    assert parsed.log_data["status_code"] == 201
+    assert parsed.log_data["duration"] == 250
+
+
+def test_unrelated_and_malformed_lines():
+    """요청 로그가 아니거나 깨진 줄은 None"""
+    assert parse_log_line("") is None
+    assert parse_log_line("INFO:     Application startup complete.") is None
+    assert parse_log_line('{"TimeStamp": "2025-01-01T00:00:00Z", "Log": "F Connecting to stream..."}') is None
+    assert parse_log_line("{not json") is None
+    assert parse_log_line('{"message": "no status"}') is None
+    assert parse_log_line("⚡ GET /x | Status: abc | Duration: 1ms") is None
+
+
+def test_parse_container_log_compat():
+    """기존 함수는 log_data만 반환, 접두사가 붙은 접근 로그도 찾음"""
+    log_data = parse_container_log(f"replica-abc {ACCESS}")
+    assert log_data["path"] == "/api/v1/etf/list"
+    assert log_data["status_code"] == 404
+    assert parse_container_log("random text") is None
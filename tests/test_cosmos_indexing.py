@@ -0,0 +1,28 @@
+"""
+Cosmos DB 인덱싱 정책 비교 테스트
+"""
+import copy
+
+from src.services.cosmos_service import INDEXING_POLICY, indexing_policy_matches
+
+
+def test_default_policy_does_not_match():
+    """기본 정책(모든 경로 인덱싱)은 교체 대상"""
+    default_policy = {
+        "indexingMode": "consistent",
+        "automatic": True,
+        "includedPaths": [{"path": "/*"}],
+        "excludedPaths": [{"path": '/"_etag"/?'}],
+    }
+    assert not indexing_policy_matches(default_policy)
+
+
+def test_applied_policy_matches():
+    """서비스가 추가한 필드가 있어도 이미 적용된 정책이면 재적용하지 않음"""
+    current = copy.deepcopy(INDEXING_POLICY)
+    current["includedPaths"][0]["indexes"] = []
+    current["excludedPaths"].append({"path": "/other/?"})
+    assert indexing_policy_matches(current)
+
+    current["compositeIndexes"].pop()
+    assert not indexing_policy_matches(current)
@@ -0,0 +1,72 @@
+"""
+Cosmos DB ETF 목록 페이지 조회 테스트 (가짜 컨테이너)
+"""
+import pytest
+
+from src.services.cosmos_service import CosmosDBService
+from src.services.storage_backend import StorageBackend, decode_cursor, encode_cursor
+
+
+class _FakeContainer:
+    """DISTINCT 심볼 쿼리와 심볼별 최신 문서 쿼리만 흉내"""
+
+    def __init__(self, documents):
+        self.documents = documents
+        self.symbol_reads = 0
+
+    def query_items(self, query, parameters=None, **kwargs):
+        params = {p["name"]: p["value"] for p in parameters or []}
+        if "DISTINCT" in query:
+            return self._symbols(params["@after"])
+        latest = [
+            doc for doc in self.documents
+            if doc["symbol"] == params["@symbol"] and doc["type"] == params["@type"]
+        ]
+        latest.sort(key=lambda doc: doc["_ts"], reverse=True)
+        return iter(latest[:1])
+
+    def _symbols(self, after):
+        for symbol in sorted({doc["symbol"] for doc in self.documents if doc["type"] == "etf"}):
+            if symbol > after:
+                self.symbol_reads += 1
+                yield symbol
+
+
+@pytest.fixture
+def service():
+    documents = [
+        {"symbol": symbol, "type": "etf", "_ts": ts, "timestamp": str(ts), "data": {"v": ts}}
+        for symbol in ["QQQ", "SPY", "VOO", "IWM", "DIA"]
+        for ts in (1, 2, 3)
+    ] + [{"symbol": "AAPL", "type": "stock", "_ts": 9, "timestamp": "9", "data": {}}]
+    cosmos = CosmosDBService.__new__(CosmosDBService)
+    StorageBackend.__init__(cosmos)
+    cosmos.enabled = True
+    cosmos.container = _FakeContainer(documents)
+    cosmos.database_name = "db"
+    cosmos.container_name = "items"
+    return cosmos
+
+
+def test_pages_are_unique_latest_and_cursor_is_constant(service):
+    """심볼별 최신 문서만, 페이지 간 중복 없음, cursor는 마지막 심볼만 담음"""
+    pages, cursor = [], None
+    while True:
+        page, cursor = service.get_etfs_page(limit=2, cursor=cursor)
+        pages.append(page)
+        if cursor is None:
+            break
+        assert decode_cursor(cursor) == {"after": page[-1]["symbol"]}
+
+    symbols = [item["symbol"] for page in pages for item in page]
+    assert symbols == ["DIA", "IWM", "QQQ", "SPY", "VOO"]
+    assert all(item["data"] == {"v": 3} for page in pages for item in page)
+    # 페이지마다 limit + 1개 심볼만 읽음
+    assert service.container.symbol_reads == 3 + 3 + 1
+
+
+@pytest.mark.parametrize("cursor", ["not-a-cursor", encode_cursor({"s": ["SPY"]}), encode_cursor({"after": 5})])
+def test_invalid_cursor_raises(service, cursor):
+    """깨진/이전 형식 cursor는 ValueError (API에서 400)"""
+    with pytest.raises(ValueError):
+        service.get_etfs_page(limit=2, cursor=cursor)
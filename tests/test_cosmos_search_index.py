@@ -0,0 +1,89 @@
+"""
+Cosmos DB 검색 인덱스 구축 테스트 (가짜 컨테이너)
+"""
+from src.services.cosmos_service import CosmosDBService
+from src.services.storage_backend import StorageBackend
+
+
+class _FakeContainer:
+    """인덱스 쿼리 결과를 (type, _ts DESC) 순서로 반환, fail_after 건 이후 오류"""
+
+    def __init__(self, items, fail_after=None):
+        self.items = items
+        self.fail_after = fail_after
+        self.queries = []
+
+    def query_items(self, query, **kwargs):
+        self.queries.append(query)
+        for count, item in enumerate(sorted(self.items, key=lambda i: (i["type"], -i["_ts"]))):
+            if self.fail_after is not None and count >= self.fail_after:
+                raise RuntimeError("throttled")
+            yield dict(item)
+
+
+def _service(container):
+    cosmos = CosmosDBService.__new__(CosmosDBService)
+    StorageBackend.__init__(cosmos)
+    cosmos.enabled = True
+    cosmos.container = container
+    cosmos.database_name = "db"
+    cosmos.container_name = "items"
+    return cosmos
+
+
+ITEMS = [
+    {"id": "etf_SPY_1", "symbol": "SPY", "type": "etf", "timestamp": "1", "_ts": 1,
+     "name": None, "profile_name": "Old SPDR"},
+    {"id": "etf_SPY_2", "symbol": "SPY", "type": "etf", "timestamp": "2", "_ts": 2,
+     "name": None, "profile_name": "SPDR S&P 500"},
+    {"id": "stock_AAPL_3", "symbol": "AAPL", "type": "stock", "timestamp": "3", "_ts": 3,
+     "name": "Apple Inc"},
+]
+
+
+def test_index_reads_name_fields_only_and_keeps_latest():
+    """data 전체 대신 종목명만 조회, 심볼·타입별 최신 문서"""
+    container = _FakeContainer(ITEMS)
+    service = _service(container)
+
+    assert [d["id"] for d in service.search_data("spdr")] == ["etf_SPY_2"]
+    assert service.search_data("old") == []
+    assert service.search_data("apple")[0]["name"] == "Apple Inc"
+    assert "c.data " not in container.queries[0] and "ORDER BY c.type ASC, c._ts DESC" in container.queries[0]
+
+
+def test_failed_build_is_not_published():
+    """조회 중 오류가 나면 일부만 읽은 인덱스를 캐시하지 않고 다음 검색에서 다시 구축"""
+    container = _FakeContainer(ITEMS, fail_after=1)
+    service = _service(container)
+
+    assert service.search_data("apple") == []
+    assert service._search_index is None
+
+    container.fail_after = None
+    assert [d["symbol"] for d in service.search_data("apple")] == ["AAPL"]
+    assert len(container.queries) == 2
+
+
+def test_writes_during_build_are_replayed_before_publishing():
+    """인덱스 구축 중 저장/삭제된 문서도 게시된 인덱스에 반영, 구축 잠금은 인스턴스별"""
+    container = _FakeContainer(ITEMS)
+    service = _service(container)
+    other = _service(_FakeContainer([]))
+    assert service._search_index_lock is not other._search_index_lock
+
+    query_items = container.query_items
+
+    def query_with_concurrent_writes(query, **kwargs):
+        for count, item in enumerate(query_items(query, **kwargs)):
+            if count == 0:
+                # 조회 결과에 없는, 구축 중에 커밋된 쓰기
+                service._index_document({"id": "etf_QQQ_9", "symbol": "QQQ", "type": "etf",
+                                         "data": {"name": "Invesco QQQ"}, "_ts": 9})
+                service._unindex_symbol("AAPL", "stock")
+            yield item
+
+    container.query_items = query_with_concurrent_writes
+    assert [d["symbol"] for d in service.search_data("invesco")] == ["QQQ"]
+    assert service.search_data("apple") == []
+    assert service._index_updates is None
@@ -63,7 +63,7 @@ async def test_frontend_backend_connection():
     # 3. 여러 API 엔드포인트 호출
     endpoints = [
         ("/api/v1/etf/list?limit=5", "ETF 목록 조회"),
-        ("/api/v1/news/market?category=general&limit=5", "뉴스 조회"),
+        ("/api/v1/news/market?limit=5", "뉴스 조회"),
         ("/api/v1/stocks/search?q=AAPL", "주식 검색"),
     ]
     
@@ -0,0 +1,61 @@
+"""
+DDSketch 지연 분위수 스케치 테스트
+"""
+import random
+
+import pytest
+
+from src.observability.latency_sketch import DDSketch
+from src.observability.traffic_window import TrafficWindow
+
+
+def test_quantiles_within_relative_accuracy():
+    """분위수 추정값은 정확한 값 대비 1% 상대 오차 이내"""
+    rng = random.Random(7)
+    values = [rng.lognormvariate(4, 1) for _ in range(20_000)]
+    sketch = DDSketch()
+    for value in values:
+        sketch.add(value)
+
+    values.sort()
+    for q in (0.5, 0.95, 0.99):
+        exact = values[int(q * (len(values) - 1))]
+        assert sketch.quantile(q) == pytest.approx(exact, rel=0.011)
+    assert DDSketch().quantile(0.5) is None
+
+
+def test_merge_equals_single_sketch():
+    """나눠 기록한 스케치를 병합하면 한 번에 기록한 것과 같음"""
+    values = [float(v) for v in range(1, 1001)]
+    whole, left, right = DDSketch(), DDSketch(), DDSketch()
+    for value in values:
+        whole.add(value)
+    for value in values[:300]:
+        left.add(value)
+    for value in values[300:]:
+        right.add(value)
+    left.merge(right)
+
+    assert left.bins == whole.bins
+    assert left.count == whole.count and left.max == whole.max
+    assert left.percentiles() == whole.percentiles()
+
+
+def test_window_and_route_percentiles():
+    """윈도우/라우트별 p50/p95/p99, 분 캐시 경계 포함"""
+    window = TrafficWindow()
+    now = 60 * 1_000 + 30.0
+    for i in range(100):
+        # 15분 구간에 고르게 분산, 마지막 1분에는 느린 /slow 요청
+        window.record(10.0, 200, now - 880 + i * 8, route="/fast")
+    for _ in range(20):
+        window.record(500.0, 200, now - 5, route="/slow")
+
+    windows = window.summarize_windows(now)
+    assert windows["15m"]["p50"] == pytest.approx(10, rel=0.01)
+    assert windows["15m"]["p99"] == pytest.approx(500, rel=0.01)
+    assert windows["1m"]["p50"] == pytest.approx(500, rel=0.01)
+
+    routes = window.summarize_routes(60, now)
+    assert routes["/slow"]["request_count"] == 20
+    assert routes["/slow"]["p95"] == pytest.approx(500, rel=0.01)
@@ -38,7 +38,7 @@ async def test_live_metrics():
         print(f"   Symbol: {data.get('symbol')}, Price: ${data.get('price')}")
         
         print("\n5. 뉴스 조회 (성공)")
-        response = await client.get(f"{base_url}/api/v1/news/market?category=general")
+        response = await client.get(f"{base_url}/api/v1/news/market")
         print(f"   Status: {response.status_code}")
         
         print("\n6. AI 채팅 (성공)")
@@ -0,0 +1,339 @@
+"""
+Live Metrics 연결 관리자/집계 테스트
+"""
+import asyncio
+import json
+
+import pytest
+
+from src.api.v1 import live_metrics
+
+
+@pytest.fixture
+def reset_aggregation():
+    yield
+    live_metrics.aggregation_refs = 0
+    if live_metrics.aggregation_task is not None:
+        live_metrics.aggregation_task.cancel()
+        live_metrics.aggregation_task = None
+
+
+async def test_single_shared_aggregator(reset_aggregation, monkeypatch):
+    """구독자 수와 무관하게 집계 태스크는 하나, 마지막 구독자 해제 시 종료"""
+    ticks = []
+
+    async def fake_broadcast(message):
+        ticks.append(message["type"])
+
+    monkeypatch.setattr(live_metrics.manager, "broadcast", fake_broadcast)
+
+    live_metrics.acquire_aggregation()
+    first = live_metrics.aggregation_task
+    live_metrics.acquire_aggregation()
+    live_metrics.acquire_aggregation()
+    assert live_metrics.aggregation_task is first
+    assert live_metrics.aggregation_refs == 3
+
+    await asyncio.sleep(0.05)
+    assert ticks == ["traffic_update"]  # 구독자 3명이어도 틱당 브로드캐스트 1회
+
+    await live_metrics.release_aggregation()
+    await live_metrics.release_aggregation()
+    assert not first.done()
+
+    await live_metrics.release_aggregation()
+    assert first.cancelled()
+    assert live_metrics.aggregation_task is None
+
+    await live_metrics.release_aggregation()
+    assert live_metrics.aggregation_refs == 0
+
+
+class FakeWebSocket:
+    """send_text 지연을 조절할 수 있는 WebSocket 대역"""
+
+    def __init__(self, delay: float = 0.0):
+        self.delay = delay
+        self.sent = []
+        self.closed_with = None
+
+    async def accept(self):
+        pass
+
+    async def send_text(self, text):
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        self.sent.append(text)
+
+    async def close(self, code=1000):
+        self.closed_with = code
+
+
+async def test_coalesce_and_drop_policies():
+    """큐 초과 시 정책별 처리"""
+    coalesce = live_metrics.ClientConnection(FakeWebSocket(delay=10), 3, live_metrics.COALESCE, 5)
+    await asyncio.sleep(0)
+    for i in range(3):
+        coalesce.offer("traffic_update", f"t{i}")
+    assert [text for _, text in coalesce.queue] == ["t2"]
+    for i in range(3):
+        coalesce.offer("new_request", f"r{i}")
+    assert [text for _, text in coalesce.queue] == ["t2", "r1", "r2"]
+
+    drop_oldest = live_metrics.ClientConnection(FakeWebSocket(delay=10), 2, live_metrics.DROP_OLDEST, 5)
+    await asyncio.sleep(0)
+    for i in range(4):
+        drop_oldest.offer("new_request", f"r{i}")
+    assert [text for _, text in drop_oldest.queue] == ["r2", "r3"]
+    assert drop_oldest.dropped == 2
+
+    disconnect = live_metrics.ClientConnection(FakeWebSocket(delay=10), 1, live_metrics.DISCONNECT, 5)
+    await asyncio.sleep(0)
+    assert disconnect.offer("new_request", "r0")
+    assert not disconnect.offer("new_request", "r1")
+
+    for connection in (coalesce, drop_oldest, disconnect):
+        connection.close()
+
+
+async def test_route_snapshot_is_never_dropped():
+    """큐 초과 시 대기 중인 route_snapshot 대신 다른 메시지를 버리고, 새 스냅샷은 이전 스냅샷을 대체"""
+    for policy in (live_metrics.COALESCE, live_metrics.DROP_OLDEST):
+        connection = live_metrics.ClientConnection(FakeWebSocket(delay=10), 2, policy, 5)
+        await asyncio.sleep(0)
+        connection.offer(live_metrics.KEYFRAME_TYPE, "s0")
+        for i in range(3):
+            connection.offer("new_request", f"r{i}")
+            connection.offer("traffic_update", f"t{i}")
+        assert connection.queue[0] == (live_metrics.KEYFRAME_TYPE, "s0")
+        assert len(connection.queue) == 2
+
+        connection.offer(live_metrics.KEYFRAME_TYPE, "s1")
+        assert [text for queued_type, text in connection.queue if queued_type == live_metrics.KEYFRAME_TYPE] == ["s1"]
+        connection.close()
+
+    only_keyframe = live_metrics.ClientConnection(FakeWebSocket(delay=10), 1, live_metrics.DROP_OLDEST, 5)
+    await asyncio.sleep(0)
+    only_keyframe.offer(live_metrics.KEYFRAME_TYPE, "s0")
+    assert only_keyframe.offer("new_request", "r0")
+    assert list(only_keyframe.queue) == [(live_metrics.KEYFRAME_TYPE, "s0")]
+    assert only_keyframe.dropped == 1
+    only_keyframe.close()
+
+
+class FailingWebSocket(FakeWebSocket):
+    async def send_text(self, text):
+        raise ConnectionResetError("peer gone")
+
+
+async def test_send_failure_removes_connection_from_its_own_manager(monkeypatch):
+    """전송 실패 시 연결을 만든 관리자(전역 manager가 아니어도)에서 제거"""
+    monkeypatch.setattr(live_metrics.manager, "active_connections", {})
+    local = live_metrics.ConnectionManager()
+    websocket = FailingWebSocket()
+    await local.connect(websocket)
+    live_metrics.manager.active_connections[websocket] = local.active_connections[websocket]
+
+    local.send_to(websocket, {"type": "new_request", "data": {}})
+    await asyncio.sleep(0.01)
+    assert websocket not in local.active_connections
+    assert websocket in live_metrics.manager.active_connections
+
+
+async def test_coalesced_route_delta_is_replaced_by_full_snapshot(monkeypatch):
+    """대기 중인 라우트 델타를 대체하는 traffic_update는 전체 라우트 스냅샷을 담음"""
+    monkeypatch.setattr(live_metrics.settings, "live_metrics_route_keyframe_ticks", 100)
+    manager = live_metrics.ConnectionManager()
+    websocket = FakeWebSocket(delay=10)
+    await manager.connect(websocket)
+    connection = manager.active_connections[websocket]
+    await asyncio.sleep(0)
+
+    stats = {"request_count": 1, "error_count": 0, "avg_duration": 1.0,
+             "p50": None, "p95": None, "p99": None, "status_classes": {"2xx": 1}}
+    for routes in ({"GET /a": stats}, {"GET /a": stats, "GET /b": stats}, {"GET /b": stats, "GET /c": stats}):
+        manager.publish({"type": "traffic_update", "data": {"routes": manager.encode_routes(routes)}})
+
+    queued = [json.loads(text) for _, text in connection.queue]
+    assert len(queued) == 1
+    routes = queued[0]["data"]["routes"]
+    assert routes["full"] and routes["seq"] == 3
+    assert set(routes["set"]) == {"GET /b", "GET /c"}
+    manager.disconnect(websocket)
+
+
+async def test_broadcast_does_not_wait_for_slow_clients(monkeypatch):
+    """느린 클라이언트가 있어도 브로드캐스트는 즉시 반환, JSON은 한 번만 직렬화"""
+    monkeypatch.setattr(live_metrics.manager, "active_connections", {})
+    monkeypatch.setattr(live_metrics.manager, "_route_seq", 0)  # 연결 시 라우트 스냅샷 없음
+    monkeypatch.setattr(live_metrics.settings, "live_metrics_drop_policy", live_metrics.DISCONNECT)
+    monkeypatch.setattr(live_metrics.settings, "live_metrics_send_queue_size", 2)
+
+    fast = [FakeWebSocket() for _ in range(50)]
+    slow = FakeWebSocket(delay=10)
+    for websocket in fast + [slow]:
+        await live_metrics.manager.connect(websocket)
+
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+    for i in range(4):
+        await live_metrics.manager.broadcast({"type": "new_request", "data": {"i": i}})
+        await asyncio.sleep(0)  # writer들이 전송할 기회
+    assert loop.time() - started < 0.1
+
+    await asyncio.sleep(0.05)
+    assert all(len(websocket.sent) == 4 for websocket in fast)
+    assert fast[0].sent[0] is fast[1].sent[0]
+    assert slow not in live_metrics.manager.active_connections
+    assert slow.closed_with == 1013
+
+    for websocket in fast:
+        live_metrics.manager.disconnect(websocket)
+
+
+def test_calculate_metrics_uses_sliding_windows():
+    """traffic_update 최상위 값은 최근 1분, windows에 1m/5m/15m 포함"""
+    manager = live_metrics.ConnectionManager()
+    for status_code in (200, 200, 500, 404):
+        manager.record_request({"status_code": status_code, "duration": 40})
+
+    metrics = manager.calculate_metrics()
+    assert metrics.request_count == 4
+    assert metrics.error_count == 2
+    assert metrics.success_rate == 50.0
+    assert metrics.avg_duration == 40
+    assert set(metrics.windows) == {"1m", "5m", "15m"}
+    assert metrics.windows["15m"].request_count == 4
+
+
+def test_route_delta_encoding(monkeypatch):
+    """변경된 라우트만 전송, 사라진 라우트는 del, 주기적으로 전체 스냅샷"""
+    monkeypatch.setattr(live_metrics.settings, "live_metrics_route_keyframe_ticks", 3)
+    manager = live_metrics.ConnectionManager()
+    stats = {
+        "request_count": 2, "error_count": 0, "avg_duration": 12.345,
+        "p50": 10.0, "p95": 14.0, "p99": None, "status_classes": {"2xx": 2},
+    }
+
+    first = manager.encode_routes({"/a": stats, "/b": stats})
+    assert first["full"] and first["seq"] == 1
+    assert first["set"]["/a"] == [2, 0, 12.3, 10.0, 14.0, None, 2, 0, 0, 0]
+
+    second = manager.encode_routes({"/a": stats, "/c": stats})
+    assert "full" not in second
+    assert set(second["set"]) == {"/c"}
+    assert second["del"] == ["/b"]
+
+    unchanged = manager.encode_routes({"/a": stats, "/c": stats})
+    assert unchanged["set"] == {} and unchanged["del"] == []
+
+    keyframe = manager.encode_routes({"/a": stats})
+    assert keyframe["full"] and keyframe["seq"] == 4 and set(keyframe["set"]) == {"/a"}
+
+
+async def test_ingestion_schedules_one_drain_per_burst():
+    """요청마다 코루틴을 만들지 않고 burst당 drain 1회로 집계"""
+    manager = live_metrics.ConnectionManager()
+    drains = []
+    original = manager.drain
+    manager.drain = lambda: drains.append(original())
+
+    for i in range(1000):
+        manager.add_request_log({"method": "GET", "path": f"/p/{i % 5}", "status_code": 200, "duration": 3})
+    assert len(manager._pending) == 1000
+    await asyncio.sleep(0)
+
+    assert drains == [1000]
+    assert manager.traffic.summarize(60)["request_count"] == 1000
+
+
+def test_container_log_time_is_used():
+    """컨테이너 로그 시각의 초 버킷에 집계, 미래 시각은 수신 시각으로"""
+    import time
+
+    manager = live_metrics.ConnectionManager()
+    now = time.time()
+    manager.add_request_log({"path": "/a", "status_code": 200, "duration": 5}, at=now - 120)
+    manager.add_request_log({"path": "/a", "status_code": 200, "duration": 5}, at=now + 3600)
+    manager.drain()
+
+    assert manager.traffic.summarize(60, now)["request_count"] == 1
+    assert manager.traffic.summarize(300, now)["request_count"] == 2
+
+
+async def test_ingestion_from_other_threads():
+    """다른 스레드에서 들어온 로그도 유실 없이 이벤트 루프에서 집계"""
+    import threading
+
+    manager = live_metrics.ConnectionManager()
+    manager.set_event_loop(asyncio.get_running_loop())
+
+    def produce():
+        for _ in range(5000):
+            manager.add_request_log({"method": "GET", "path": "/t", "status_code": 500, "duration": 1})
+
+    threads = [threading.Thread(target=produce) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    while any(thread.is_alive() for thread in threads):
+        await asyncio.sleep(0.01)
+    await asyncio.sleep(0.01)
+
+    summary = manager.traffic.summarize(60)
+    assert summary["request_count"] == 20000
+    assert summary["error_count"] == 20000
+    assert not manager._pending
+
+
+async def test_sampled_and_batched_new_request(monkeypatch):
+    """기본 클라이언트는 개별 new_request(상한), subscribe(batch)한 클라이언트는 틱당 1개 배치"""
+    import json
+
+    monkeypatch.setattr(live_metrics.settings, "live_metrics_sample_max_per_tick", 5)
+    manager = live_metrics.ConnectionManager()
+    legacy, batched = FakeWebSocket(), FakeWebSocket()
+    await manager.connect(legacy)
+    await manager.connect(batched)
+    manager.handle_message(batched, json.dumps({"type": "subscribe", "batch": True, "max_per_tick": 3}))
+    manager.handle_message(batched, "ping")
+
+    for i in range(100):
+        manager.add_request_log({"method": "GET", "path": f"/p{i}", "status_code": 500 if i == 42 else 200, "duration": 5})
+    manager.drain()
+    manager.flush_requests()
+    await asyncio.sleep(0.01)
+
+    legacy_messages = [json.loads(text) for text in legacy.sent]
+    assert [m["type"] for m in legacy_messages] == ["new_request"] * 5
+    assert "/p42" in [m["data"]["path"] for m in legacy_messages]
+
+    batched_messages = [json.loads(text) for text in batched.sent]
+    assert [m["type"] for m in batched_messages] == ["subscribed", "new_request_batch"]
+    assert batched_messages[0]["data"]["batch"] is True
+    batch = batched_messages[1]["data"]
+    assert batch["total"] == 100 and len(batch["requests"]) == 3
+    assert "/p42" in [r["path"] for r in batch["requests"]]
+
+    for websocket in (legacy, batched):
+        manager.disconnect(websocket)
+    manager.flush_requests()
+    assert manager._samplers == {}
+
+
+async def test_invalid_subscribe_replies_error_and_keeps_policy():
+    """Infinity/문자열 불리언 subscribe는 오류 응답만 보내고 기존 정책 유지"""
+    import json
+
+    manager = live_metrics.ConnectionManager()
+    websocket = FakeWebSocket()
+    await manager.connect(websocket)
+    before = manager.active_connections[websocket].sampling
+
+    manager.handle_message(websocket, '{"type": "subscribe", "max_per_tick": Infinity}')
+    manager.handle_message(websocket, json.dumps({"type": "subscribe", "batch": "false"}))
+    await asyncio.sleep(0.01)
+
+    replies = [json.loads(text) for text in websocket.sent]
+    assert [m["type"] for m in replies] == ["error", "error"]
+    assert manager.active_connections[websocket].sampling == before
+    manager.disconnect(websocket)
@@ -0,0 +1,92 @@
+"""
+로컬 SQLite 저장소 테스트
+"""
+import pytest
+
+from src.services.local_store_service import LocalStoreService
+from src.services.storage_backend import encode_cursor
+
+
+@pytest.fixture
+def store(tmp_path):
+    """임시 파일 기반 로컬 저장소"""
+    service = LocalStoreService(path=str(tmp_path / "store.db"))
+    yield service
+    service.close()
+
+
+def test_save_and_get_latest(store):
+    """저장 후 최신 스냅샷 조회"""
+    assert store.save_stock_data("AAPL", {"name": "Apple Inc.", "quote": {"c": 1.0}})
+    assert store.save_stock_data("AAPL", {"name": "Apple Inc.", "quote": {"c": 2.0}})
+
+    latest = store.get_latest_data("AAPL", "stock")
+    assert latest is not None
+    assert latest["symbol"] == "AAPL"
+    assert latest["type"] == "stock"
+    assert latest["data"]["quote"]["c"] == 2.0
+    assert store.get_latest_data("AAPL", "etf") is None
+
+
+def test_get_all_etfs_returns_latest_per_symbol(store):
+    """심볼별 최신 ETF만 반환 (심볼순)"""
+    store.save_etf_data("SPY", {"version": 1})
+    store.save_etf_data("QQQ", {"version": 1})
+    store.save_etf_data("SPY", {"version": 2})
+    store.save_stock_data("AAPL", {"version": 1})
+
+    etfs = store.get_all_etfs(limit=10)
+    assert [etf["symbol"] for etf in etfs] == ["QQQ", "SPY"]
+    assert etfs[1]["data"]["version"] == 2
+    assert set(etfs[0].keys()) == {"symbol", "data", "timestamp"}
+    assert len(store.get_all_etfs(limit=1)) == 1
+
+
+def test_search_and_delete(store):
+    """검색 및 삭제"""
+    store.save_etf_data("SPY", {"name": "SPDR S&P 500 ETF"})
+    store.save_etf_data("QQQ", {"name": "INVESCO QQQ"})
+
+    assert [doc["symbol"] for doc in store.search_data("spy")] == ["SPY"]
+    assert [doc["symbol"] for doc in store.search_data("invesco")] == ["QQQ"]
+
+    assert store.delete_etf_data("SPY")
+    assert not store.delete_etf_data("SPY")
+    assert store.get_latest_data("SPY", "etf") is None
+
+
+def test_get_etfs_page_cursor(store):
+    """cursor로 심볼별 최신 ETF를 중복 없이 끝까지 페이지 조회"""
+    for symbol in ["SPY", "QQQ", "DIA", "SPY", "IWM", "QQQ"]:
+        store.save_etf_data(symbol, {"symbol": symbol})
+
+    symbols = []
+    cursor = None
+    while True:
+        page, cursor = store.get_etfs_page(limit=2, cursor=cursor)
+        assert len(page) <= 2
+        symbols.extend(etf["symbol"] for etf in page)
+        if cursor is None:
+            break
+
+    assert symbols == ["DIA", "IWM", "QQQ", "SPY"]
+
+    with pytest.raises(ValueError):
+        store.get_etfs_page(limit=2, cursor="not-a-cursor")
+    with pytest.raises(ValueError):
+        store.get_etfs_page(limit=2, cursor=encode_cursor({"after": 1}))
+
+
+def test_get_etfs_page_is_stable_under_new_snapshots(store):
+    """페이지 조회 중 새 스냅샷이 저장된 심볼도 건너뛰지 않음"""
+    for symbol in ["DIA", "IWM", "QQQ", "SPY"]:
+        store.save_etf_data(symbol, {"v": 1})
+
+    first, cursor = store.get_etfs_page(limit=2)
+    store.save_etf_data("QQQ", {"v": 2})
+    store.save_etf_data("DIA", {"v": 2})
+    second, cursor = store.get_etfs_page(limit=2, cursor=cursor)
+
+    assert [etf["symbol"] for etf in first + second] == ["DIA", "IWM", "QQQ", "SPY"]
+    assert second[0]["data"] == {"v": 2}
+    assert cursor is None
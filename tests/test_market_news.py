@@ -0,0 +1,53 @@
+"""
+시장 뉴스 (지수별 동시 조회/캐시/중복 제거) 테스트
+"""
+from src.services import yfinance_service
+from src.services.yfinance_service import YFinanceClient, parse_pub_date
+
+
+class FakeTicker:
+    """지수마다 공통 기사 1개 + 고유 기사 1개를 반환"""
+    calls = []
+
+    def __init__(self, symbol):
+        FakeTicker.calls.append(symbol)
+        self.news = [
+            {"content": {
+                "id": "shared",
+                "title": "Stocks rally",
+                "pubDate": "2025-01-15T14:30:00Z",
+                "canonicalUrl": {"url": "https://example.com/shared"},
+            }},
+            {"content": {
+                "id": f"only-{symbol}",
+                "title": f"{symbol} news",
+                "pubDate": "2025-01-16T14:30:00Z",
+                "canonicalUrl": {"url": f"https://example.com/{symbol}"},
+            }},
+        ]
+
+
+def test_parse_pub_date():
+    """ISO 8601 / RFC 822 / 잘못된 값"""
+    assert parse_pub_date("2025-01-15T14:30:00Z") == 1736951400
+    assert parse_pub_date("Wed, 15 Jan 2025 14:30:00 GMT") == 1736951400
+    assert parse_pub_date("2025-01-15T14:30:00") == 1736951400  # 시간대 없으면 UTC
+    assert parse_pub_date("") is None
+    assert parse_pub_date("not a date") is None
+
+
+def test_market_news_dedupes_and_caches(monkeypatch):
+    """지수 간 같은 기사는 한 번만, 두 번째 호출은 캐시 사용"""
+    FakeTicker.calls = []
+    monkeypatch.setattr(yfinance_service.yf, "Ticker", FakeTicker)
+    client = YFinanceClient()
+
+    news = client.get_market_news()
+    ids = [item["id"] for item in news]
+    assert ids.count("shared") == 1
+    assert len(ids) == 1 + len(client.MARKET_NEWS_INDICES)
+    assert news[-1]["id"] == "shared"  # 최신순 정렬
+    assert sorted(FakeTicker.calls) == sorted(client.MARKET_NEWS_INDICES)
+
+    client.get_market_news()
+    assert len(FakeTicker.calls) == len(client.MARKET_NEWS_INDICES)
@@ -0,0 +1,128 @@
+"""
+분 단위 메트릭 히스토리 링 파일 테스트
+"""
+import pytest
+
+from src.api.v1.live_metrics import ConnectionManager
+from src.observability.latency_sketch import DDSketch
+from src.observability.metrics_history import MetricsHistory
+
+BASE = 1_700_000_000 // 3600 * 3600  # 정시
+
+
+def _sketch(*values):
+    sketch = DDSketch()
+    for value in values:
+        sketch.add(value)
+    return sketch
+
+
+def test_write_query_and_downsample(tmp_path):
+    """분 레코드 기록 후 1m/5m/1h 다운샘플링, 재시작(재오픈) 후에도 유지"""
+    path = str(tmp_path / "history.bin")
+    history = MetricsHistory(path, capacity=120)
+    for i in range(10):
+        history.write(BASE + i * 60, 10, 1, 500.0, 90.0, {"2xx": 9, "5xx": 1}, _sketch(*[50.0] * 10))
+    history.close()
+
+    history = MetricsHistory(path, capacity=120)
+    minutes = history.query(BASE, BASE + 600, 1)
+    assert len(minutes) == 10
+    assert minutes[0]["request_count"] == 10 and minutes[0]["avg_duration"] == 50
+    assert minutes[0]["p50"] == pytest.approx(50, rel=0.12)
+
+    five = history.query(BASE, BASE + 600, 5)
+    assert [point["request_count"] for point in five] == [50, 50]
+    assert five[0]["status_classes"] == {"2xx": 45, "5xx": 5}
+    assert five[0]["success_rate"] == 90.0
+
+    hour = history.query(BASE - 3600, BASE + 3600, 60)
+    assert len(hour) == 1 and hour[0]["request_count"] == 100  # 기록 없는 구간은 포인트 없음
+    history.close()
+
+
+def test_ring_overwrite_and_same_minute_merge(tmp_path):
+    """capacity를 넘으면 오래된 분은 사라지고, 같은 분 재기록은 합산"""
+    history = MetricsHistory(str(tmp_path / "history.bin"), capacity=5)
+    for i in range(7):
+        history.write(BASE + i * 60, 1, 0, 10.0, 10.0, {"2xx": 1}, _sketch(10.0))
+    assert history.read(BASE) is None
+    assert history.read(BASE + 6 * 60) is not None
+
+    history.write(BASE + 6 * 60, 2, 2, 40.0, 30.0, {"5xx": 2}, _sketch(10.0, 30.0))
+    point = history.query(BASE + 6 * 60, BASE + 7 * 60)[0]
+    assert point["request_count"] == 3 and point["error_count"] == 2
+    assert point["max_duration"] == 30.0
+    history.close()
+
+
+def test_manager_rolls_up_completed_minutes(tmp_path):
+    """끝난 분만 롤업, 종료 시 진행 중인 분까지 기록"""
+    manager = ConnectionManager()
+    manager.open_history(str(tmp_path / "history.bin"), 60)
+    now = BASE + 125.0
+    manager._history_next = BASE
+    for offset in (5, 65, 70, 125):
+        manager.traffic.record(20.0, 200, BASE + offset)
+
+    assert manager.flush_history(now=now) == 2
+    assert manager.flush_history(now=now) == 0
+    assert [p["request_count"] for p in manager.history.query(BASE, BASE + 180)] == [1, 2]
+
+    assert manager.flush_history(include_current=True, now=now) == 1
+    assert manager.history.read(BASE + 120)[1] == 1
+    manager.history.close()
+
+
+def test_single_writer_lock(tmp_path):
+    """백플레인 사용 시 한 프로세스만 기록자, 닫으면 다른 쪽이 승계"""
+    path = str(tmp_path / "history.bin")
+    first, second = MetricsHistory(path, 60), MetricsHistory(path, 60)
+    assert first.acquire_writer()
+    assert first.acquire_writer()
+    assert not second.acquire_writer()
+    first.close()
+    assert second.acquire_writer()
+    second.close()
+
+
+def test_works_without_pread_and_fcntl(tmp_path, monkeypatch):
+    """Windows처럼 os.pread/os.pwrite와 fcntl이 없어도 생성/재사용"""
+    import os
+
+    from src.observability import metrics_history
+
+    monkeypatch.delattr(os, "pread", raising=False)
+    monkeypatch.delattr(os, "pwrite", raising=False)
+    monkeypatch.setattr(metrics_history, "fcntl", None)
+    path = str(tmp_path / "history.bin")
+
+    history = MetricsHistory(path, 60)
+    history.write(BASE, 3, 0, 30.0, 20.0, {"2xx": 3}, _sketch(5, 10, 15))
+    history.close()
+
+    reopened = MetricsHistory(path, 60)
+    assert reopened.read(BASE)[1] == 3  # 헤더가 유효하면 초기화하지 않음
+    reopened.close()
+
+
+def test_history_read_includes_unwritten_minutes_without_writing(tmp_path):
+    """조회는 기록된 분과 버킷 링의 미기록 분(진행 중인 분 포함)을 합치고 파일에는 쓰지 않음"""
+    manager = ConnectionManager()
+    manager.open_history(str(tmp_path / "history.bin"), 60)
+    now = BASE + 125.0
+    manager._history_next = BASE
+    for offset in (5, 65, 70, 125):
+        manager.traffic.record(20.0, 200, BASE + offset)
+    assert manager.flush_history(now=BASE + 60) == 1
+
+    pending = manager.pending_history(now)
+    assert sorted(pending) == [BASE + 60, BASE + 120]
+    points = manager.history.query(BASE, BASE + 180, pending=pending)
+    assert [p["request_count"] for p in points] == [1, 2, 1]
+    assert manager.history.read(BASE + 60) is None and manager.history.read(BASE + 120) is None
+    assert manager._history_next == BASE + 60
+
+    five = manager.history.query(BASE, BASE + 180, 5, pending=pending)
+    assert five[0]["request_count"] == 4 and five[0]["p50"] == pytest.approx(20, rel=0.12)
+    manager.history.close()
@@ -0,0 +1,124 @@
+"""
+뉴스 보강 (원문 추출/티커 태깅/감성 점수) 테스트
+"""
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx
+
+from src.services import news_enrichment_service
+from src.services.news_enrichment_service import (NewsEnrichmentService,
+                                                  enrich_article,
+                                                  extract_article_text,
+                                                  score_sentiment)
+
+ARTICLE_HTML = """
+<html><head><script>var tracking = 1;</script></head><body>
+<nav><p>Markets | Tech | Opinion and other navigation links here</p></nav>
+<article>
+  <h1>Apple beats estimates</h1>
+  <p>Apple Inc. (NASDAQ: AAPL) reported quarterly revenue that beat analyst estimates.</p>
+  <p>Shares rose 4% in after-hours trading as iPhone demand remained strong.</p>
+  <p>Short.</p>
+</article>
+<footer><p>Copyright notice and a long list of legal disclaimers follow.</p></footer>
+</body></html>
+"""
+
+
+def test_extract_article_text():
+    """<article> 문단만 추출, 스크립트/내비게이션/푸터/짧은 문단 제외"""
+    text = extract_article_text(ARTICLE_HTML)
+    assert text.startswith("Apple Inc. (NASDAQ: AAPL) reported")
+    assert "iPhone demand remained strong" in text
+    assert "tracking" not in text and "navigation" not in text and "Copyright" not in text
+    assert "Short." not in text
+    assert extract_article_text("") == ""
+
+
+def test_score_sentiment():
+    """긍정/부정/중립 및 부정어 처리"""
+    assert score_sentiment("Shares surge to a record after earnings beat")["label"] == "positive"
+    assert score_sentiment("Stocks plunge as recession fears grow")["label"] == "negative"
+    assert score_sentiment("Company schedules annual meeting")["label"] == "neutral"
+    assert score_sentiment("Results did not beat estimates")["label"] == "negative"
+
+
+def test_enrich_article():
+    """본문/티커/감성 결합"""
+    result = enrich_article(
+        "Apple beats estimates", "Revenue rose", ARTICLE_HTML, frozenset({"AAPL", "MSFT"})
+    )
+    assert result["tickers"] == ["AAPL"]
+    assert result["sentiment"]["label"] == "positive"
+    assert result["word_count"] > 10
+
+
+async def test_enrich_caches_by_article_id():
+    """배치 보강 결과를 기사 id로 캐시하고 뉴스 항목에 노출"""
+    service = NewsEnrichmentService(executor=ThreadPoolExecutor(max_workers=2))
+    service.fetch_text = False
+    articles = [
+        {"id": "a", "headline": "MSFT shares surge on record profit", "summary": ""},
+        {"id": "b", "headline": "Oil prices slump on weak demand", "summary": ""},
+    ]
+
+    assert await service.enrich(articles) == 2
+    assert await service.enrich(articles) == 0
+    assert service.get("b")["sentiment"]["label"] == "negative"
+
+    annotated = service.annotate(articles + [{"id": "c", "headline": "x"}])
+    assert annotated[0]["enrichment"]["sentiment"]["label"] == "positive"
+    assert "enrichment" not in annotated[2]
+    assert "enrichment" not in articles[0]
+    await service.stop()
+
+
+async def test_fetch_pages_stops_reading_at_byte_limit(monkeypatch):
+    """원문 HTML은 _MAX_HTML_BYTES까지만 스트리밍으로 읽음"""
+    monkeypatch.setattr(news_enrichment_service, "_MAX_HTML_BYTES", 10)
+    chunks_read = []
+
+    async def body():
+        for i in range(100):
+            chunks_read.append(i)
+            yield b"<p>abcd</p>"
+
+    def handler(request):
+        if request.url.path == "/pdf":
+            return httpx.Response(200, headers={"content-type": "application/pdf"}, content=b"%PDF")
+        return httpx.Response(200, headers={"content-type": "text/html; charset=utf-8"}, content=body())
+
+    real_client = httpx.AsyncClient
+    monkeypatch.setattr(
+        news_enrichment_service.httpx, "AsyncClient",
+        lambda **kwargs: real_client(transport=httpx.MockTransport(handler), **kwargs)
+    )
+    service = NewsEnrichmentService(executor=ThreadPoolExecutor(max_workers=1))
+
+    pages = await service._fetch_pages([{"url": "https://example.com/a"}, {"url": "https://example.com/pdf"}])
+    assert pages == ["<p>abcd</p", ""]
+    assert len(chunks_read) == 1
+    await service.stop()
+
+
+async def test_fetch_pages_isolates_bad_url_and_unknown_charset(monkeypatch):
+    """잘못된 URL, 알 수 없는 charset은 해당 기사만 빈 문자열/utf-8로 처리하고 배치는 유지"""
+    def handler(request):
+        if request.url.path == "/odd-charset":
+            return httpx.Response(200, headers={"content-type": "text/html; charset=x-unknown"}, content=b"<p>ok</p>")
+        return httpx.Response(200, headers={"content-type": "text/html"}, content=b"<p>fine</p>")
+
+    real_client = httpx.AsyncClient
+    monkeypatch.setattr(
+        news_enrichment_service.httpx, "AsyncClient",
+        lambda **kwargs: real_client(transport=httpx.MockTransport(handler), **kwargs)
+    )
+    service = NewsEnrichmentService(executor=ThreadPoolExecutor(max_workers=1))
+
+    pages = await service._fetch_pages([
+        {"url": "https://example.com/a"},
+        {"url": "https://exa\x00mple.com/b"},
+        {"url": "https://example.com/odd-charset"},
+    ])
+    assert pages == ["<p>fine</p>", "", "<p>ok</p>"]
+    await service.stop()
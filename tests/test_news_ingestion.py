@@ -0,0 +1,273 @@
+"""
+뉴스 수집 파이프라인 / 기사 저장소 테스트
+"""
+from src.services.news_ingestion_service import (ORIGIN_COMPANY, ORIGIN_MARKET,
+                                                 ORIGIN_RSS,
+                                                 ArticleStore,
+                                                 NewsIngestionService,
+                                                 article_id_for_url)
+
+
+def _article(url, headline, ts, source="cnbc"):
+    return {
+        "category": "market",
+        "datetime": ts,
+        "headline": headline,
+        "id": article_id_for_url(url),
+        "image": "",
+        "related": source,
+        "source": source,
+        "summary": "",
+        "url": url,
+    }
+
+
+def test_dedupe_by_id_and_similar_headline():
+    """같은 URL, 거의 같은 헤드라인은 한 번만 저장"""
+    store = ArticleStore()
+    assert store.add(_article("https://a.com/1", "Fed holds interest rates steady in June", 10), ORIGIN_RSS)
+    assert store.add(_article("https://a.com/1", "Different headline entirely", 11), ORIGIN_RSS) is None
+    assert store.add(
+        _article("https://b.com/9", "Fed holds interest rates steady in June.", 12, "marketwatch"),
+        ORIGIN_RSS
+    ) is None
+    assert store.add(_article("https://b.com/2", "Oil prices jump after OPEC cut", 13), ORIGIN_RSS)
+    assert len(store) == 2
+
+
+def test_evicted_article_is_not_a_dedupe_target():
+    """용량 초과로 밀려난 기사와 비슷한 헤드라인은 중복으로 버리지 않고 새로 저장"""
+    store = ArticleStore(capacity=1)
+    store.add(_article("https://a.com/1", "Fed holds interest rates steady in June", 10), ORIGIN_RSS)
+    store.add(_article("https://a.com/2", "Oil prices jump after OPEC cut", 20), ORIGIN_RSS)
+
+    stored = store.add(
+        _article("https://b.com/9", "Fed holds interest rates steady in June.", 30, "marketwatch"),
+        ORIGIN_RSS
+    )
+    assert stored is not None
+    assert [a["url"] for a in store.latest()] == ["https://b.com/9"]
+
+
+def test_latest_is_time_ordered_and_bounded():
+    """발행 시각 역순 조회, 용량 초과 시 오래된 기사 제거, 출처/소스 필터"""
+    store = ArticleStore(capacity=3)
+    store.add(_article("https://a.com/1", "alpha one story", 30), ORIGIN_RSS)
+    store.add(_article("https://a.com/2", "bravo two story", 10), ORIGIN_RSS)
+    store.add(_article("https://a.com/3", "charlie three story", 20, "yahoo"), ORIGIN_MARKET)
+    store.add(_article("https://a.com/4", "delta four story", 40), ORIGIN_RSS)
+
+    assert [a["datetime"] for a in store.latest()] == [40, 30, 20]
+    assert [a["datetime"] for a in store.latest(origins=[ORIGIN_RSS])] == [40, 30]
+    assert [a["datetime"] for a in store.latest(sources=["yahoo"])] == [20]
+    assert [a["datetime"] for a in store.latest(limit=1)] == [40]
+
+
+def test_duplicate_adds_origin_and_old_articles_are_not_stored():
+    """중복 기사는 출처만 추가, 저장소보다 오래되어 바로 밀려날 기사는 None"""
+    store = ArticleStore(capacity=2)
+    store.add(_article("https://a.com/1", "alpha one story", 30), ORIGIN_RSS)
+    assert store.add(_article("https://a.com/1", "alpha one story", 30, "yahoo"), ORIGIN_MARKET) is None
+    assert [a["datetime"] for a in store.latest(origins=[ORIGIN_MARKET])] == [30]
+    assert [a["datetime"] for a in store.latest(origins=[ORIGIN_RSS])] == [30]
+
+    store.add(_article("https://a.com/2", "bravo two story", 20), ORIGIN_RSS)
+    assert store.add(_article("https://a.com/3", "charlie three story", 10), ORIGIN_RSS) is None
+    assert [stored.article["datetime"] for stored in store.since(0)] == [30, 20]
+
+
+async def test_poll_once_merges_sources():
+    """여러 소스 결과를 병합하고 Yahoo 항목 id를 URL 해시로 정규화"""
+    service = NewsIngestionService(store=ArticleStore())
+    service.watchlist = []
+
+    async def collect_rss():
+        return ORIGIN_RSS, [_article("https://a.com/1", "Stocks rally on earnings beat", 1)]
+
+    async def collect_market():
+        item = _article("https://a.com/2", "Dow closes at record high today", 2, "Yahoo")
+        item["id"] = "yahoo-uuid"
+        return ORIGIN_MARKET, [service._normalize(item)]
+
+    service._collect_rss = collect_rss
+    service._collect_market = collect_market
+
+    assert await service.poll_once() == 2
+    assert await service.poll_once() == 0
+    market = service.store.latest(origins=[ORIGIN_MARKET])
+    assert market[0]["id"] == article_id_for_url("https://a.com/2")
+
+
+def test_search_ranking_tickers_and_dates():
+    """BM25 랭킹, 티커 토큰, 날짜 필터, 제거된 기사 비노출"""
+    store = ArticleStore(capacity=3)
+    store.add(_article("https://a.com/1", "Apple shares slip as $AAPL iPhone demand cools", 100), ORIGIN_RSS)
+    store.add(_article("https://a.com/2", "Tech earnings: Apple, Microsoft beat estimates", 200), ORIGIN_RSS)
+    store.add(_article("https://a.com/3", "Berkshire BRK.B adds to energy stakes", 300), ORIGIN_RSS)
+
+    assert [a["datetime"] for a in store.search("AAPL")] == [100]
+    assert [a["datetime"] for a in store.search("$aapl apple")][0] == 100
+    assert [a["datetime"] for a in store.search("apple microsoft")][0] == 200
+    assert [a["datetime"] for a in store.search("brk.b")] == [300]
+    assert [a["datetime"] for a in store.search("apple", start_ts=150)] == [200]
+    assert store.search("apple", origins=[ORIGIN_MARKET]) == []
+
+    store.add(_article("https://a.com/4", "Oil futures climb on supply worries", 400), ORIGIN_RSS)
+    assert [a["datetime"] for a in store.search("apple")] == [200]
+
+
+def test_search_falls_back_to_substring_match():
+    """BM25 결과가 없는 단어 일부/불용어 검색어는 부분 문자열 일치 (최신순)"""
+    store = ArticleStore(capacity=5)
+    store.add(_article("https://a.com/1", "Microsoft cloud revenue jumps", 100), ORIGIN_RSS)
+    store.add(_article("https://a.com/2", "Microchip maker raises outlook", 200), ORIGIN_RSS)
+    store.add(_article("https://a.com/3", "The state of the market", 300), ORIGIN_MARKET)
+
+    assert [a["datetime"] for a in store.search("micro")] == [200, 100]
+    assert [a["datetime"] for a in store.search("micro", limit=1)] == [200]
+    assert [a["datetime"] for a in store.search("micro", end_ts=150)] == [100]
+    assert [a["datetime"] for a in store.search("the")] == [300]
+    assert store.search("the", origins=[ORIGIN_RSS]) == []
+    assert store.search("   ") == []
+
+
+def test_symbol_index_tags_known_tickers():
+    """알려진 티커만 태깅, 새 심볼 소급 태깅, 날짜 범위, 제거된 기사 비노출"""
+    store = ArticleStore(capacity=3)
+    store.add_known_symbols(["AAPL", "F"])
+    store.add(_article("https://a.com/1", "AAPL slips while F and GM rally", 100), ORIGIN_RSS)
+    store.add(_article("https://a.com/2", "Ford (F) raises guidance; NVDA jumps", 200), ORIGIN_RSS)
+    store.add(_article("https://a.com/3", "Apple (NASDAQ: AAPL) unveils new chips", 300), ORIGIN_RSS)
+
+    assert [a["datetime"] for a in store.by_symbol("aapl")] == [300, 100]
+    assert [a["datetime"] for a in store.by_symbol("AAPL", start_ts=150)] == [300]
+    assert [a["datetime"] for a in store.by_symbol("AAPL", end_ts=150)] == [100]
+    assert [a["datetime"] for a in store.by_symbol("F")] == [200]  # 한 글자 티커는 명시된 경우만
+    assert store.by_symbol("NVDA") == []
+
+    assert store.add_known_symbols(["NVDA", "AAPL"]) == 1
+    assert [a["datetime"] for a in store.by_symbol("NVDA")] == [200]
+
+    store.add(_article("https://a.com/4", "AAPL hits record high", 400), ORIGIN_RSS)
+    assert [a["datetime"] for a in store.by_symbol("AAPL")] == [400, 300]
+    assert [a["datetime"] for a in store.by_symbol("AAPL", limit=1)] == [400]
+
+
+async def test_company_news_fetches_upstream_once_per_ttl():
+    """워치리스트 외 심볼은 TTL 동안 업스트림을 한 번만 호출"""
+    service = NewsIngestionService(store=ArticleStore())
+    service.watchlist = []
+    calls = []
+
+    async def collect_company(symbol, days=7):
+        calls.append(symbol)
+        item = _article(f"https://y.com/{len(calls)}", f"Company update {len(calls)}", 100, "Yahoo")
+        item["related"] = symbol
+        return ORIGIN_COMPANY, [item]
+
+    service._collect_company = collect_company
+
+    assert len(await service.company_news("tsla")) == 1
+    assert len(await service.company_news("TSLA")) == 1
+    assert calls == ["TSLA"]
+
+    service.symbol_fetch_ttl = 0
+    assert len(await service.company_news("TSLA")) == 2
+    assert calls == ["TSLA", "TSLA"]
+
+
+async def test_company_news_validates_and_bounds_symbols(monkeypatch):
+    """잘못된 심볼은 거부, 기사가 없는 심볼은 등록하지 않음, 조회 기록은 LRU 상한"""
+    import pytest
+
+    from src.services import news_ingestion_service
+
+    monkeypatch.setattr(news_ingestion_service, "MAX_TRACKED_SYMBOLS", 3)
+    service = NewsIngestionService(store=ArticleStore())
+    service.watchlist = []
+
+    async def collect_company(symbol, days=7):
+        if symbol != "NVDA":
+            return ORIGIN_COMPANY, []
+        item = _article("https://y.com/nvda", "Chipmaker earnings preview", 100, "Yahoo")
+        item["related"] = symbol
+        return ORIGIN_COMPANY, [item]
+
+    service._collect_company = collect_company
+
+    with pytest.raises(ValueError):
+        await service.company_news("../etc/passwd")
+    for symbol in ["ZZZA", "ZZZB", "ZZZC", "ZZZD"]:
+        assert await service.company_news(symbol) == []
+    assert len(await service.company_news("NVDA")) == 1
+
+    known = service.store.symbols.known_symbols
+    assert "NVDA" in known and not known & {"ZZZA", "ZZZB", "ZZZC", "ZZZD"}
+    assert list(service._symbol_fetched) == ["ZZZC", "ZZZD", "NVDA"]
+    assert len(service._symbol_locks) == 3
+
+
+def test_duplicate_merges_related_symbols():
+    """RSS로 먼저 저장된 기사가 종목 뉴스로 다시 오면 related 심볼을 합쳐 재태깅"""
+    store = ArticleStore()
+    store.add_known_symbols(["AMD"])
+    store.add(_article("https://a.com/1", "Chipmaker earnings preview", 100), ORIGIN_RSS)
+    assert store.by_symbol("AMD") == []
+
+    company = _article("https://a.com/1", "Chipmaker earnings preview", 100, "Yahoo")
+    company["related"] = "AMD"
+    assert store.add(company, ORIGIN_COMPANY) is None
+    assert [a["id"] for a in store.by_symbol("AMD")] == [company["id"]]
+    assert store.by_symbol("AMD")[0]["related"] == "cnbc,AMD"
+
+
+async def test_subscribers_receive_new_articles_and_resume():
+    """구독자에게 새 기사만 전달, 뒤처진 구독자는 종료 신호, seq 기준 이어받기"""
+    service = NewsIngestionService(store=ArticleStore())
+    service.ensure_started = lambda: None
+    fast = service.subscribe()
+    slow = service.subscribe(maxsize=1)
+
+    assert service._add(_article("https://a.com/1", "alpha one story", 10), ORIGIN_RSS)
+    assert not service._add(_article("https://a.com/1", "alpha one story", 10), ORIGIN_RSS)
+    assert service._add(_article("https://a.com/2", "bravo two story", 5), ORIGIN_RSS)
+
+    assert [fast.get_nowait().seq, fast.get_nowait().seq] == [1, 2]
+    assert slow.get_nowait() is None
+    assert slow not in service._subscribers
+
+    assert [stored.seq for stored in service.store.since(0)] == [1, 2]
+    assert [stored.seq for stored in service.store.since(1)] == [2]
+    service.unsubscribe(fast)
+    assert not service._subscribers
+
+
+async def test_stream_ignores_resume_id_from_restarted_process(monkeypatch):
+    """재시작 전 프로세스의 Last-Event-ID로 재연결해도 새 기사가 끊기지 않음"""
+    from src.api.v1 import news
+
+    previous = ArticleStore()
+    for i in range(5):
+        previous.add(_article(f"https://old.com/{i}", f"old story number {i}", i), ORIGIN_RSS)
+    stale_id = previous.event_id(previous.since(0)[-1])
+
+    service = NewsIngestionService(store=ArticleStore())
+    service.ensure_started = lambda: None
+    monkeypatch.setattr(news, "get_news_ingestion_service", lambda: service)
+    assert service.store.resume_seq(stale_id) is None
+    assert service.store.resume_seq("5") is None
+
+    class ConnectedRequest:
+        async def is_disconnected(self):
+            return False
+
+    response = await news.stream_news(ConnectedRequest(), sources="all", last_event_id=stale_id)
+    events = response.body_iterator
+    assert (await events.__anext__()).startswith("retry:")
+
+    service._add(_article("https://new.com/1", "fresh story after restart", 100), ORIGIN_RSS)
+    event = await events.__anext__()
+    assert event.startswith(f"id: {service.store.epoch}-1\n")
+    assert service.store.resume_seq(f"{service.store.epoch}-1") == 1
+    await events.aclose()
+    assert not service._subscribers
@@ -0,0 +1,68 @@
+"""
+new_request 샘플러 테스트
+"""
+import json
+import random
+
+import pytest
+
+from src.observability.request_sampler import RequestSampler, SamplingPolicy
+
+
+def _log(i, status_code=200, duration=10.0):
+    return {"i": i, "status_code": status_code, "duration": duration}
+
+
+def test_errors_and_slow_requests_always_included():
+    """오류/느린 요청 우선 포함, 틱당 상한 유지, 도착 순서 보존"""
+    sampler = RequestSampler(SamplingPolicy(sample_rate=0.0, max_per_tick=5, slow_ms=500), random.Random(1))
+    for i in range(100):
+        sampler.offer(_log(i))
+    sampler.offer(_log(100, status_code=503))
+    sampler.offer(_log(101, duration=900))
+
+    requests, seen = sampler.take()
+    assert [r["i"] for r in requests] == [100, 101]
+    assert seen == 102
+    assert sampler.take() == ([], 0)
+
+
+def test_reservoir_is_bounded_and_uniform():
+    """일반 요청은 틱당 max_per_tick개, 모든 요청이 고르게 뽑힘"""
+    rng = random.Random(3)
+    policy = SamplingPolicy(max_per_tick=10)
+    hits = [0] * 100
+    for _ in range(2000):
+        sampler = RequestSampler(policy, rng)
+        for i in range(100):
+            sampler.offer(_log(i))
+        requests, seen = sampler.take()
+        assert len(requests) == 10 and seen == 100
+        assert [r["i"] for r in requests] == sorted(r["i"] for r in requests)
+        for r in requests:
+            hits[r["i"]] += 1
+    # 기대값 200 (2000틱 x 10/100)
+    assert min(hits) > 120 and max(hits) < 280
+
+
+def test_policy_from_subscribe_message_is_clamped():
+    default = SamplingPolicy()
+    policy = SamplingPolicy.from_message({"sample_rate": 5, "max_per_tick": -1, "batch": True}, default)
+    assert policy == SamplingPolicy(sample_rate=1.0, max_per_tick=0, batch=True)
+    assert SamplingPolicy.from_message({}, default) == default
+
+
+def test_policy_rejects_non_finite_numbers_and_non_boolean_flags():
+    """json.loads가 받아들이는 Infinity/NaN과 "false" 문자열은 정책으로 쓰지 않고 거부"""
+    default = SamplingPolicy()
+    for message in (
+        json.loads('{"max_per_tick": Infinity}'),
+        json.loads('{"sample_rate": NaN}'),
+        {"slow_ms": "100"},
+        {"max_per_tick": True},
+        {"include_errors": "false"},
+        {"batch": 1},
+    ):
+        with pytest.raises(ValueError):
+            SamplingPolicy.from_message(message, default)
+    assert SamplingPolicy.from_message({"include_errors": False}, default).include_errors is False
@@ -0,0 +1,155 @@
+"""
+스냅샷 보존/압축 테스트
+"""
+import json
+import time
+
+import pytest
+
+from src.services.local_store_service import LocalStoreService
+from src.services.retention_service import SnapshotCompactor, summarize_snapshots
+
+
+@pytest.fixture
+def store(tmp_path):
+    """임시 파일 기반 로컬 저장소"""
+    service = LocalStoreService(path=str(tmp_path / "store.db"))
+    yield service
+    service.close()
+
+
+def _snapshot(ts, close, high=None, low=None):
+    return {
+        "_ts": ts,
+        "timestamp": str(ts),
+        "data": {
+            "profile": {"name": "SPDR", "description": "long text"},
+            "quote": {"c": close, "h": high, "l": low, "dp": 0.5},
+            "holdings": {"holdings": [{"Holder": "x"}] * 10},
+        },
+    }
+
+
+def _insert_snapshot(store, symbol, ts, close):
+    """지정한 시각(_ts)의 스냅샷 직접 저장"""
+    with store._lock:
+        store._conn.execute(
+            "INSERT INTO snapshots VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (f"etf_{symbol}_{ts}", symbol, "etf", None, str(ts), ts, json.dumps({"quote": {"c": close}}))
+        )
+        store._conn.commit()
+
+
+def test_summarize_snapshots():
+    """OHLC 롤업 및 대용량 필드 제외"""
+    summary = summarize_snapshots(
+        [_snapshot(0, 10, 11, 9), _snapshot(10, 12, 13), _snapshot(20, 8)],
+        "SPY", "etf", "hour", 0, -1
+    )
+    assert summary["type"] == "etf_summary"
+    assert summary["count"] == 3
+    assert summary["quote"] == {
+        "open": 10, "high": 13, "low": 8, "close": 8, "change_percent": 0.5
+    }
+    assert "description" not in summary["profile"]
+    assert "holdings" not in summary
+
+
+def test_compaction_is_idempotent_and_queryable(store):
+    """닫힌 구간 요약 생성, 재실행 시 동일 결과, 만료 삭제"""
+    for close in (100.0, 101.0, 99.0):
+        store.save_etf_data("SPY", {"quote": {"c": close}})
+
+    now = int(time.time())
+    store.snapshot_ttl_seconds = 7 * 86400
+    compactor = SnapshotCompactor(storage=store)
+
+    stats = compactor.compact(now_ts=now + 2 * 86400)
+    assert stats["snapshots"] == 3
+    assert stats["hour"] == 1
+    assert stats["day"] == 1
+
+    compactor.compact(now_ts=now + 2 * 86400)
+    hourly = store.get_summaries("SPY", "etf", "hour", 0, now + 3 * 86400)
+    daily = store.get_summaries("SPY", "etf", "day", 0, now + 3 * 86400)
+    assert len(hourly) == 1 and len(daily) == 1
+    assert hourly[0]["quote"]["close"] == 99.0
+
+    # 원본 스냅샷은 TTL(7일) 이후 삭제, 일 단위 요약은 유지
+    assert store.purge_expired(now + 8 * 86400) >= 3
+    assert store.get_latest_data("SPY", "etf") is None
+    assert store.get_summaries("SPY", "etf", "day", 0, now + 3 * 86400)
+
+
+def test_compaction_rolls_up_only_new_buckets(store):
+    """워터마크 이후에 닫힌 구간만 롤업, 재시작 시 저장된 요약에서 워터마크 복원"""
+    base = 1_735_689_600  # 2025-01-01T00:00:00Z
+    _insert_snapshot(store, "SPY", base + 60, 100.0)
+
+    compactor = SnapshotCompactor(storage=store)
+    assert compactor.compact(now_ts=base + 3600 + 1)["hour"] == 1
+    assert compactor.compact(now_ts=base + 3600 + 2)["snapshots"] == 0
+
+    restarted = SnapshotCompactor(storage=store)
+    stats = restarted.compact(now_ts=base + 3600 + 3)
+    assert stats["hour"] == 0 and stats["snapshots"] == 0
+
+    _insert_snapshot(store, "SPY", base + 3600 + 60, 101.0)
+    stats = restarted.compact(now_ts=base + 2 * 3600 + 1)
+    assert stats["hour"] == 1 and stats["snapshots"] == 1
+    hourly = store.get_summaries("SPY", "etf", "hour", base, base + 2 * 3600)
+    assert [s["quote"]["close"] for s in hourly] == [100.0, 101.0]
+
+
+def test_expiry_and_delete_clean_search_index_and_summaries(store):
+    """만료된 심볼은 검색 인덱스에서 제거, ETF 삭제 시 요약도 삭제"""
+    store.save_etf_data("SPY", {"profile": {"name": "SPDR S&P 500"}, "quote": {"c": 500.0}})
+    store.save_etf_data("QQQ", {"profile": {"name": "Invesco QQQ"}, "quote": {"c": 400.0}})
+    assert [d["symbol"] for d in store.search_data("QQQ")] == ["QQQ"]
+
+    now = int(time.time())
+    store.snapshot_ttl_seconds = 7 * 86400
+    SnapshotCompactor(storage=store).compact(now_ts=now + 2 * 86400)
+    assert store.delete_etf_data("SPY")
+    assert store.get_summaries("SPY", "etf", "day", 0, now + 3 * 86400) == []
+    assert store.get_summaries("QQQ", "etf", "day", 0, now + 3 * 86400)
+
+    store.purge_expired(now + 8 * 86400)
+    assert store.search_data("QQQ") == []
+
+
+def test_first_run_backfills_history_older_than_ttl(store):
+    """요약이 없으면 가장 오래된 스냅샷부터 백필한 뒤 만료 삭제"""
+    store.snapshot_ttl_seconds = 7 * 86400
+    base = 1_735_689_600  # 2025-01-01T00:00:00Z
+    _insert_snapshot(store, "SPY", base + 60, 100.0)
+    _insert_snapshot(store, "SPY", base + 20 * 86400, 101.0)
+    now = base + 30 * 86400
+
+    stats = SnapshotCompactor(storage=store).compact(now_ts=now)
+    assert stats["day"] == 2 and stats["purged"] == 2
+    daily = store.get_summaries("SPY", "etf", "day", 0, now)
+    assert [s["quote"]["close"] for s in daily] == [100.0, 101.0]
+
+
+def test_expiry_waits_until_summaries_are_written(store, monkeypatch):
+    """요약 저장이 실패하면 TTL 적용/만료 삭제를 미루고 다음 실행에서 같은 구간을 다시 요약"""
+    store.snapshot_ttl_seconds = 86400
+    base = 1_735_689_600
+    _insert_snapshot(store, "SPY", base + 60, 100.0)
+
+    failing = [True]
+    upsert_summary = store.upsert_summary
+    monkeypatch.setattr(store, "upsert_summary", lambda document: not failing[0] and upsert_summary(document))
+    enabled = []
+    monkeypatch.setattr(store, "enable_snapshot_ttl", lambda: enabled.append(True) or True)
+    compactor = SnapshotCompactor(storage=store)
+
+    stats = compactor.compact(now_ts=base + 10 * 86400)
+    assert stats["failed"] == 2 and stats["purged"] == 0 and not enabled
+    assert store.get_latest_data("SPY", "etf") is not None
+
+    failing[0] = False
+    stats = compactor.compact(now_ts=base + 10 * 86400)
+    assert stats["hour"] == 1 and stats["day"] == 1 and stats["purged"] == 1
+    assert enabled == [True]
@@ -0,0 +1,65 @@
+"""
+RSS 피드 캐시 / 조건부 GET 테스트
+"""
+from pathlib import Path
+
+import httpx
+
+from src.services.rss_news_service import RSSNewsService
+
+FEED = (Path(__file__).parent / "fixtures" / "feeds" / "sample.xml").read_bytes()
+
+
+def _service():
+    service = RSSNewsService()
+    service.RSS_FEEDS = {"sample": "https://feeds.example.com/rss"}
+    return service
+
+
+async def test_conditional_get_skips_parsing_on_304():
+    """ETag가 같으면 304 응답을 받고 파싱을 건너뜀"""
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        if request.headers.get("if-none-match") == '"v1"':
+            return httpx.Response(304)
+        return httpx.Response(200, content=FEED, headers={"ETag": '"v1"'})
+
+    service = _service()
+    service.FEED_CACHE_TTL = 0
+    parsed = []
+    original_parse = service._parse_feed
+    service._parse_feed = lambda content, source: parsed.append(source) or original_parse(content, source)
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+        first = await service._fetch_source(client, "sample")
+        second = await service._fetch_source(client, "sample")
+
+    assert len(requests) == 2
+    assert requests[1].headers["if-none-match"] == '"v1"'
+    assert len(parsed) == 1
+    assert second == first and len(first) == 2
+
+
+async def test_ttl_cache_and_stale_on_error():
+    """TTL 이내에는 요청하지 않고, 갱신 실패 시 이전 항목 유지"""
+    calls = {"count": 0}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls["count"] += 1
+        if calls["count"] > 1:
+            return httpx.Response(503)
+        return httpx.Response(200, content=FEED)
+
+    service = _service()
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+        first = await service._fetch_source(client, "sample")
+        cached = await service._fetch_source(client, "sample")
+        assert calls["count"] == 1
+
+        service.FEED_CACHE_TTL = 0
+        stale = await service._fetch_source(client, "sample")
+
+    assert calls["count"] == 2
+    assert cached == first == stale
@@ -0,0 +1,56 @@
+"""
+RSS 항목 정규화 테스트
+"""
+from pathlib import Path
+
+import feedparser
+
+from src.services.rss_entry_normalizer import EntryNormalizer, clean_text
+
+FIXTURE = Path(__file__).parent / "fixtures" / "feeds" / "sample.xml"
+
+
+def test_clean_text():
+    """태그 제거, 엔티티 복원, 공백 축약, 길이 제한"""
+    assert clean_text("<p>Fed <b>holds</b>\n\n rates</p>") == "Fed holds rates"
+    assert clean_text("AT&amp;T &lt;b&gt;beats&lt;/b&gt; &#8217;24") == "AT&T beats ’24"
+    assert clean_text("plain text") == "plain text"
+    assert clean_text("a" * 600, 500) == "a" * 500
+    assert clean_text(None) == ""
+
+
+def test_normalize_entry_and_memoize():
+    """feedparser 항목 변환, 같은 링크는 캐시 재사용 (복사본 반환)"""
+    entries = feedparser.parse(FIXTURE.read_bytes()).entries
+    normalizer = EntryNormalizer(capacity=1)
+
+    first = normalizer.normalize(entries[0], "sample")
+    assert first["url"] == entries[0].link
+    assert first["source"] == first["related"] == "sample"
+    assert first["headline"] and "<" not in first["summary"]
+    assert len(first["id"]) == 32
+
+    first["headline"] = "mutated"
+    again = normalizer.normalize(entries[0], "sample")
+    assert again["headline"] != "mutated"
+    assert len(normalizer) == 1
+
+    normalizer.normalize(entries[1], "sample")
+    assert len(normalizer) == 1  # 용량 초과 시 오래된 항목 제거
+
+
+def test_edited_entry_is_normalized_again():
+    """같은 링크라도 제목/요약/수정 시각이 바뀌면 캐시 대신 다시 변환"""
+    normalizer = EntryNormalizer()
+    entry = {"link": "https://a.com/1", "title": "Fed holds rates", "summary": "<p>first</p>",
+             "updated": "Mon, 01 Jan 2024 00:00:00 GMT"}
+    assert normalizer.normalize(entry, "cnbc")["summary"] == "first"
+
+    edited = {**entry, "title": "Fed holds rates steady", "summary": "<p>revised</p>"}
+    article = normalizer.normalize(edited, "cnbc")
+    assert (article["headline"], article["summary"]) == ("Fed holds rates steady", "revised")
+
+    updated_only = {**edited, "updated": "Mon, 01 Jan 2024 01:00:00 GMT"}
+    assert normalizer.normalize(updated_only, "cnbc")["headline"] == "Fed holds rates steady"
+    assert normalizer.normalize(edited, "cnbc")["summary"] == "revised"
+    assert len(normalizer) == 1
@@ -1,22 +1,23 @@
 #!/usr/bin/env python3
 """
 RSS 뉴스 서비스 테스트
+
+pytest에서는 로컬 피드 서버(합성 피드, tests/fixtures/README.md)를 사용하고,
+직접 실행하면 실제 RSS 피드를 조회합니다.
 """
 import asyncio
 
-from src.services.rss_news_service import get_rss_news_service
+from src.services.rss_news_service import RSSNewsService, get_rss_news_service
 
 
-def test_rss_news():
-    """RSS 뉴스 서비스 테스트"""
+async def run_rss_news(rss_service: RSSNewsService):
+    """RSS 뉴스 서비스 시나리오 실행 (결과 출력)"""
     print("=" * 60)
     print("RSS 뉴스 서비스 테스트")
     print("=" * 60)
     
-    rss_service = get_rss_news_service()
-    
     print("\n1. 모든 소스에서 뉴스 가져오기 (최대 10개)")
-    news = rss_service.fetch_news(limit=10)
+    news = await rss_service.fetch_news(limit=10)
     print(f"   총 {len(news)}개 뉴스")
     
     if news:
@@ -29,21 +30,29 @@ def test_rss_news():
             print(f"   요약: {first['summary'][:100]}...")
     
     print("\n2. Yahoo Finance 뉴스만 가져오기")
-    yahoo_news = rss_service.fetch_news(sources=["yahoo_finance"], limit=5)
+    yahoo_news = await rss_service.fetch_news(sources=["yahoo_finance"], limit=5)
     print(f"   총 {len(yahoo_news)}개 뉴스")
     for i, item in enumerate(yahoo_news[:3], 1):
         print(f"   {i}. {item['headline'][:60]}...")
     
-    print("\n3. 키워드 검색: 'stock'")
-    search_results = rss_service.search_news("stock", limit=5)
-    print(f"   총 {len(search_results)}개 검색 결과")
-    for i, item in enumerate(search_results[:3], 1):
-        print(f"   {i}. {item['headline'][:60]}...")
-    
     print("\n" + "=" * 60)
     print("✅ RSS 뉴스 테스트 완료!")
     print("=" * 60)
+    return news, yahoo_news
+
+
+async def test_rss_news(feed_server):
+    """RSS 뉴스 서비스 테스트 (로컬 피드 서버)"""
+    rss_service = RSSNewsService()
+    rss_service.RSS_FEEDS = feed_server.feed_urls()
+    
+    news, yahoo_news = await run_rss_news(rss_service)
+    
+    assert len(news) == 10
+    assert {item["source"] for item in await rss_service.fetch_news(limit=1000)} == set(rss_service.RSS_FEEDS)
+    assert len(yahoo_news) == 5
+    assert all(item["source"] == "yahoo_finance" for item in yahoo_news)
 
 
 if __name__ == "__main__":
-    test_rss_news()
+    asyncio.run(run_rss_news(get_rss_news_service()))
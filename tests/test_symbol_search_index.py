@@ -0,0 +1,46 @@
+"""
+심볼 검색 인덱스 테스트
+"""
+from src.services.symbol_search_index import SymbolSearchIndex
+
+
+def _doc(symbol, name, ts, data_type="etf"):
+    return {
+        "id": f"{data_type}_{symbol}_{ts}",
+        "symbol": symbol,
+        "type": data_type,
+        "data": {"profile": {"name": name}},
+        "_ts": ts,
+    }
+
+
+def test_symbol_prefix_and_name_tokens():
+    """심볼 prefix, 이름 토큰 prefix 검색 (대소문자 무시)"""
+    index = SymbolSearchIndex()
+    index.add(_doc("SPY", "SPDR S&P 500 ETF Trust", 1))
+    index.add(_doc("SPYG", "SPDR Portfolio S&P 500 Growth ETF", 2))
+    index.add(_doc("QQQ", "Invesco QQQ Trust", 3))
+
+    # 정확한 심볼 일치가 먼저, 나머지는 최신순
+    assert [d["symbol"] for d in index.search("spy")] == ["SPY", "SPYG"]
+    assert [d["symbol"] for d in index.search("invesco")] == ["QQQ"]
+    assert [d["symbol"] for d in index.search("spdr grow")] == ["SPYG"]
+    assert [d["symbol"] for d in index.search("trust", limit=1)] == ["QQQ"]
+    assert index.search("xyz") == []
+
+
+def test_update_keeps_latest_and_remove():
+    """최신 문서로 교체, 오래된 문서 무시, 삭제"""
+    index = SymbolSearchIndex()
+    index.add(_doc("QQQ", "Old Name", 5))
+    index.add(_doc("QQQ", "Invesco QQQ", 6))
+    index.add(_doc("QQQ", "Stale Name", 4))
+
+    assert len(index) == 1
+    assert index.search("old") == []
+    assert index.search("stale") == []
+    assert index.search("invesco")[0]["_ts"] == 6
+
+    index.remove("QQQ", "etf")
+    assert index.search("QQQ") == []
+    assert index.search("invesco") == []
@@ -0,0 +1,82 @@
+"""
+초 단위 트래픽 버킷 링 테스트
+"""
+from src.observability.traffic_window import TrafficWindow
+
+
+def test_sliding_windows():
+    """1m/5m/15m 윈도우는 해당 구간의 버킷만 합산"""
+    window = TrafficWindow()
+    now = 10_000.0
+    window.record(100, 200, now - 800)  # 15m에만 포함
+    window.record(50, 500, now - 200)    # 5m, 15m
+    window.record(10, 200, now - 30)
+    window.record(30, 200, now)
+
+    windows = window.summarize_windows(now)
+    assert windows["1m"]["request_count"] == 2
+    assert windows["1m"]["avg_duration"] == 20
+    assert windows["1m"]["error_count"] == 0
+    assert windows["5m"]["request_count"] == 3
+    assert windows["5m"]["error_count"] == 1
+    assert windows["15m"]["request_count"] == 4
+    assert windows["15m"]["max_duration"] == 100
+    assert windows["15m"]["success_rate"] == 75.0
+
+
+def test_ring_reuses_expired_buckets():
+    """한 바퀴 지난 버킷은 재사용 시 초기화, 범위 밖 데이터는 집계 제외"""
+    window = TrafficWindow(horizon_seconds=60)
+    window.record(10, 500, 1_000)
+    window.record(20, 200, 1_060)  # 같은 슬롯
+
+    assert window.summarize(60, 1_060)["request_count"] == 1
+    assert window.summarize(60, 1_060)["error_count"] == 0
+    assert window.summarize(60, 1_200)["request_count"] == 0
+    assert window.summarize(60, 1_200)["success_rate"] == 100.0
+
+
+def test_space_saving_tracks_heavy_hitters():
+    """상한을 넘는 키가 들어와도 빈발 키는 유지, 한 번 나온 키는 별도 집계 대상 아님"""
+    from src.observability.heavy_hitters import SpaceSaving
+
+    counts = SpaceSaving(3)
+    for key in ["a"] * 50 + ["b"] * 30 + ["c"] * 5 + [f"/raw/{i}" for i in range(20)]:
+        counts.offer(key)
+    top = dict(counts.top())
+    assert len(top) == 3
+    assert top["a"] == 50 and top["b"] == 30
+    assert counts.is_heavy("a")
+    assert not counts.is_heavy("/raw/19")
+
+
+def test_routes_and_status_classes_are_bounded():
+    """라우트/상태 코드 클래스별 집계, 원시 URL은 __other__로 합산"""
+    window = TrafficWindow(max_routes=4)
+    now = 5_000.0
+    for i in range(30):
+        window.record(20, 200, now, route="/api/v1/stocks/{symbol}")
+        window.record(80, 500 if i % 3 == 0 else 200, now, route="/api/v1/news/")
+    for i in range(200):
+        window.record(5, 404, now, route=f"/raw/{i}")
+
+    summary = window.summarize(60, now)
+    assert summary["status_classes"] == {"2xx": 50, "5xx": 10, "4xx": 200}
+
+    routes = window.summarize_routes(60, now)
+    assert len(routes) <= 4
+    assert routes["/api/v1/stocks/{symbol}"]["request_count"] == 30
+    assert routes["/api/v1/news/"]["status_classes"] == {"5xx": 10, "2xx": 20}
+    assert routes["__other__"]["request_count"] >= 190
+    assert sum(route["request_count"] for route in routes.values()) == 260
+
+
+def test_late_record_outside_horizon_is_dropped():
+    """늦게 도착한 로그가 더 최근 초의 버킷을 덮어쓰지 않음"""
+    window = TrafficWindow(horizon_seconds=60)
+    window.record(20, 200, 1_060)
+    window.record(10, 500, 1_000)  # 같은 슬롯, 한 바퀴 전
+
+    summary = window.summarize(60, 1_060)
+    assert summary["request_count"] == 1
+    assert summary["error_count"] == 0